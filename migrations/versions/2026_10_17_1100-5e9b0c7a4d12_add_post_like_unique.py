@@ -0,0 +1,38 @@
+"""add post like unique constraint
+
+Revision ID: 5e9b0c7a4d12
+Revises: 3c1f8a2d7e41
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5e9b0c7a4d12'
+down_revision: Union[str, None] = '3c1f8a2d7e41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 중복 좋아요 정리 후 게시글 좋아요 수를 실제 좋아요 수로 맞춤
+    op.execute(
+        """
+        DELETE FROM post_likes a
+        USING post_likes b
+        WHERE a.user_id = b.user_id AND a.post_id = b.post_id AND a.id > b.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE posts SET like_count = (SELECT count(*) FROM post_likes WHERE post_likes.post_id = posts.id)
+        """
+    )
+    op.create_unique_constraint('uq_post_likes_user_post', 'post_likes', ['user_id', 'post_id'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_post_likes_user_post', 'post_likes', type_='unique')
@@ -0,0 +1,75 @@
+"""add hot query indexes
+
+Revision ID: 8a4f2e6b1c93
+Revises: 5e9b0c7a4d12
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '8a4f2e6b1c93'
+down_revision: Union[str, None] = '5e9b0c7a4d12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (인덱스 이름, 테이블, 컬럼, unique)
+INDEXES = [
+    ('ix_posts_external_id', 'posts', ['external_id'], True),
+    ('ix_posts_created_at_id', 'posts', ['created_at', 'id'], False),
+    ('ix_posts_author_id_created_at', 'posts', ['author_id', 'created_at'], False),
+    ('ix_post_images_post_id_id', 'post_images', ['post_id', 'id'], False),
+    ('ix_comments_post_id', 'comments', ['post_id'], False),
+    ('ix_comment_tags_comment_id', 'comment_tags', ['comment_id'], False),
+    ('ix_participants_room_id', 'participants', ['room_id'], False),
+    ('ix_participants_student_id', 'participants', ['student_id'], False),
+    ('ix_participants_teacher_id', 'participants', ['teacher_id'], False),
+    ('ix_study_groups_student_id', 'study_groups', ['student_id'], False),
+    ('ix_study_groups_teacher_id', 'study_groups', ['teacher_id'], False),
+    ('ix_tags_user_id', 'tags', ['user_id'], False),
+    ('ix_students_user_id', 'students', ['user_id'], False),
+    ('ix_teachers_user_id', 'teachers', ['user_id'], False),
+]
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    # 게시글은 댓글/이미지/좋아요가 참조하므로 중복 external_id를 자동으로 지우지 않고,
+    # 유니크 인덱스 생성이 중간에 실패해 INVALID 인덱스가 남기 전에 중단
+    duplicates = conn.execute(
+        sa.text("SELECT external_id, count(*) FROM posts GROUP BY external_id HAVING count(*) > 1 ORDER BY external_id LIMIT 20")
+    ).all()
+    if duplicates:
+        summary = ", ".join(f"{external_id}({count})" for external_id, count in duplicates)
+        raise RuntimeError(f"posts.external_id 중복을 정리한 뒤 다시 실행하세요: {summary}")
+
+    # 이전에 실패한 CONCURRENTLY 생성이 남긴 INVALID 인덱스는 IF NOT EXISTS에 걸려 다시 만들어지지 않으므로 먼저 삭제
+    tables = {name: table for name, table, _, _ in INDEXES}
+    invalid = (
+        conn.execute(
+            sa.text(
+                "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+                "WHERE NOT i.indisvalid AND c.relname = ANY(:names)"
+            ),
+            {"names": list(tables)},
+        )
+        .scalars()
+        .all()
+    )
+
+    # 운영 중인 테이블의 쓰기를 막지 않도록 CONCURRENTLY로 생성 (트랜잭션 밖에서 실행)
+    # post_likes(user_id, post_id)는 uq_post_likes_user_post 유니크 제약의 인덱스를 사용
+    with op.get_context().autocommit_block():
+        for name in invalid:
+            op.drop_index(name, table_name=tables[name], postgresql_concurrently=True, if_exists=True)
+        for name, table, columns, unique in INDEXES:
+            op.create_index(name, table, columns, unique=unique, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
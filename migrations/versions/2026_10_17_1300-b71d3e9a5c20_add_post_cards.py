@@ -0,0 +1,93 @@
+"""add post cards
+
+Revision ID: b71d3e9a5c20
+Revises: 8a4f2e6b1c93
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b71d3e9a5c20'
+down_revision: Union[str, None] = '8a4f2e6b1c93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('post_cards',
+    sa.Column('post_id', sa.BigInteger(), nullable=False),
+    sa.Column('external_id', sa.String(length=26), nullable=False),
+    sa.Column('author_id', sa.BigInteger(), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('like_count', sa.Integer(), nullable=False),
+    sa.Column('comment_count', sa.Integer(), nullable=False),
+    sa.Column('is_with_teacher', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('nickname', sa.String(length=12), nullable=True),
+    sa.Column('profile_image', sa.String(length=255), nullable=True),
+    sa.Column('career_aspiration', sa.String(length=30), nullable=True),
+    sa.Column('interest', sa.String(length=30), nullable=True),
+    sa.Column('image1', sa.String(length=255), nullable=True),
+    sa.Column('image2', sa.String(length=255), nullable=True),
+    sa.Column('image3', sa.String(length=255), nullable=True),
+    sa.Column('teacher_user_id', sa.BigInteger(), nullable=True),
+    sa.Column('teacher_nickname', sa.String(length=12), nullable=True),
+    sa.Column('teacher_profile_image', sa.String(length=255), nullable=True),
+    sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('post_id'),
+    sa.UniqueConstraint('external_id')
+    )
+    op.create_index('ix_post_cards_created_at_post_id', 'post_cards', ['created_at', 'post_id'], unique=False)
+    op.create_index('ix_post_cards_author_id_created_at_post_id', 'post_cards', ['author_id', 'created_at', 'post_id'], unique=False)
+
+    # 기존 게시글의 카드 채우기 (PostRepository.refresh_post_cards와 같은 규칙)
+    op.execute(
+        """
+        INSERT INTO post_cards (
+            post_id, external_id, author_id, content, like_count, comment_count, is_with_teacher, created_at,
+            nickname, profile_image, career_aspiration, interest, image1, image2, image3,
+            teacher_user_id, teacher_nickname, teacher_profile_image
+        )
+        SELECT p.id, p.external_id, p.author_id, p.content, p.like_count, p.comment_count, p.is_with_teacher, p.created_at,
+               t.nickname, u.profile_image, s.career_aspiration, s.interest, i.image1, i.image2, i.image3,
+               teacher.user_id, teacher.nickname, teacher.profile_image
+        FROM posts p
+        JOIN users u ON u.id = p.author_id
+        JOIN students s ON s.user_id = u.id
+        JOIN tags t ON t.user_id = u.id
+        LEFT JOIN (
+            SELECT post_id,
+                   max(CASE WHEN position = 1 THEN path END) AS image1,
+                   max(CASE WHEN position = 2 THEN path END) AS image2,
+                   max(CASE WHEN position = 3 THEN path END) AS image3
+            FROM (
+                SELECT pi.post_id, coalesce(im.thumbnail_path, im.image_path) AS path,
+                       row_number() OVER (PARTITION BY pi.post_id ORDER BY pi.id) AS position
+                FROM post_images pi
+                JOIN images im ON im.id = pi.image_id
+            ) ranked
+            WHERE position <= 3
+            GROUP BY post_id
+        ) i ON i.post_id = p.id
+        LEFT JOIN LATERAL (
+            SELECT tu.id AS user_id, tt.nickname, tu.profile_image
+            FROM study_groups sg
+            JOIN teachers te ON te.id = sg.teacher_id
+            JOIN users tu ON tu.id = te.user_id
+            LEFT JOIN tags tt ON tt.user_id = tu.id
+            WHERE sg.student_id = s.id
+            ORDER BY sg.id
+            LIMIT 1
+        ) teacher ON p.is_with_teacher
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_post_cards_author_id_created_at_post_id', table_name='post_cards')
+    op.drop_index('ix_post_cards_created_at_post_id', table_name='post_cards')
+    op.drop_table('post_cards')
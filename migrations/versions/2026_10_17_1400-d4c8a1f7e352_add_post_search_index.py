@@ -0,0 +1,36 @@
+"""add post search index
+
+Revision ID: d4c8a1f7e352
+Revises: b71d3e9a5c20
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4c8a1f7e352'
+down_revision: Union[str, None] = 'b71d3e9a5c20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 한글 trigram 추출은 데이터베이스 로캘이 UTF-8이어야 함 (C 로캘이면 한글이 단어 문자로 인식되지 않음)
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_post_cards_content_trgm',
+            'post_cards',
+            ['content'],
+            postgresql_using='gin',
+            postgresql_ops={'content': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_post_cards_content_trgm', table_name='post_cards', postgresql_concurrently=True, if_exists=True)
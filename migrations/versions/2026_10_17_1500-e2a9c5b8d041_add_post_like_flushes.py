@@ -0,0 +1,29 @@
+"""add post like flushes
+
+Revision ID: e2a9c5b8d041
+Revises: d4c8a1f7e352
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a9c5b8d041'
+down_revision: Union[str, None] = 'd4c8a1f7e352'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('post_like_flushes',
+    sa.Column('batch_id', sa.String(length=36), nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('batch_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('post_like_flushes')
@@ -0,0 +1,46 @@
+import logging
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config.database.postgresql import RequestSession, request_session
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class DBSessionMiddleware:
+    """
+    HTTP 요청마다 하나의 DB 세션/트랜잭션을 열어 리포지토리들이 공유하게 합니다.
+
+    응답을 보내기 직전에 commit(5xx 응답이나 예외면 rollback)하므로,
+    commit이 실패하면 클라이언트는 성공 응답 대신 500을 받습니다.
+    웹소켓은 연결이 길게 유지되므로 대상에서 제외합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        session_scope = RequestSession()
+        token = request_session.set(session_scope)
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start" and not session_scope.closed:
+                await session_scope.close(commit=message["status"] < 500)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            if not session_scope.closed:
+                await session_scope.close(commit=False)
+            raise
+        finally:
+            request_session.reset(token)
+            if not session_scope.closed:
+                # 응답 없이 끝난 경우 (클라이언트 연결 끊김 등)
+                await session_scope.close(commit=False)
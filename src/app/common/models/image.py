@@ -9,3 +9,5 @@ class Image(Base):
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True, nullable=False)
     image_path: Mapped[str] = mapped_column(String(255), nullable=False)
+    thumbnail_path: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    webp_path: Mapped[str | None] = mapped_column(String(255), nullable=True)
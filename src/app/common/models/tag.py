@@ -9,7 +9,7 @@ class Tag(Base):
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     nickname: Mapped[str] = mapped_column(String(12), unique=True, nullable=False)
-    user_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("users.id", ondelete="CASCADE"))
+    user_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("users.id", ondelete="CASCADE"), index=True)
 
     # one-to-one 관계
     user = relationship("User", back_populates="tag", uselist=False)
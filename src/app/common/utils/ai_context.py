@@ -0,0 +1,221 @@
+import asyncio
+import json
+import logging
+import os
+
+from openai import AsyncOpenAI
+
+from src.config.database.mongo import MongoDB
+from src.config.database.redis import get_redis_cache
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 방별 대화 컨텍스트 설정
+CONTEXT_TOKEN_BUDGET = int(os.getenv("AI_CONTEXT_TOKEN_BUDGET", "3000"))
+CONTEXT_WARM_MESSAGES = int(os.getenv("AI_CONTEXT_WARM_MESSAGES", "40"))
+CONTEXT_TTL = int(os.getenv("AI_CONTEXT_TTL", str(24 * 3600)))  # 1일
+SUMMARY_MODEL = os.getenv("AI_SUMMARY_MODEL", "gpt-4o-mini")
+
+ROLE_BY_USER_TYPE = {"student": "user", "ai": "assistant"}
+
+# 턴 추가와 예산 초과분 제거를 원자적으로 처리 (동시에 끝난 답변끼리 서로의 턴을 지우지 않도록)
+# 제거된 오래된 턴은 요약 대기 리스트로 옮겨, 요약이 진행 중이어도 버려지지 않게 함
+# KEYS[1]: 컨텍스트 리스트, KEYS[2]: 요약 대기 리스트, ARGV[1]: 토큰 예산, ARGV[2]: TTL, ARGV[3..]: 추가할 턴
+# 반환: 예산을 넘어 요약 대기로 옮긴 턴 수 (estimate_tokens와 같은 근사치 사용)
+APPEND_TURNS_SCRIPT = """
+redis.call("rpush", KEYS[1], unpack(ARGV, 3))
+redis.call("expire", KEYS[1], ARGV[2])
+local turns = redis.call("lrange", KEYS[1], 0, -1)
+local budget = tonumber(ARGV[1])
+local total = 0
+local keep_from = #turns + 1
+for i = #turns, 1, -1 do
+    total = total + math.floor(string.len(cjson.decode(turns[i])["content"]) / 3) + 1
+    if total > budget then
+        break
+    end
+    keep_from = i
+end
+if keep_from > 1 then
+    redis.call("ltrim", KEYS[1], keep_from - 1, -1)
+    redis.call("rpush", KEYS[2], unpack(turns, 1, keep_from - 1))
+    redis.call("expire", KEYS[2], ARGV[2])
+end
+return keep_from - 1
+"""
+
+
+def get_context_key(room_id: int) -> str:
+    return f"ai_context:{room_id}"
+
+
+def get_summary_key(room_id: int) -> str:
+    return f"ai_context:{room_id}:summary"
+
+
+def get_pending_key(room_id: int) -> str:
+    return f"ai_context:{room_id}:pending"
+
+
+def estimate_tokens(text: str) -> int:
+    """토크나이저 없이 쓰는 근사치입니다. (영문 약 1/3, 한글 약 1 토큰/글자)"""
+    return len(text.encode("utf-8")) // 3 + 1
+
+
+def merge_turns(turns: list[dict]) -> list[dict]:
+    """같은 역할이 연속된 턴을 하나로 합칩니다. (예전 50자 단위로 저장된 AI 답변 복원)"""
+    merged: list[dict] = []
+    for turn in turns:
+        if merged and merged[-1]["role"] == turn["role"]:
+            merged[-1]["content"] += turn["content"]
+        else:
+            merged.append(dict(turn))
+    return merged
+
+
+class AIContextCache:
+    """
+    AI 답변에 사용할 방별 대화 컨텍스트를 Redis에 유지합니다.
+
+    대화가 진행될 때마다 턴을 이어 붙이고, 토큰 예산을 넘는 오래된 턴은 요약으로 접습니다.
+    Mongo 히스토리는 캐시가 없을 때만 읽습니다.
+    """
+
+    def __init__(self, client: AsyncOpenAI, mongo: MongoDB):
+        self._redis = get_redis_cache()
+        self._client = client
+        self._mongo = mongo
+        self._summarizing: set[int] = set()
+        # 백그라운드 요약 태스크가 실행 중에 GC되지 않도록 참조 유지
+        self._tasks: set[asyncio.Task] = set()
+
+    async def _warm(self, room_id: int, current_content: str) -> list[dict]:
+        # 순환 import 방지 (room_repository -> websocket_manager -> ai_context)
+        from src.app.v1.chat.repository.room_repository import RoomRepository
+
+        engine = await self._mongo.get_engine()
+        messages = await RoomRepository.find_messages_by_room(room_id, engine, page=1, page_size=CONTEXT_WARM_MESSAGES)
+
+        turns = [
+            {"role": ROLE_BY_USER_TYPE[msg.user_type], "content": msg.content}
+            for msg in reversed(messages)
+            if msg.user_type in ROLE_BY_USER_TYPE and msg.message_type == "text"
+        ]
+        turns = merge_turns(turns)
+
+        # 방금 보낸 학생 메시지가 이미 저장되어 있으면 중복되지 않도록 제외
+        if turns and turns[-1]["role"] == "user" and turns[-1]["content"] == current_content:
+            turns.pop()
+
+        turns = self._fit_budget(turns)
+        if turns:
+            key = get_context_key(room_id)
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.delete(key)
+                pipe.rpush(key, *[json.dumps(turn, ensure_ascii=False) for turn in turns])
+                pipe.expire(key, CONTEXT_TTL)
+                await pipe.execute()
+        return turns
+
+    @staticmethod
+    def _fit_budget(turns: list[dict]) -> list[dict]:
+        """최근 턴부터 토큰 예산 안에 들어가는 만큼만 남깁니다."""
+        total = 0
+        kept: list[dict] = []
+        for turn in reversed(turns):
+            total += estimate_tokens(turn["content"])
+            if total > CONTEXT_TOKEN_BUDGET:
+                break
+            kept.append(turn)
+        return list(reversed(kept))
+
+    async def build_messages(self, room_id: int, content: str) -> list[dict]:
+        """OpenAI에 보낼 messages를 구성합니다. (요약 + 최근 턴 + 현재 질문)"""
+        history: list[dict] = []
+        summary = None
+        try:
+            key = get_context_key(room_id)
+            raw_turns, summary = await asyncio.gather(self._redis.lrange(key, 0, -1), self._redis.get(get_summary_key(room_id)))
+            if raw_turns:
+                history = [json.loads(raw) for raw in raw_turns]
+                await self._redis.expire(key, CONTEXT_TTL)
+            else:
+                history = await self._warm(room_id, content)
+        except Exception as e:
+            # 컨텍스트 조회 실패 시에도 현재 질문만으로 답변은 생성
+            logger.error(f"Failed to load AI context for room {room_id}: {e}")
+
+        messages: list[dict] = []
+        if summary:
+            messages.append({"role": "system", "content": f"이전 대화 요약: {summary}"})
+        messages.extend(history)
+        messages.append({"role": "user", "content": content})
+        return messages
+
+    async def append_exchange(self, room_id: int, question: str, answer: str):
+        """질문과 답변을 컨텍스트에 추가하고, 예산을 넘으면 오래된 턴을 요약으로 넘깁니다."""
+        if not answer.strip():
+            return
+        try:
+            dropped = await self._redis.eval(
+                APPEND_TURNS_SCRIPT,
+                2,
+                get_context_key(room_id),
+                get_pending_key(room_id),
+                CONTEXT_TOKEN_BUDGET,
+                CONTEXT_TTL,
+                json.dumps({"role": "user", "content": question}, ensure_ascii=False),
+                json.dumps({"role": "assistant", "content": answer}, ensure_ascii=False),
+            )
+            if dropped and room_id not in self._summarizing:
+                # 요약은 다음 답변을 막지 않도록 백그라운드에서 수행
+                # (이미 요약 중이면 진행 중인 태스크가 대기 리스트를 비울 때까지 이어서 요약)
+                self._summarizing.add(room_id)
+                task = asyncio.create_task(self._summarize(room_id))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+        except Exception as e:
+            logger.error(f"Failed to update AI context for room {room_id}: {e}")
+
+    async def _summarize(self, room_id: int):
+        """요약 대기 리스트가 빌 때까지 꺼내서 기존 요약에 합칩니다."""
+        pending_key = get_pending_key(room_id)
+        try:
+            while True:
+                async with self._redis.pipeline(transaction=True) as pipe:
+                    pipe.lrange(pending_key, 0, -1)
+                    pipe.delete(pending_key)
+                    raw_turns, _ = await pipe.execute()
+                if not raw_turns:
+                    return
+                try:
+                    await self._fold_summary(room_id, [json.loads(raw) for raw in raw_turns])
+                except Exception:
+                    # 요약하지 못한 턴은 다음 요약 때 다시 시도하도록 대기 리스트 앞쪽에 되돌림
+                    await self._redis.lpush(pending_key, *reversed(raw_turns))
+                    raise
+        except Exception as e:
+            logger.error(f"Failed to summarize AI context for room {room_id}: {e}")
+        finally:
+            self._summarizing.discard(room_id)
+
+    async def _fold_summary(self, room_id: int, dropped: list[dict]):
+        summary_key = get_summary_key(room_id)
+        previous = await self._redis.get(summary_key) or ""
+        transcript = "\n".join(f"{turn['role']}: {turn['content']}" for turn in dropped)
+        response = await self._client.chat.completions.create(
+            model=SUMMARY_MODEL,
+            messages=[
+                {"role": "system", "content": "학생과 AI 선생님의 대화를 이후 답변에 필요한 사실 위주로 5문장 이내로 요약하세요."},
+                {"role": "user", "content": f"기존 요약:\n{previous}\n\n추가 대화:\n{transcript}"},
+            ],
+        )
+        summary = response.choices[0].message.content or previous
+        await self._redis.set(summary_key, summary, ex=CONTEXT_TTL)
+
+    async def clear(self, room_id: int):
+        try:
+            await self._redis.delete(get_context_key(room_id), get_summary_key(room_id), get_pending_key(room_id))
+        except Exception as e:
+            logger.error(f"Failed to clear AI context for room {room_id}: {e}")
@@ -0,0 +1,24 @@
+import base64
+import binascii
+import json
+
+from fastapi import HTTPException, status
+
+
+def encode_cursor(*values) -> str:
+    """정렬 키 값들을 URL에 그대로 쓸 수 있는 불투명한 커서 문자열로 인코딩합니다."""
+    raw = json.dumps(values, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    """커서를 정렬 키 값 리스트로 되돌립니다. 형식이 맞지 않으면 400 에러를 발생시킵니다."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="잘못된 커서입니다.")
+
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="잘못된 커서입니다.")
+    return values
@@ -1,14 +1,121 @@
 # type: ignore
+import asyncio
+import io
+import logging
 import os
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import BinaryIO, List, Optional
 from uuid import uuid4
 
 import boto3
+from botocore.config import Config
 from dotenv import load_dotenv
-from fastapi import UploadFile
+from fastapi import HTTPException, UploadFile, status
+from PIL import Image as PILImage
+from PIL import ImageOps
 
 load_dotenv()
 
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Object Storage I/O 전용 스레드 풀 (boto3는 동기 클라이언트이므로 이벤트 루프 밖에서 실행)
+STORAGE_IO_WORKERS = int(os.getenv("STORAGE_IO_WORKERS", "8"))
+storage_executor = ThreadPoolExecutor(max_workers=STORAGE_IO_WORKERS, thread_name_prefix="storage-io")
+
+
+async def run_in_storage_executor(func, *args, **kwargs):
+    """동기 스토리지 작업을 제한된 스레드 풀에서 실행합니다."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(storage_executor, partial(func, *args, **kwargs))
+
+
+@lru_cache(maxsize=None)
+def get_s3_client(service_name: str, endpoint_url: str, region_name: str, access_key: str, secret_key: str):
+    """
+    설정별로 하나의 boto3 클라이언트를 공유합니다. (boto3 클라이언트는 스레드 안전)
+    커넥션 풀 크기는 스토리지 스레드 풀 크기에 맞춥니다.
+    """
+    return boto3.client(
+        service_name,
+        endpoint_url=endpoint_url,
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        region_name=region_name,
+        config=Config(max_pool_connections=STORAGE_IO_WORKERS),
+    )
+
+
+# 피드/채팅용 파생 이미지 설정 (긴 변 기준 픽셀)
+THUMBNAIL_SIZE = int(os.getenv("IMAGE_THUMBNAIL_SIZE", "480"))
+WEBP_MAX_SIZE = int(os.getenv("IMAGE_WEBP_MAX_SIZE", "1600"))
+WEBP_QUALITY = int(os.getenv("IMAGE_WEBP_QUALITY", "80"))
+
+
+def _encode_webp(image: PILImage.Image, max_size: int) -> bytes:
+    resized = image.copy()
+    resized.thumbnail((max_size, max_size), PILImage.Resampling.LANCZOS)
+    buffer = io.BytesIO()
+    # exif 인자를 넘기지 않으므로 위치 정보 등 메타데이터는 저장되지 않음
+    resized.save(buffer, format="WEBP", quality=WEBP_QUALITY, method=4)
+    return buffer.getvalue()
+
+
+def create_derivatives(data: bytes | BinaryIO, kinds: tuple[str, ...] = ("thumbnail", "webp")) -> dict[str, bytes]:
+    """
+    원본 이미지로 썸네일과 WebP 변환본을 만듭니다. (CPU 작업이므로 스토리지 스레드 풀에서 호출)
+
+    data는 바이트 또는 파일 객체이며, 파일 객체는 복사 없이 처음부터 읽습니다.
+    kinds로 만들 파생 이미지를 고를 수 있습니다. (예: 채팅은 썸네일만)
+    EXIF 방향 정보는 픽셀에 반영한 뒤 메타데이터 없이 저장합니다.
+    애니메이션 이미지처럼 변환하지 않는 경우 빈 dict를 반환합니다.
+    """
+    if isinstance(data, (bytes, bytearray)):
+        data = io.BytesIO(data)
+    else:
+        data.seek(0)
+    sizes = {"thumbnail": THUMBNAIL_SIZE, "webp": WEBP_MAX_SIZE}
+
+    with PILImage.open(data) as source:
+        if getattr(source, "is_animated", False):
+            return {}
+        image = ImageOps.exif_transpose(source)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info or image.mode in ("LA", "PA") else "RGB")
+        return {kind: _encode_webp(image, sizes[kind]) for kind in kinds}
+
+
+def get_derivative_key(object_key: str, kind: str) -> str:
+    """원본 경로 옆에 저장할 파생 이미지 경로 (예: a/b.jpg -> a/b_thumbnail.webp)"""
+    stem = os.path.splitext(object_key)[0]
+    return f"{stem}_{kind}.webp"
+
+
+@dataclass
+class StoredImage:
+    """업로드된 원본과 파생 이미지 URL (파생 이미지를 만들지 못하면 None)"""
+
+    image_path: str
+    thumbnail_path: str | None = None
+    webp_path: str | None = None
+
+    @property
+    def paths(self) -> list[str]:
+        return [path for path in (self.image_path, self.thumbnail_path, self.webp_path) if path]
+
+
+class ImageUploadError(Exception):
+    """개별 이미지 업로드 실패 정보"""
+
+    def __init__(self, index: int, filename: str | None, reason: str, status_code: int = status.HTTP_502_BAD_GATEWAY):
+        super().__init__(reason)
+        self.index = index
+        self.filename = filename
+        self.reason = reason
+        self.status_code = status_code
+
 
 class NCPStorageService:
     def __init__(
@@ -20,9 +127,7 @@ class NCPStorageService:
         secret_key: str = os.getenv("NCP_SECRET_KEY"),
         bucket_name: str = os.getenv("NCP_BUCKET_NAME", "backendsam"),
     ):
-        self.s3_client = boto3.client(
-            service_name, endpoint_url=endpoint_url, aws_access_key_id=access_key, aws_secret_access_key=secret_key, region_name=region_name
-        )
+        self.s3_client = get_s3_client(service_name, endpoint_url, region_name, access_key, secret_key)
         self.bucket_name = bucket_name
         self.endpoint_url = endpoint_url
 
@@ -36,42 +141,95 @@ class NCPStorageService:
         ext = os.path.splitext(original_filename)[1]
         return f"{uuid4()}{ext}"
 
-    def upload_images(self, files: List[Optional[UploadFile]]) -> List[Optional[str]]:
-        """
-        다중 이미지 업로드
+    ALLOWED_EXTENSIONS = [".jpg", ".jpeg", ".png", ".gif", ".webp"]
 
-        :param files: 업로드할 이미지 파일 리스트 (최대 3개)
-        :return: 업로드된 이미지 URL 리스트
-        """
-        uploaded_urls = []
-        allowed_extensions = [".jpg", ".jpeg", ".png", ".gif", ".webp"]
+    def _get_url(self, object_key: str) -> str:
+        return f"https://{self.bucket_name}.kr.object.ncloudstorage.com/{object_key}"
 
-        for file in files:
-            if file is None:
-                uploaded_urls.append(None)
-                continue
+    def _upload_derivatives(self, data: bytes, object_key: str) -> dict[str, str]:
+        """썸네일/WebP 파생 이미지를 원본 옆에 업로드합니다. 실패해도 원본 업로드는 유지합니다."""
+        try:
+            derivatives = create_derivatives(data)
+        except Exception as e:
+            logger.warning(f"Failed to create image derivatives for {object_key}: {e}")
+            return {}
 
+        urls: dict[str, str] = {}
+        for kind, body in derivatives.items():
+            derivative_key = get_derivative_key(object_key, kind)
             try:
-                # 파일 확장자 검증
-                file_ext = os.path.splitext(file.filename)[1].lower()
-                if file_ext not in allowed_extensions:
-                    uploaded_urls.append(None)
-                    continue
-
-                # 고유한 파일명 생성
-                unique_filename = self._generate_unique_filename(file.filename)
-
-                # post-image 폴더 내에 파일 저장
-                object_key = f"post-image/{unique_filename}"
+                self.s3_client.upload_fileobj(
+                    io.BytesIO(body), self.bucket_name, derivative_key, ExtraArgs={"ACL": "public-read", "ContentType": "image/webp"}
+                )
+                urls[kind] = self._get_url(derivative_key)
+            except Exception as e:
+                logger.warning(f"Failed to upload image derivative {derivative_key}: {e}")
+        return urls
+
+    def _upload_one(self, index: int, file: UploadFile) -> StoredImage:
+        """단일 이미지와 파생 이미지 업로드 (스토리지 스레드 풀에서 실행)"""
+        file_ext = os.path.splitext(file.filename or "")[1].lower()
+        if file_ext not in self.ALLOWED_EXTENSIONS:
+            raise ImageUploadError(index, file.filename, f"지원하지 않는 확장자입니다: {file_ext or '없음'}", status.HTTP_400_BAD_REQUEST)
+
+        object_key = f"post-image/{self._generate_unique_filename(file.filename)}"
+        try:
+            data = file.file.read()
+            self.s3_client.upload_fileobj(io.BytesIO(data), self.bucket_name, object_key, ExtraArgs={"ACL": "public-read"})
+        except Exception as e:
+            raise ImageUploadError(index, file.filename, f"업로드 실패: {e}")
+
+        derivative_urls = self._upload_derivatives(data, object_key)
+        return StoredImage(
+            image_path=self._get_url(object_key),
+            thumbnail_path=derivative_urls.get("thumbnail"),
+            webp_path=derivative_urls.get("webp"),
+        )
 
-                # 파일 업로드
-                self.s3_client.upload_fileobj(file.file, self.bucket_name, object_key, ExtraArgs={"ACL": "public-read"})
+    def _delete_uploaded(self, urls: List[str]):
+        """일부 업로드가 실패했을 때 이미 올라간 파일을 정리합니다."""
+        prefix = self._get_url("")
+        for url in urls:
+            try:
+                self.s3_client.delete_object(Bucket=self.bucket_name, Key=url.removeprefix(prefix))
+            except Exception:
+                pass
 
-                # 업로드된 파일 URL 생성
-                file_url = f"https://{self.bucket_name}.kr.object.ncloudstorage.com/{object_key}"
-                uploaded_urls.append(file_url)
+    async def upload_post_images(self, files: List[Optional[UploadFile]]) -> List[Optional[StoredImage]]:
+        """
+        다중 이미지 동시 업로드 (원본 + 썸네일/WebP 파생 이미지)
 
-            except Exception as e:
-                uploaded_urls.append(None)
+        :param files: 업로드할 이미지 파일 리스트 (최대 3개)
+        :return: 업로드된 이미지 정보 리스트 (입력이 None인 자리는 None)
+        :raises HTTPException: 하나라도 실패하면 실패한 이미지 목록과 함께 발생 (성공한 업로드는 정리)
+        """
+        targets = [(index, file) for index, file in enumerate(files) if file is not None]
+        results = await asyncio.gather(
+            *(run_in_storage_executor(self._upload_one, index, file) for index, file in targets),
+            return_exceptions=True,
+        )
 
-        return uploaded_urls
+        stored_images: List[Optional[StoredImage]] = [None] * len(files)
+        errors: List[ImageUploadError] = []
+        for (index, file), result in zip(targets, results):
+            if isinstance(result, ImageUploadError):
+                errors.append(result)
+            elif isinstance(result, BaseException):
+                errors.append(ImageUploadError(index, file.filename, str(result)))
+            else:
+                stored_images[index] = result
+
+        if errors:
+            succeeded = [path for stored in stored_images if stored for path in stored.paths]
+            if succeeded:
+                await run_in_storage_executor(self._delete_uploaded, succeeded)
+            status_code = max(error.status_code for error in errors)
+            raise HTTPException(
+                status_code=status_code,
+                detail={
+                    "message": "이미지 업로드에 실패했습니다.",
+                    "failed": [{"image": f"image{error.index + 1}", "filename": error.filename, "reason": error.reason} for error in errors],
+                },
+            )
+
+        return stored_images
@@ -0,0 +1,174 @@
+import asyncio
+import logging
+import os
+import uuid
+from datetime import timedelta
+
+from sqlalchemy import Integer, String, column, delete, func, update, values
+from sqlalchemy.dialects.postgresql import insert
+
+from src.app.common.utils.post_cache import RELEASE_LOCK_SCRIPT, post_cache
+from src.app.v1.post.entity.post import Post
+from src.app.v1.post.entity.post_card import PostCard
+from src.app.v1.post.entity.post_like_flush import PostLikeFlush
+from src.config.database.postgresql import get_db_session
+from src.config.database.redis import get_redis_cache
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+LIKE_FLUSH_INTERVAL = float(os.getenv("LIKE_FLUSH_INTERVAL", "5"))
+LIKE_FLUSH_LOCK_TTL = 30
+LIKE_FLUSH_RETENTION = timedelta(days=1)  # 반영한 배치 기록 보관 기간
+
+# 게시글(external_id)별 아직 posts.like_count에 반영되지 않은 증감
+LIKE_DELTA_KEY = "post_likes:delta"
+# flush 중인 증감 (DB 반영 전까지 조회에 포함)
+LIKE_FLUSHING_KEY = "post_likes:delta:flushing"
+# flush 중인 증감의 배치 id (DB 반영 후 Redis 정리 전에 중단되어도 같은 배치를 다시 반영하지 않도록)
+LIKE_FLUSH_BATCH_KEY = "post_likes:delta:flushing:batch"
+# 여러 서버 중 한 곳만 flush
+LIKE_FLUSH_LOCK_KEY = "post_likes:flush_lock"
+
+
+class LikeCounter:
+    """
+    좋아요 수를 Redis에서 원자적으로 증감하고, 모인 증감을 주기적으로 posts.like_count에 반영하는 write-behind 카운터입니다.
+
+    좋아요가 몰려도 게시글 행을 잠그지 않고, 조회 시에는 DB 값에 아직 반영되지 않은 증감을 더해 보여줍니다.
+    Redis에 기록하지 못하면 DB에 바로 원자적으로 반영합니다.
+    """
+
+    def __init__(self):
+        self._redis = get_redis_cache()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._running = False
+
+    async def add(self, post_id: str, delta: int):
+        try:
+            await self._redis.hincrby(LIKE_DELTA_KEY, post_id, delta)
+        except Exception as e:
+            logger.error(f"Failed to record like delta for post {post_id}, writing through: {e}")
+            await self._apply_deltas({post_id: delta})
+
+    async def get_pending(self, post_ids: list[str]) -> dict[str, int]:
+        """게시글별로 아직 DB에 반영되지 않은 좋아요 증감을 조회합니다."""
+        if not post_ids:
+            return {}
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.hmget(LIKE_DELTA_KEY, post_ids)
+                pipe.hmget(LIKE_FLUSHING_KEY, post_ids)
+                pending, flushing = await pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to read like deltas: {e}")
+            return {}
+
+        return {post_id: int(a or 0) + int(b or 0) for post_id, a, b in zip(post_ids, pending, flushing) if a or b}
+
+    async def apply(self, posts: list[dict]) -> list[dict]:
+        """응답의 like_count에 아직 반영되지 않은 증감을 더합니다."""
+        pending = await self.get_pending([post["post_id"] for post in posts])
+        for post in posts:
+            if post["post_id"] in pending:
+                post["like_count"] = max(0, post["like_count"] + pending[post["post_id"]])
+        return posts
+
+    async def flush(self):
+        """모인 증감을 한 번의 UPDATE로 posts.like_count에 반영합니다."""
+        token = str(uuid.uuid4())
+        try:
+            if not await self._redis.set(LIKE_FLUSH_LOCK_KEY, token, nx=True, ex=LIKE_FLUSH_LOCK_TTL):
+                return
+        except Exception as e:
+            logger.error(f"Failed to acquire like flush lock: {e}")
+            return
+
+        try:
+            # 이전 flush가 정리 전에 중단되었으면 그 증감부터 같은 배치 id로 처리
+            if not await self._redis.exists(LIKE_FLUSHING_KEY):
+                if not await self._redis.exists(LIKE_DELTA_KEY):
+                    return
+                async with self._redis.pipeline(transaction=True) as pipe:
+                    pipe.rename(LIKE_DELTA_KEY, LIKE_FLUSHING_KEY)
+                    pipe.set(LIKE_FLUSH_BATCH_KEY, str(uuid.uuid4()))
+                    await pipe.execute()
+
+            batch_id = await self._redis.get(LIKE_FLUSH_BATCH_KEY)
+            if not batch_id:
+                batch_id = str(uuid.uuid4())
+                await self._redis.set(LIKE_FLUSH_BATCH_KEY, batch_id)
+
+            deltas = {post_id: int(delta) for post_id, delta in (await self._redis.hgetall(LIKE_FLUSHING_KEY)).items() if int(delta)}
+            if deltas:
+                await self._apply_deltas(deltas, batch_id)
+            await self._redis.delete(LIKE_FLUSHING_KEY, LIKE_FLUSH_BATCH_KEY)
+
+            # DB 값이 바뀌었으므로 캐시된 피드/상세를 갱신
+            for post_id in deltas:
+                await post_cache.invalidate_post(post_id)
+        except Exception as e:
+            logger.error(f"Failed to flush like deltas: {e}")
+        finally:
+            try:
+                # 잠금이 만료되어 다른 인스턴스가 가져간 경우에는 지우지 않음
+                await self._redis.eval(RELEASE_LOCK_SCRIPT, 1, LIKE_FLUSH_LOCK_KEY, token)
+            except Exception as e:
+                logger.error(f"Failed to release like flush lock: {e}")
+
+    @staticmethod
+    async def _apply_deltas(deltas: dict[str, int], batch_id: str | None = None):
+        """
+        증감을 posts.like_count와 피드 카드에 반영합니다.
+        배치 id를 같은 트랜잭션에 기록하므로, 이미 반영한 배치는 다시 반영하지 않습니다. (flush 재시도/동시 실행 대비)
+        """
+        rows = values(column("external_id", String), column("delta", Integer), name="deltas").data(list(deltas.items()))
+        query = (
+            update(Post)
+            .where(Post.external_id == rows.c.external_id)
+            .values(like_count=func.greatest(Post.like_count + rows.c.delta, 0))  # 음수 방지
+        )
+        # 피드 카드의 좋아요 수도 같은 트랜잭션에서 맞춤
+        card_query = update(PostCard).where(PostCard.post_id == Post.id, Post.external_id.in_(list(deltas))).values(like_count=Post.like_count)
+        batch_query = (
+            insert(PostLikeFlush)
+            .values(batch_id=batch_id or str(uuid.uuid4()))
+            .on_conflict_do_nothing(index_elements=[PostLikeFlush.batch_id])
+            .returning(PostLikeFlush.batch_id)
+        )
+        async with get_db_session() as session:
+            result = await session.execute(batch_query)
+            if result.scalar_one_or_none() is None:
+                logger.info(f"Like delta batch {batch_id} was already applied, skipping")
+                return
+            await session.execute(delete(PostLikeFlush).where(PostLikeFlush.created_at < func.now() - LIKE_FLUSH_RETENTION))
+            await session.execute(query)
+            await session.execute(card_query)
+            await session.commit()
+
+    async def _run(self):
+        while self._running:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=LIKE_FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+
+    async def start(self):
+        if self._task is None:
+            self._running = True
+            self._task = asyncio.create_task(self._run())
+            logger.info("Like counter flush loop started")
+
+    async def stop(self):
+        """flush 루프를 멈추고 남은 증감을 반영합니다."""
+        # 반영 도중 중단되지 않도록 cancel 대신 루프 종료를 기다림
+        self._running = False
+        self._wakeup.set()
+        if self._task:
+            await self._task
+            self._task = None
+
+
+like_counter = LikeCounter()
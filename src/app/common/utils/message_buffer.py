@@ -0,0 +1,212 @@
+import asyncio
+import logging
+import os
+import uuid
+from collections import deque
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from src.app.v1.chat.entity.message import Message
+from src.app.v1.chat.entity.room_summary import RoomSummary
+from src.config.database.mongo import MongoDB, mongodb
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 배치 크기 / 시간 기준 flush 설정
+FLUSH_SIZE = int(os.getenv("MONGO_FLUSH_SIZE", "100"))
+FLUSH_INTERVAL = float(os.getenv("MONGO_FLUSH_INTERVAL", "0.5"))
+FLUSH_RETRIES = int(os.getenv("MONGO_FLUSH_RETRIES", "3"))
+MAX_PENDING = int(os.getenv("MONGO_MAX_PENDING", "10000"))
+# 방 요약에 남겨 둘 최근 반영 배치 수 (요약 갱신 재시도가 같은 배치를 두 번 세지 않도록)
+SUMMARY_BATCH_HISTORY = int(os.getenv("MONGO_SUMMARY_BATCH_HISTORY", "50"))
+
+DUPLICATE_KEY_ERROR = 11000
+
+
+def build_summary_updates(documents: list[dict], batch_id: str) -> list[UpdateOne]:
+    """
+    저장된 메시지 배치로 방별 요약(메시지 수, 최근 메시지)을 갱신하는 연산을 만듭니다.
+    메시지 수는 batch_id가 아직 반영되지 않은 요약에만 더하므로 같은 배치를 재시도해도 한 번만 셉니다.
+    """
+    counts: dict[int, int] = {}
+    latest: dict[int, dict] = {}
+    for document in documents:
+        room_id = document["room_id"]
+        counts[room_id] = counts.get(room_id, 0) + 1
+        if room_id not in latest or document["timestamp"] >= latest[room_id]["timestamp"]:
+            latest[room_id] = document
+
+    operations = []
+    for room_id, count in counts.items():
+        document = latest[room_id]
+        operations.append(UpdateOne({"_id": room_id}, {"$setOnInsert": {"message_count": 0}}, upsert=True))
+        operations.append(
+            UpdateOne(
+                {"_id": room_id, "applied_batches": {"$ne": batch_id}},
+                {
+                    "$inc": {"message_count": count},
+                    "$push": {"applied_batches": {"$each": [batch_id], "$slice": -SUMMARY_BATCH_HISTORY}},
+                },
+            )
+        )
+        # 늦게 도착한 이전 메시지가 최근 메시지를 덮어쓰지 않도록 시간 조건을 둠
+        operations.append(
+            UpdateOne(
+                {"_id": room_id, "$or": [{"last_activity": None}, {"last_activity": {"$lte": document["timestamp"]}}]},
+                {
+                    "$set": {
+                        "last_message": document["content"],
+                        "last_message_type": document["message_type"],
+                        "last_sender_id": document["sender_id"],
+                        "last_activity": document["timestamp"],
+                    }
+                },
+            )
+        )
+    return operations
+
+
+class MessageWriteBuffer:
+    """
+    채팅 메시지를 모아서 insert_many로 저장하는 write-behind 버퍼입니다.
+
+    FLUSH_SIZE개가 쌓이거나 FLUSH_INTERVAL초가 지나면 flush하고, 실패한 배치는 재시도합니다.
+    저장된 메시지로 방별 요약(RoomSummary)도 함께 갱신하며, 실패한 요약 갱신은 다음 flush에서 다시 시도합니다.
+    웹소켓 전달은 저장을 기다리지 않습니다.
+    """
+
+    def __init__(self, mongo: MongoDB):
+        self.mongo = mongo
+        self._pending: deque[dict] = deque()
+        # 메시지는 저장됐지만 요약에 아직 반영하지 못한 배치 (batch_id, 문서들)
+        self._pending_summaries: deque[tuple[str, list[dict]]] = deque()
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        self._running = False
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def add(self, message: dict):
+        """메시지를 검증해 버퍼에 추가합니다. DB 호출 없이 즉시 반환합니다."""
+        try:
+            # 버퍼가 저장하는 메시지는 요약 카운트에 반영되므로, 백필 집계에서 제외되도록 표시
+            document = Message(**message, counted=True).model_dump_doc()
+        except Exception as e:
+            logger.error(f"Invalid chat message, not persisted: {e}")
+            return
+
+        if len(self._pending) >= MAX_PENDING:
+            dropped = self._pending.popleft()
+            logger.error(f"Message buffer full, dropping oldest message: {dropped.get('_id')}")
+        self._pending.append(document)
+
+        if len(self._pending) >= FLUSH_SIZE:
+            self._wakeup.set()
+
+    async def flush(self):
+        """버퍼에 쌓인 메시지를 배치 단위로 저장합니다."""
+        async with self._flush_lock:
+            while self._pending:
+                batch = [self._pending.popleft() for _ in range(min(FLUSH_SIZE, len(self._pending)))]
+                inserted: list[dict] = []
+                failed = await self._insert_with_retry(batch, inserted)
+                if inserted:
+                    self._pending_summaries.append((str(uuid.uuid4()), inserted))
+                if failed:
+                    # 재시도까지 실패한 문서는 순서를 유지하며 버퍼 앞쪽에 되돌려 놓고 다음 주기에 다시 시도
+                    self._pending.extendleft(reversed(failed))
+                    break
+            # 새 메시지가 없어도 이전 flush에서 실패한 요약 갱신은 다시 시도
+            await self._apply_summaries()
+
+    async def _insert_with_retry(self, batch: list[dict], inserted: list[dict]) -> list[dict]:
+        """배치를 저장하고 이번에 새로 저장된 문서를 inserted에 담습니다. 끝내 실패한 문서를 반환합니다."""
+        for attempt in range(FLUSH_RETRIES + 1):
+            try:
+                engine = await self.mongo.get_engine()
+                collection = engine.get_collection(Message)
+                await collection.insert_many(batch, ordered=False)
+                inserted.extend(batch)
+                return []
+            except BulkWriteError as bwe:
+                # 이전 시도에서 이미 저장된 문서(중복 키)는 성공으로 간주하고 나머지만 재시도
+                errors = bwe.details.get("writeErrors", [])
+                error_indexes = {err["index"] for err in errors}
+                failed_indexes = {err["index"] for err in errors if err.get("code") != DUPLICATE_KEY_ERROR}
+                inserted.extend(doc for idx, doc in enumerate(batch) if idx not in error_indexes)
+                batch = [doc for idx, doc in enumerate(batch) if idx in failed_indexes]
+                if not batch:
+                    return []
+                logger.warning(f"Partial Mongo flush failure ({len(batch)} docs), attempt {attempt + 1}")
+            except Exception as e:
+                logger.warning(f"Mongo flush failed ({len(batch)} docs), attempt {attempt + 1}: {e}")
+
+            await asyncio.sleep(0.5 * (2**attempt))
+
+        logger.error(f"Mongo flush gave up after {FLUSH_RETRIES + 1} attempts, {len(batch)} docs re-queued")
+        return batch
+
+    async def _apply_summaries(self):
+        """요약에 반영하지 못한 배치를 순서대로 반영합니다. 실패한 배치는 남겨 두고 다음 flush에서 다시 시도합니다."""
+        while self._pending_summaries:
+            batch_id, documents = self._pending_summaries[0]
+            if not await self._update_summaries(batch_id, documents):
+                break
+            self._pending_summaries.popleft()
+
+    async def _update_summaries(self, batch_id: str, documents: list[dict]) -> bool:
+        # 요약은 메시지 컬렉션에서 다시 셀 수 없으므로(버퍼가 센 메시지는 백필에서 제외) 버리지 않고 재시도
+        # 같은 batch_id로 재시도하므로 이전 시도가 일부 반영됐어도 두 번 세지 않음
+        for attempt in range(FLUSH_RETRIES + 1):
+            try:
+                engine = await self.mongo.get_engine()
+                collection = engine.get_collection(RoomSummary)
+                await collection.bulk_write(build_summary_updates(documents, batch_id), ordered=True)
+                return True
+            except Exception as e:
+                logger.warning(f"Failed to update room summaries ({len(documents)} docs), attempt {attempt + 1}: {e}")
+
+            await asyncio.sleep(0.5 * (2**attempt))
+
+        logger.error(f"Room summary update gave up after {FLUSH_RETRIES + 1} attempts, batch {batch_id} re-queued")
+        return False
+
+    async def _run(self):
+        while self._running:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Error in message flush loop: {e}")
+
+    async def start(self):
+        if self._task is None:
+            self._running = True
+            self._task = asyncio.create_task(self._run())
+            logger.info("Message write buffer started")
+
+    async def stop(self):
+        """flush 루프를 멈추고 남은 메시지를 모두 저장합니다."""
+        # 진행 중인 배치가 유실되지 않도록 cancel 대신 루프 종료를 기다림
+        self._running = False
+        self._wakeup.set()
+        if self._task:
+            await self._task
+            self._task = None
+        await self.flush()
+        if self._pending:
+            logger.error(f"{len(self._pending)} chat messages could not be persisted on shutdown")
+        if self._pending_summaries:
+            logger.error(f"{len(self._pending_summaries)} room summary updates could not be applied on shutdown")
+
+
+message_buffer = MessageWriteBuffer(mongodb)
@@ -0,0 +1,137 @@
+import json
+from dataclasses import dataclass
+from datetime import datetime
+
+# Kafka 채팅 레코드 포맷 버전
+#   v2: [버전, room_id, sender_id, message_type, user_type, content, timestamp(epoch ms), title, filename, thumbnail, stream_id]
+CODEC_VERSION = 2
+
+MESSAGE_TYPE_CODES = {"text": 0, "image": 1}
+USER_TYPE_CODES = {"student": 0, "teacher": 1, "ai": 2, "system": 3}
+MESSAGE_TYPES = {code: name for name, code in MESSAGE_TYPE_CODES.items()}
+USER_TYPES = {code: name for name, code in USER_TYPE_CODES.items()}
+
+NO_FILENAME = "None"
+
+
+def to_epoch_ms(value: str | datetime | int) -> int:
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return round(value.timestamp() * 1000)
+
+
+def from_epoch_ms(value: int) -> datetime:
+    return datetime.fromtimestamp(value / 1000)
+
+
+@dataclass
+class ChatRecord:
+    """Kafka 채팅 토픽에 실리는 메시지 스키마입니다. (consumer가 방 정보를 따로 조회하지 않도록 방 제목 포함)"""
+
+    room_id: int
+    sender_id: int
+    message_type: str
+    user_type: str
+    content: str
+    timestamp: int  # epoch milliseconds
+    title: str | None = None
+    filename: str | None = None
+    thumbnail: str | None = None
+    stream_id: str | None = None
+
+    @classmethod
+    def from_message(cls, message: dict) -> "ChatRecord":
+        filename = message.get("filename")
+        return cls(
+            room_id=int(message["room_id"]),
+            sender_id=int(message["sender_id"]),
+            message_type=message.get("message_type", "text"),
+            user_type=message["user_type"],
+            content=message.get("content", ""),
+            timestamp=to_epoch_ms(message.get("timestamp") or datetime.now()),
+            title=message.get("title"),
+            filename=None if filename in (None, NO_FILENAME) else filename,
+            thumbnail=message.get("thumbnail"),
+            stream_id=message.get("stream_id"),
+        )
+
+    def to_message(self, title: str) -> dict:
+        """웹소켓 프레임과 Mongo 저장에 쓰는 기존 메시지 dict 형태로 되돌립니다."""
+        message = {
+            "room_id": self.room_id,
+            "title": title,
+            "sender_id": self.sender_id,
+            "content": self.content,
+            "message_type": self.message_type,
+            "filename": self.filename or NO_FILENAME,
+            "user_type": self.user_type,
+            "timestamp": from_epoch_ms(self.timestamp).isoformat(),
+        }
+        if self.thumbnail:
+            message["thumbnail"] = self.thumbnail
+        if self.stream_id:
+            message["stream_id"] = self.stream_id
+        return message
+
+
+def encode_record(record: ChatRecord) -> bytes:
+    payload = [
+        CODEC_VERSION,
+        record.room_id,
+        record.sender_id,
+        MESSAGE_TYPE_CODES.get(record.message_type, record.message_type),
+        USER_TYPE_CODES.get(record.user_type, record.user_type),
+        record.content,
+        record.timestamp,
+        record.title,
+        record.filename,
+        record.thumbnail,
+        record.stream_id,
+    ]
+    # 뒤쪽의 비어 있는 선택 필드는 생략
+    while payload[-1] is None:
+        payload.pop()
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def decode_record(value: bytes) -> tuple[ChatRecord, str | None]:
+    """
+    Kafka 레코드를 ChatRecord로 디코딩하고, 레코드에 방 제목이 있으면 함께 반환합니다.
+
+    배포 중에는 이전 버전이 보낸 JSON 객체 레코드도 함께 들어오므로 최상위 타입(객체/배열)으로 포맷을 구분합니다.
+    """
+    data = json.loads(value)
+
+    if isinstance(data, dict):
+        # 기존 JSON 레코드 (제목 포함)
+        return ChatRecord.from_message(data), data.get("title")
+
+    if not isinstance(data, list) or not data:
+        raise ValueError("Unknown chat record format")
+    if data[0] != CODEC_VERSION:
+        raise ValueError(f"Unsupported chat record version: {data[0]}")
+
+    fields = data[1:] + [None] * (11 - len(data))
+    room_id, sender_id, message_type, user_type, content, timestamp, title, filename, thumbnail, stream_id = fields
+    record = ChatRecord(
+        room_id=room_id,
+        sender_id=sender_id,
+        message_type=MESSAGE_TYPES.get(message_type, message_type),
+        user_type=USER_TYPES.get(user_type, user_type),
+        content=content,
+        timestamp=timestamp,
+        title=title,
+        filename=filename,
+        thumbnail=thumbnail,
+        stream_id=stream_id,
+    )
+    return record, title
+
+
+def encode_message(message: dict, legacy_json: bool = False) -> bytes:
+    """메시지 dict를 Kafka 레코드 값으로 인코딩합니다. legacy_json이면 기존 JSON 포맷 그대로 보냅니다."""
+    if legacy_json:
+        return json.dumps(message).encode("utf-8")
+    return encode_record(ChatRecord.from_message(message))
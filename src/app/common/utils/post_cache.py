@@ -0,0 +1,223 @@
+import asyncio
+import copy
+import json
+import logging
+import os
+import time
+import uuid
+from collections import OrderedDict
+from typing import Awaitable, Callable
+
+from src.config.database.redis import get_redis_cache
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+POST_CACHE_TTL = int(os.getenv("POST_CACHE_TTL", "60"))  # 1분
+POST_CACHE_LOCK_TTL = 5  # 캐시를 채우는 요청이 죽어도 잠금이 풀리도록
+POST_CACHE_WAIT_INTERVAL = 0.05
+POST_CACHE_WAIT_STEPS = 20  # 최대 1초 대기 후 직접 조회
+
+# 워커 프로세스 내 게시글 상세 캐시 (1차)
+POST_LOCAL_CACHE_SIZE = int(os.getenv("POST_LOCAL_CACHE_SIZE", "1000"))
+POST_LOCAL_CACHE_TTL = float(os.getenv("POST_LOCAL_CACHE_TTL", "30"))
+# 이 시간 안에 버전을 확인한 항목은 Redis 조회 없이 응답 (다른 워커의 수정이 반영되기까지의 최대 지연)
+POST_VERSION_CHECK_INTERVAL = float(os.getenv("POST_VERSION_CHECK_INTERVAL", "1"))
+POST_VERSION_TTL = 60 * 60 * 24  # 상세 캐시 TTL보다 충분히 길게 (만료되어 0으로 돌아가도 이전 상세 키는 이미 만료됨)
+
+# 잠금을 건 요청만 해제하도록 값을 비교 후 삭제
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+def get_post_version_key(post_id: str) -> str:
+    # 수정/삭제/댓글·좋아요 수 변경 시 증가시켜 이전 버전의 상세 캐시를 무효화
+    return f"post_cache:post:{post_id}:version"
+
+
+def get_post_detail_key(post_id: str, version: int) -> str:
+    return f"post_cache:post:{post_id}:v{version}"
+
+
+def get_post_pages_key(post_id: str) -> str:
+    # 해당 게시글이 포함된 캐시 키 목록 (좋아요/댓글/수정 시 무효화 대상)
+    return f"post_cache:post:{post_id}:pages"
+
+
+def get_feed_generation_key(author_id: int | None = None) -> str:
+    # 게시글 생성/삭제로 페이지 구성이 바뀌면 증가시켜 해당 피드의 페이지 캐시를 한 번에 무효화
+    return "post_cache:feed:gen" if author_id is None else f"post_cache:feed:user:{author_id}:gen"
+
+
+def get_feed_page_key(author_id: int | None, generation: int | None, page: int, cursor: str | None) -> str:
+    scope = "all" if author_id is None else f"user:{author_id}"
+    if cursor:
+        # 커서 이후 페이지에는 새 게시글이 끼어들 수 없으므로 세대와 무관 (포함된 게시글 변경 시에만 무효화)
+        return f"post_cache:feed:{scope}:cursor:{cursor}"
+    mode = "page" if cursor is None else "cursor"
+    return f"post_cache:feed:{scope}:{generation or 0}:{mode}:{page}"
+
+
+class LocalLRUCache:
+    """워커 프로세스 내 LRU 캐시 (항목별 TTL, 최대 개수 초과 시 가장 오래 안 쓴 항목부터 제거)"""
+
+    def __init__(self, max_size: int, ttl: float):
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, object]] = OrderedDict()
+
+    def get(self, key: str):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value):
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        self._entries.pop(key, None)
+
+
+class PostCache:
+    """
+    직렬화된 피드 페이지와 게시글 상세를 Redis에 캐싱합니다.
+
+    - 게시글 생성/삭제: 전체 피드와 작성자 피드의 세대를 올려 페이지 캐시를 무효화
+    - 게시글 수정/삭제, 댓글 수 변경, 좋아요 수 DB 반영: 해당 게시글이 포함된 페이지를 지우고 상세 버전을 올림
+    - 만료 직후 같은 키로 몰린 요청은 한 요청만 DB를 조회하고 나머지는 채워진 캐시를 기다림
+    - 게시글 상세는 워커 내 LRU(1차) → Redis(2차) 순으로 조회하고, 1차 캐시는 Redis의 버전으로 검증
+    캐시 장애 시에는 DB 조회로 동작하도록 모든 오류를 로깅만 합니다.
+    """
+
+    def __init__(self):
+        self._redis = get_redis_cache()
+        self._local = LocalLRUCache(POST_LOCAL_CACHE_SIZE, POST_LOCAL_CACHE_TTL)
+
+    async def get_feed_page(self, author_id: int | None, page: int, cursor: str | None, loader: Callable[[], Awaitable[dict]]) -> dict:
+        generation = None
+        if not cursor:
+            try:
+                generation = await self._redis.get(get_feed_generation_key(author_id))
+            except Exception as e:
+                logger.error(f"Failed to read feed generation: {e}")
+                return await loader()
+
+        key = get_feed_page_key(author_id, int(generation) if generation else None, page, cursor)
+        return await self._get_or_load(key, loader, lambda value: [post["post_id"] for post in value["posts"]])
+
+    async def get_post(self, post_id: str, loader: Callable[[], Awaitable[dict]]) -> dict:
+        """
+        게시글 상세를 조회합니다. 반환값은 호출자가 수정해도 되는 복사본입니다.
+        조회 전에 읽은 버전의 키에만 저장하므로, 조회 도중 수정된 게시글의 이전 값은 새 버전으로 노출되지 않습니다.
+        """
+        local = self._local.get(post_id)
+        if local is not None and time.monotonic() - local["checked_at"] < POST_VERSION_CHECK_INTERVAL:
+            return copy.deepcopy(local["value"])
+
+        try:
+            version = int(await self._redis.get(get_post_version_key(post_id)) or 0)
+        except Exception as e:
+            logger.error(f"Failed to read post version for post {post_id}: {e}")
+            return await loader()
+
+        if local is not None and local["version"] == version:
+            local["checked_at"] = time.monotonic()
+            return copy.deepcopy(local["value"])
+
+        value = await self._get_or_load(get_post_detail_key(post_id, version), loader, lambda value: [])
+        self._local.set(post_id, {"version": version, "checked_at": time.monotonic(), "value": copy.deepcopy(value)})
+        return value
+
+    async def invalidate_post(self, post_id: str):
+        self._local.delete(post_id)
+        try:
+            pages_key = get_post_pages_key(post_id)
+            page_keys = await self._redis.smembers(pages_key)
+            async with self._redis.pipeline(transaction=False) as pipe:
+                # 이전 버전의 상세 키는 더 이상 조회되지 않고 TTL로 만료됨
+                pipe.incr(get_post_version_key(post_id))
+                pipe.expire(get_post_version_key(post_id), POST_VERSION_TTL)
+                pipe.delete(pages_key, *page_keys)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to invalidate post cache for post {post_id}: {e}")
+
+    async def invalidate_feed(self, author_id: int):
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.incr(get_feed_generation_key())
+                pipe.incr(get_feed_generation_key(author_id))
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to invalidate feed cache for author {author_id}: {e}")
+
+    async def _get_or_load(self, key: str, loader: Callable[[], Awaitable[dict]], get_post_ids: Callable[[dict], list[str]]) -> dict:
+        cached = await self._read(key)
+        if cached is not None:
+            return cached
+
+        lock_key = f"{key}:lock"
+        token = str(uuid.uuid4())
+        if await self._acquire(lock_key, token):
+            try:
+                value = await loader()
+                await self._write(key, value, get_post_ids(value))
+                return value
+            finally:
+                await self._release(lock_key, token)
+
+        # 다른 요청이 캐시를 채우는 중이면 잠시 기다렸다가 캐시를 읽음
+        for _ in range(POST_CACHE_WAIT_STEPS):
+            await asyncio.sleep(POST_CACHE_WAIT_INTERVAL)
+            cached = await self._read(key)
+            if cached is not None:
+                return cached
+        return await loader()
+
+    async def _read(self, key: str) -> dict | None:
+        try:
+            raw = await self._redis.get(key)
+            return json.loads(raw) if raw else None
+        except Exception as e:
+            logger.error(f"Failed to read post cache {key}: {e}")
+            return None
+
+    async def _write(self, key: str, value: dict, post_ids: list[str]):
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.set(key, json.dumps(value, ensure_ascii=False), ex=POST_CACHE_TTL)
+                for post_id in post_ids:
+                    pipe.sadd(get_post_pages_key(post_id), key)
+                    pipe.expire(get_post_pages_key(post_id), POST_CACHE_TTL)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to write post cache {key}: {e}")
+
+    async def _acquire(self, lock_key: str, token: str) -> bool:
+        try:
+            return bool(await self._redis.set(lock_key, token, nx=True, ex=POST_CACHE_LOCK_TTL))
+        except Exception as e:
+            logger.error(f"Failed to acquire post cache lock {lock_key}: {e}")
+            return True  # Redis 장애 시에는 잠금 없이 DB 조회
+
+    async def _release(self, lock_key: str, token: str):
+        try:
+            await self._redis.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+        except Exception as e:
+            logger.error(f"Failed to release post cache lock {lock_key}: {e}")
+
+
+post_cache = PostCache()
@@ -0,0 +1,89 @@
+import asyncio
+import logging
+from typing import Callable
+
+from src.config.database.redis import get_redis_cache
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+ROOM_CHANNEL_PREFIX = "chat:room:"
+
+
+def get_room_channel(room_id: int) -> str:
+    return f"{ROOM_CHANNEL_PREFIX}{room_id}"
+
+
+class RoomChannelRouter:
+    """
+    워커 간 채팅 메시지 전달을 위한 방 단위 Redis Pub/Sub 구독 관리자입니다.
+
+    Kafka consumer group은 메시지를 파티션 담당 워커 하나에만 전달하므로, 담당 워커가 직렬화된 프레임을
+    방 채널에 publish하고 해당 방의 웹소켓을 가진 워커만 그 채널을 구독해서 전달받습니다.
+    """
+
+    def __init__(self, on_frame: Callable[[int, str], None]):
+        self._redis = get_redis_cache()
+        self._pubsub = self._redis.pubsub()
+        self._on_frame = on_frame
+        self._rooms: set[int] = set()
+        self._subscribed = asyncio.Event()
+        self._listener_task: asyncio.Task | None = None
+
+    async def subscribe(self, room_id: int):
+        """이 워커에 방의 첫 웹소켓이 붙을 때 호출합니다."""
+        if room_id in self._rooms:
+            return
+        self._rooms.add(room_id)
+        await self._pubsub.subscribe(get_room_channel(room_id))
+        self._subscribed.set()
+
+    async def unsubscribe(self, room_id: int):
+        """이 워커에서 방의 마지막 웹소켓이 끊길 때 호출합니다."""
+        if room_id not in self._rooms:
+            return
+        self._rooms.discard(room_id)
+        await self._pubsub.unsubscribe(get_room_channel(room_id))
+        if not self._rooms:
+            self._subscribed.clear()
+
+    async def publish(self, room_id: int, frame: str) -> bool:
+        try:
+            await self._redis.publish(get_room_channel(room_id), frame)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to publish message to room channel {room_id}: {e}")
+            return False
+
+    async def _listen(self):
+        while True:
+            try:
+                # 구독 중인 방이 없으면 pubsub 연결이 없으므로 구독이 생길 때까지 대기
+                await self._subscribed.wait()
+                event = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if not event or event.get("type") != "message":
+                    continue
+                channel = event["channel"]
+                room_id = int(channel[len(ROOM_CHANNEL_PREFIX) :])
+                self._on_frame(room_id, event["data"])
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in room channel listener: {e}")
+                await asyncio.sleep(1)
+
+    async def start(self):
+        if self._listener_task is None:
+            self._listener_task = asyncio.create_task(self._listen())
+            logger.info("Room channel listener started")
+
+    async def stop(self):
+        if self._listener_task:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+        self._rooms.clear()
+        await self._pubsub.aclose()
@@ -0,0 +1,85 @@
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+
+from src.config.database.redis import get_redis_cache
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+ROOM_HEADER_TTL = int(os.getenv("ROOM_HEADER_TTL", "600"))  # 10분
+
+
+def get_room_header_key(room_id: int) -> str:
+    return f"room_header:{room_id}"
+
+
+def get_user_rooms_key(user_id: int) -> str:
+    # 사용자 프로필 변경 시 무효화할 방 목록
+    return f"room_header:user:{user_id}"
+
+
+@dataclass
+class RoomHeader:
+    """메시지 히스토리 화면 상단에 필요한 방/참여자 정보"""
+
+    id: int
+    title: str
+    help_checked: bool
+    student_id: int | None = None
+    teacher_id: int | None = None
+    student_profile: str | None = None
+    teacher_profile: str | None = None
+    student_nickname: str | None = None
+    teacher_nickname: str | None = None
+
+
+class RoomHeaderCache:
+    """
+    방 헤더를 Redis에 캐싱합니다.
+
+    방 상태(help_checked, 삭제)가 바뀌면 방 단위로, 프로필/닉네임이 바뀌면 해당 사용자가 참여한 방 전체를 무효화합니다.
+    캐시 장애 시에는 DB 조회로 동작하도록 모든 오류를 로깅만 합니다.
+    """
+
+    def __init__(self):
+        self._redis = get_redis_cache()
+
+    async def get(self, room_id: int) -> RoomHeader | None:
+        try:
+            raw = await self._redis.get(get_room_header_key(room_id))
+            return RoomHeader(**json.loads(raw)) if raw else None
+        except Exception as e:
+            logger.error(f"Failed to read room header cache for room {room_id}: {e}")
+            return None
+
+    async def set(self, header: RoomHeader):
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.set(get_room_header_key(header.id), json.dumps(asdict(header), ensure_ascii=False), ex=ROOM_HEADER_TTL)
+                for user_id in (header.student_id, header.teacher_id):
+                    if user_id is not None:
+                        pipe.sadd(get_user_rooms_key(user_id), header.id)
+                        pipe.expire(get_user_rooms_key(user_id), ROOM_HEADER_TTL)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to write room header cache for room {header.id}: {e}")
+
+    async def invalidate_room(self, room_id: int):
+        try:
+            await self._redis.delete(get_room_header_key(room_id))
+        except Exception as e:
+            logger.error(f"Failed to invalidate room header cache for room {room_id}: {e}")
+
+    async def invalidate_user(self, user_id: int):
+        try:
+            key = get_user_rooms_key(user_id)
+            room_ids = await self._redis.smembers(key)
+            if room_ids:
+                await self._redis.delete(*[get_room_header_key(int(room_id)) for room_id in room_ids], key)
+        except Exception as e:
+            logger.error(f"Failed to invalidate room header cache for user {user_id}: {e}")
+
+
+room_header_cache = RoomHeaderCache()
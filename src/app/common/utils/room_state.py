@@ -0,0 +1,139 @@
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+
+from sqlalchemy.future import select
+
+from src.app.v1.chat.entity.participant import Participant
+from src.app.v1.chat.entity.room import Room
+from src.config.database.postgresql import SessionLocal
+from src.config.database.redis import get_redis_cache
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 워커 간 help_checked 변경 이벤트를 전파하는 Redis 채널
+ROOM_STATE_CHANNEL = "room_state:events"
+ROOM_STATE_RECONNECT_DELAY = 1
+
+
+@dataclass
+class RoomState:
+    room_id: int
+    title: str
+    help_checked: bool
+    student_id: int | None = None
+    teacher_id: int | None = None
+
+
+class RoomStateCache:
+    """
+    워커 프로세스 단위의 채팅방 상태 캐시입니다.
+
+    웹소켓 연결 시 한 번만 DB에서 읽어오고, 이후에는 help_checked 변경 이벤트(Redis Pub/Sub)로만 갱신합니다.
+    """
+
+    def __init__(self):
+        self._states: dict[int, RoomState] = {}
+        self._redis = get_redis_cache()
+        self._listener_task: asyncio.Task | None = None
+
+    def get(self, room_id: int) -> RoomState | None:
+        return self._states.get(room_id)
+
+    async def load(self, room_id: int) -> RoomState | None:
+        """캐시에 없으면 Room과 Participant를 한 번의 쿼리로 조회해 적재합니다."""
+        state = self._states.get(room_id)
+        if state is not None:
+            return state
+
+        async with SessionLocal() as session:
+            try:
+                query = (
+                    select(Room.id, Room.title, Room.help_checked, Participant.student_id, Participant.teacher_id)
+                    .outerjoin(Participant, Participant.room_id == Room.id)
+                    .where(Room.id == room_id)
+                    .limit(1)
+                )
+                result = await session.execute(query)
+                row = result.first()
+            except Exception as e:
+                logger.error(f"Room {room_id} 상태 조회 중 오류 발생: {e}")
+                return None
+
+        if row is None:
+            return None
+
+        state = RoomState(
+            room_id=row.id,
+            title=row.title,
+            help_checked=row.help_checked,
+            student_id=row.student_id,
+            teacher_id=row.teacher_id,
+        )
+        self._states[room_id] = state
+        return state
+
+    def set_help_checked(self, room_id: int, help_checked: bool):
+        state = self._states.get(room_id)
+        if state is not None:
+            state.help_checked = help_checked
+
+    def evict(self, room_id: int):
+        self._states.pop(room_id, None)
+
+    async def publish_help_checked(self, room_id: int, help_checked: bool):
+        """로컬 캐시를 즉시 갱신하고 다른 워커에 변경 이벤트를 전파합니다."""
+        self.set_help_checked(room_id, help_checked)
+        try:
+            await self._redis.publish(ROOM_STATE_CHANNEL, json.dumps({"room_id": room_id, "help_checked": help_checked}))
+        except Exception as e:
+            # 전파에 실패하면 다른 워커는 방에 다시 연결될 때까지 이전 상태를 사용합니다.
+            logger.error(f"Room {room_id} 상태 이벤트 전파 실패: {e}")
+
+    async def _listen(self):
+        # Redis 연결이 끊겨도 리스너가 종료되지 않도록 다시 구독
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(ROOM_STATE_CHANNEL)
+                async for event in pubsub.listen():
+                    if event.get("type") != "message":
+                        continue
+                    try:
+                        data = json.loads(event["data"])
+                        self.set_help_checked(int(data["room_id"]), bool(data["help_checked"]))
+                    except (ValueError, KeyError, TypeError) as e:
+                        logger.error(f"잘못된 Room 상태 이벤트: {event.get('data')} ({e})")
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Room 상태 리스너 오류, 재연결합니다: {e}")
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception as e:
+                    logger.error(f"Room 상태 pubsub 종료 실패: {e}")
+
+            # 끊긴 동안의 변경 이벤트를 놓쳤을 수 있으므로 캐시를 비워 다음 조회 때 DB에서 다시 적재
+            self._states.clear()
+            await asyncio.sleep(ROOM_STATE_RECONNECT_DELAY)
+
+    async def start(self):
+        if self._listener_task is None:
+            self._listener_task = asyncio.create_task(self._listen())
+            logger.info("Room state listener started")
+
+    async def stop(self):
+        if self._listener_task:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+        self._states.clear()
+
+
+room_state_cache = RoomStateCache()
@@ -0,0 +1,115 @@
+import asyncio
+import json
+import logging
+import os
+import time
+
+from fastapi import WebSocket, status
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 연결별 송신 큐 크기와 느린 클라이언트 판정 기준
+SEND_QUEUE_SIZE = int(os.getenv("WS_SEND_QUEUE_SIZE", "100"))
+SEND_TIMEOUT = float(os.getenv("WS_SEND_TIMEOUT", "10"))
+SLOW_CLIENT_GRACE = float(os.getenv("WS_SLOW_CLIENT_GRACE", "5"))
+
+
+def encode_frame(message: dict) -> str:
+    """브로드캐스트할 메시지를 한 번만 직렬화합니다. (Starlette send_json과 동일한 포맷)"""
+    return json.dumps(message, ensure_ascii=False, separators=(",", ":"))
+
+
+class ClientConnection:
+    """
+    웹소켓 하나에 대한 bounded 송신 큐와 전용 writer task입니다.
+
+    브로드캐스트는 큐에 넣기만 하므로 느린 클라이언트가 방 전체나 Kafka consumer를 막지 않습니다.
+    큐가 SLOW_CLIENT_GRACE 초 이상 가득 찬 상태로 유지되면 연결을 끊습니다.
+    """
+
+    def __init__(self, websocket: WebSocket, room_id: int, user_id: int, on_evict=None):
+        self.websocket = websocket
+        self.room_id = room_id
+        self.user_id = user_id
+        self._queue: asyncio.Queue[str] = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+        self._overflow_since: float | None = None
+        self._on_evict = on_evict
+        self._closed = False
+        # 퇴출용 close task가 실행 중에 GC되지 않고 예외도 확인되도록 참조 유지
+        self._close_tasks: set[asyncio.Task] = set()
+        self._writer_task = asyncio.create_task(self._writer())
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def enqueue(self, frame: str) -> bool:
+        """프레임을 송신 큐에 넣습니다. 큐가 가득 차면 프레임을 버리고 False를 반환합니다."""
+        if self._closed:
+            return False
+        try:
+            self._queue.put_nowait(frame)
+            self._overflow_since = None
+            return True
+        except asyncio.QueueFull:
+            now = time.monotonic()
+            if self._overflow_since is None:
+                self._overflow_since = now
+                logger.warning(f"Send queue full: room={self.room_id}, user={self.user_id}")
+            elif now - self._overflow_since >= SLOW_CLIENT_GRACE:
+                logger.warning(f"Evicting slow client: room={self.room_id}, user={self.user_id}")
+                self._schedule_evict(status.WS_1013_TRY_AGAIN_LATER)
+            return False
+
+    async def _writer(self):
+        try:
+            while True:
+                frame = await self._queue.get()
+                await asyncio.wait_for(self.websocket.send_text(frame), timeout=SEND_TIMEOUT)
+        except asyncio.CancelledError:
+            pass
+        except asyncio.TimeoutError:
+            logger.warning(f"Send timeout, evicting client: room={self.room_id}, user={self.user_id}")
+            self._schedule_evict(status.WS_1013_TRY_AGAIN_LATER)
+        except Exception as e:
+            logger.error(f"Failed to send message to websocket: {e}")
+            self._schedule_evict(status.WS_1000_NORMAL_CLOSURE)
+
+    def _schedule_evict(self, code: int):
+        task = asyncio.create_task(self.close(code=code, evicted=True))
+        self._close_tasks.add(task)
+        task.add_done_callback(self._on_close_done)
+
+    def _on_close_done(self, task: asyncio.Task):
+        self._close_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error(f"Failed to evict client: room={self.room_id}, user={self.user_id}: {task.exception()}")
+
+    async def close(self, code: int = status.WS_1000_NORMAL_CLOSURE, evicted: bool = False):
+        if self._closed:
+            return
+        self._closed = True
+
+        if self._writer_task is not asyncio.current_task():
+            self._writer_task.cancel()
+
+        if evicted:
+            if self._on_evict:
+                await self._on_evict(self)
+            try:
+                await self.websocket.close(code=code)
+            except Exception:
+                pass  # 이미 끊어진 연결
+
+
+def fan_out_frame(connections: list[ClientConnection], frame: str) -> int:
+    """직렬화된 프레임을 각 연결의 송신 큐에 전달하고, 큐에 들어간 연결 수를 반환합니다."""
+    return sum(1 for connection in connections if connection.enqueue(frame))
+
+
+def fan_out(connections: list[ClientConnection], message: dict) -> int:
+    """메시지를 한 번 직렬화한 뒤 각 연결의 송신 큐에 전달합니다."""
+    if not connections:
+        return 0
+    return fan_out_frame(connections, encode_frame(message))
@@ -1,9 +1,10 @@
 import asyncio
-import json
 import logging
 import os
 import base64
-import boto3
+import binascii
+import io
+import uuid
 from openai import AsyncOpenAI
 from datetime import datetime
 from aiokafka import AIOKafkaConsumer, AIOKafkaProducer
@@ -11,7 +12,23 @@ from dotenv import load_dotenv
 from fastapi import WebSocket, HTTPException
 from sqlalchemy.future import select
 from typing import Any
+from src.app.common.utils.ai_context import AIContextCache
 from src.app.common.utils.consts import UserRole
+from src.app.common.utils.image import (
+    create_derivatives,
+    get_derivative_key,
+    get_s3_client,
+    run_in_storage_executor,
+)
+from src.app.common.utils.message_buffer import message_buffer
+from src.app.common.utils.message_codec import decode_record, encode_message
+from src.app.common.utils.room_channel import RoomChannelRouter
+from src.app.common.utils.room_state import room_state_cache
+from src.app.common.utils.websocket_fanout import (
+    ClientConnection,
+    encode_frame,
+    fan_out_frame,
+)
 from src.app.v1.chat.entity.message import Message
 from src.app.v1.chat.entity.room import Room
 from src.config.database.mongo import MongoDB
@@ -25,22 +42,36 @@ mongo = MongoDB()
 
 load_dotenv()
 
+# base64 청크 크기 (4의 배수)
+IMAGE_DECODE_CHUNK = 64 * 1024
+
 
 class ConnectionManager:
 
     def __init__(self):
-        self.active_connections: dict[int, dict[int, WebSocket]] = {}  # room_id: {user_id: websocket}
+        self.active_connections: dict[int, dict[int, ClientConnection]] = {}  # room_id: {user_id: connection}
         self.mongo = mongo
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
         self.client = AsyncOpenAI(api_key=self.openai_api_key)
+        # 방별 AI 대화 컨텍스트 (Redis)
+        self.ai_context = AIContextCache(self.client, mongo)
         self.system_user_id = 0
         self.ai_user_id = 0
         self.ai_welcome_message = "AI 선생님과의 대화가 시작되었습니다. 궁금한 점을 물어보세요!"
         self.producer: AIOKafkaProducer | None = None
         self.consumer: AIOKafkaConsumer | None = None
         self.chat_topic = os.environ.get("CHAT_TOPIC")
+        # "pipelined": 전송 완료를 기다리지 않고 배치 전송 / "sync": 메시지마다 send_and_wait
+        self.producer_mode = os.environ.get("KAFKA_PRODUCER_MODE", "pipelined")
+        # "direct": AI 토큰을 로컬 소켓으로 바로 전송하고 완성된 답변만 Kafka/Mongo에 저장 / "chunked": 50자 단위 메시지
+        self.ai_stream_mode = os.environ.get("AI_STREAM_MODE", "direct")
+        # "json": 기존 JSON 레코드 / "compact": 버전이 있는 압축 레코드
+        # consumer는 두 포맷을 모두 읽으므로, 모든 워커가 배포된 뒤에 compact로 전환
+        self.message_codec = os.environ.get("KAFKA_MESSAGE_CODEC", "json")
         self._consumer_task = None
         self._running = False
+        # 방 단위 Redis 채널로 워커 간 메시지 전달
+        self.room_channels = RoomChannelRouter(on_frame=self.deliver_local)
 
         # 시스템 메시지 정의
         self.system_messages = {
@@ -59,18 +90,65 @@ class ConnectionManager:
         self.ncp_region = os.getenv("NCP_REGION", "kr-standard")
         self.bucket_name = os.getenv("NCP_BUCKET_NAME")
 
-        # NCP Object Storage 클라이언트 초기화
-        self.s3_client = boto3.client(
-            "s3",
-            aws_access_key_id=self.ncp_access_key,
-            aws_secret_access_key=self.ncp_secret_key,
-            endpoint_url=self.ncp_endpoint,
-            region_name=self.ncp_region,
+        # NCP Object Storage 클라이언트 (게시글 이미지 업로드와 커넥션 풀 공유)
+        self.s3_client = get_s3_client("s3", self.ncp_endpoint, self.ncp_region, self.ncp_access_key, self.ncp_secret_key)
+
+    @staticmethod
+    def _decode_base64_chunked(content: str) -> io.BytesIO:
+        """
+        data URL 접두사를 잘라내는 복사 없이 base64를 청크 단위로 디코딩합니다.
+        (원본 문자열 외에 디코딩된 바이트 한 벌만 메모리에 유지)
+        """
+        start = content.find(",") + 1  # 접두사가 없으면 0
+        buffer = io.BytesIO()
+        for offset in range(start, len(content), IMAGE_DECODE_CHUNK):
+            # 청크 경계가 어긋나지 않도록 base64 문자가 아닌 입력은 버리지 않고 오류로 처리
+            buffer.write(base64.b64decode(content[offset : offset + IMAGE_DECODE_CHUNK], validate=True))
+        buffer.seek(0)
+        return buffer
+
+    def _put_image(self, content: str, file_path: str, content_type: str) -> str | None:
+        """
+        디코딩과 업로드를 스토리지 스레드 풀에서 수행합니다.
+        채팅 목록용 썸네일도 함께 올리고 경로를 반환합니다. (만들지 못하면 None)
+        """
+        image_buffer = self._decode_base64_chunked(content)
+
+        # boto3는 업로드가 끝나면 파일 객체를 닫으므로, 원본을 올리기 전에 디코딩한 버퍼로 썸네일을 먼저 만듦
+        # (채팅에는 썸네일만 필요하므로 큰 WebP 변환본은 만들지 않음)
+        try:
+            thumbnail = create_derivatives(image_buffer, kinds=("thumbnail",)).get("thumbnail")
+        except Exception as e:
+            logger.warning(f"Failed to create chat image thumbnail for {file_path}: {e}")
+            thumbnail = None
+
+        image_buffer.seek(0)
+        self.s3_client.upload_fileobj(
+            image_buffer,
+            self.bucket_name,
+            file_path,
+            ExtraArgs={"ContentType": content_type, "ACL": "public-read"},
         )
+        if not thumbnail:
+            return None
 
-    async def upload_image_to_storage(self, content: str, room_id: int, original_filename: str) -> tuple[str, str]:
+        thumbnail_path = get_derivative_key(file_path, "thumbnail")
+        try:
+            self.s3_client.upload_fileobj(
+                io.BytesIO(thumbnail),
+                self.bucket_name,
+                thumbnail_path,
+                ExtraArgs={"ContentType": "image/webp", "ACL": "public-read"},
+            )
+            return thumbnail_path
+        except Exception as e:
+            logger.warning(f"Failed to upload chat image thumbnail for {file_path}: {e}")
+            return None
+
+    async def upload_image_to_storage(self, content: str, room_id: int, original_filename: str) -> tuple[str, str, str | None]:
         """
-        Base64 이미지를 NCP Object Storage에 업로드하고 URL과 저장된 파일명을 반환합니다.
+        Base64 이미지를 NCP Object Storage에 업로드하고 URL, 저장된 파일명, 썸네일 URL을 반환합니다.
+        디코딩과 업로드는 이벤트 루프를 막지 않도록 스토리지 스레드 풀에서 실행됩니다.
         """
         try:
             # 유효성 검사
@@ -79,9 +157,6 @@ class ConnectionManager:
             if not original_filename or not isinstance(original_filename, str):
                 raise ValueError("Invalid filename: must be a non-empty string")
 
-            # Base64 디코딩
-            image_bytes = base64.b64decode(content.split(",")[1] if "," in content else content)
-
             # 파일 확장자 추출
             file_extension = os.path.splitext(original_filename)[1].lower()
             if not file_extension:
@@ -92,32 +167,35 @@ class ConnectionManager:
             stored_filename = f"{timestamp}_{original_filename}"
             # 폴더 생성
             file_path = f"chat_images/room_{room_id}/{stored_filename}"
+            content_type = f"image/{file_extension[1:]}" if file_extension != ".jpg" else "image/jpeg"
 
             # 이미지 업로드
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=file_path,
-                Body=image_bytes,
-                ContentType=f"image/{file_extension[1:]}" if file_extension != ".jpg" else "image/jpeg",
-                ACL="public-read",
-            )
+            thumbnail_path = await run_in_storage_executor(self._put_image, content, file_path, content_type)
 
             # 이미지 URL 생성
             image_url = f"{self.ncp_endpoint}/{self.bucket_name}/{file_path}"
-            return image_url, stored_filename
+            thumbnail_url = f"{self.ncp_endpoint}/{self.bucket_name}/{thumbnail_path}" if thumbnail_path else None
+            return image_url, stored_filename, thumbnail_url
 
-        except ValueError as ve:
+        except (ValueError, binascii.Error) as ve:
             logger.error(f"Value error occurred: {ve}")
             raise HTTPException(status_code=400, detail=str(ve))
         except Exception as e:
             logger.error(f"Failed to upload image: {e}")
             raise HTTPException(status_code=500, detail="Failed to upload image")
 
+    def send_to_user(self, room_id: int, user_id: int, payload: dict):
+        """이 워커에 연결된 특정 사용자에게만 프레임을 보냅니다. (업로드 진행 상태 등)"""
+        connection = self.active_connections.get(room_id, {}).get(user_id)
+        if connection:
+            connection.enqueue(encode_frame(payload))
+
     async def initialize(self, producer: AIOKafkaProducer, consumer: AIOKafkaConsumer):
         """Initialize the Kafka producer and consumer"""
         self.producer = producer
         self.consumer = consumer
         self._running = True
+        await self.room_channels.start()
         self._consumer_task = asyncio.create_task(self.consume_messages())
         logger.info("Kafka producer and consumer initialized")
 
@@ -130,6 +208,7 @@ class ConnectionManager:
                 await self._consumer_task
             except asyncio.CancelledError:
                 pass
+        await self.room_channels.stop()
 
     async def create_message(self, room: Room, user_id: int, user_type: str, content: str) -> dict:
         message = {
@@ -171,8 +250,15 @@ class ConnectionManager:
 
         if room.id not in self.active_connections:
             self.active_connections[room.id] = {}
+            # 이 워커에 방의 첫 연결이 생기면 방 채널 구독
+            await self.room_channels.subscribe(room.id)
+
+        # 같은 사용자가 재접속한 경우 이전 연결의 writer를 정리
+        previous = self.active_connections[room.id].get(user_id)
+        if previous:
+            await previous.close()
 
-        self.active_connections[room.id][user_id] = websocket
+        self.active_connections[room.id][user_id] = ClientConnection(websocket, room.id, user_id, on_evict=self._evict_connection)
 
     async def handle_message(self, room: Room, user_id: int, user_type: str, content: str, filename: str | None = None, message_type: str = "text"):
         """
@@ -188,9 +274,27 @@ class ConnectionManager:
         """
         try:
             if message_type == "image":
-                # 이미지 업로드 및 URL 받기
-                image_url, stored_filename = await self.upload_image_to_storage(
-                    content, room.id, filename or f"image_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jpg"
+                # 업로드 시작/완료를 보낸 사용자에게 알림
+                self.send_to_user(room.id, user_id, {"event": "upload", "status": "uploading", "room_id": room.id, "filename": filename})
+                try:
+                    # 이미지 업로드 및 URL 받기
+                    image_url, stored_filename, thumbnail_url = await self.upload_image_to_storage(
+                        content, room.id, filename or f"image_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jpg"
+                    )
+                except HTTPException:
+                    self.send_to_user(room.id, user_id, {"event": "upload", "status": "failed", "room_id": room.id, "filename": filename})
+                    raise
+                self.send_to_user(
+                    room.id,
+                    user_id,
+                    {
+                        "event": "upload",
+                        "status": "uploaded",
+                        "room_id": room.id,
+                        "filename": stored_filename,
+                        "url": image_url,
+                        "thumbnail": thumbnail_url,
+                    },
                 )
 
                 message = {
@@ -200,6 +304,7 @@ class ConnectionManager:
                     "content": image_url,
                     "message_type": "image",
                     "filename": stored_filename,
+                    "thumbnail": thumbnail_url,
                     "user_type": user_type,
                     "timestamp": datetime.now().isoformat(),
                 }
@@ -237,46 +342,54 @@ class ConnectionManager:
         except Exception as e:
             raise HTTPException(status_code=404, detail="Request의 정확한 전달이 필요합니다.")
 
-    async def disconnect(self, room_id: int, user_id: int):
+    async def disconnect(self, room_id: int, user_id: int, websocket: WebSocket | None = None):
         if room_id in self.active_connections:
-            self.active_connections[room_id].pop(user_id, None)
+            connection = self.active_connections[room_id].get(user_id)
+            # 재접속으로 이미 교체된 연결이면 새 연결은 건드리지 않음
+            if connection and (websocket is None or connection.websocket is websocket):
+                self.active_connections[room_id].pop(user_id, None)
+                await connection.close()
             if not self.active_connections[room_id]:
                 del self.active_connections[room_id]
+                room_state_cache.evict(room_id)
+                await self.room_channels.unsubscribe(room_id)
 
-    async def can_send_message(self, room_id: int, user_type: UserRole) -> bool:
-        async with SessionLocal() as session:
-            try:
-                query = select(Room).where(Room.id == room_id)
-                result = await session.execute(query)
-                room = result.scalar_one_or_none()
-
-                if not room:
-                    return False
-
-                # Students can always send messages
-                if user_type == UserRole.STUDENT:
-                    return True
-                # Teachers can only send messages in teacher mode (help_checked=True)
-                elif user_type == UserRole.TEACHER:
-                    if not room.help_checked:
-                        logger.info("Teacher attempted to send message in AI mode")
-                        return False
-                    return True
+    async def _evict_connection(self, connection: ClientConnection):
+        """송신 큐가 계속 넘치는 느린 클라이언트를 방에서 제거합니다."""
+        await self.disconnect(connection.room_id, connection.user_id, connection.websocket)
 
-            except Exception as e:
-                logger.error(f"Error checking message permission for Room ID {room_id}: {str(e)}")
+    async def can_send_message(self, room_id: int, user_type: UserRole) -> bool:
+        # 연결 시 적재된 방 상태 캐시를 사용하므로 메시지마다 DB를 조회하지 않습니다.
+        state = await room_state_cache.load(room_id)
+        if not state:
+            return False
+
+        # Students can always send messages
+        if user_type == UserRole.STUDENT:
+            return True
+        # Teachers can only send messages in teacher mode (help_checked=True)
+        elif user_type == UserRole.TEACHER:
+            if not state.help_checked:
+                logger.info("Teacher attempted to send message in AI mode")
                 return False
+            return True
+        return False
 
     async def ai_chat(self, room: Room, content: str) -> Any:
         try:
+            # 요약 + 최근 대화 + 사용자 메시지
+            messages = await self.ai_context.build_messages(room.id, content)
             stream = await self.client.chat.completions.create(
                 model="gpt-4-turbo",
-                messages=[
-                    {"role": "user", "content": content},  # 사용자 메시지 추가
-                ],
+                messages=messages,
                 stream=True,
             )
 
+            if self.ai_stream_mode == "direct":
+                answer = await self.stream_ai_answer(room, stream)
+                await self.ai_context.append_exchange(room.id, content, answer)
+                return
+
             buffer = ""
             collected_message = ""
 
@@ -323,6 +436,8 @@ class ConnectionManager:
                 }
                 await self.send_message(message)
 
+            await self.ai_context.append_exchange(room.id, content, collected_message)
+
         except Exception as e:
             logger.error(f"OpenAI API Error: {e}")
             error_message = {
@@ -337,12 +452,69 @@ class ConnectionManager:
             }
             await self.send_message(error_message)
 
-    async def send_message(self, message: dict):
-        """Kafka에 메시지를 전송하고 웹소켓으로 브로드캐스트합니다."""
+    async def stream_ai_answer(self, room: Room, stream) -> str:
+        """
+        OpenAI 스트림의 delta를 이 워커의 방 소켓에 partial 프레임으로 바로 전달하고,
+        완성된 답변 하나만 Kafka로 전송(→ Mongo에 한 문서로 저장)합니다. 스트림이 중간에 실패해도 최종 메시지는 하나입니다.
+        """
+        stream_id = uuid.uuid4().hex
+        collected: list[str] = []
+
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta and chunk.choices[0].delta.content:
+                    delta = chunk.choices[0].delta.content
+                    collected.append(delta)
+                    # partial 프레임은 Kafka/Mongo를 거치지 않음
+                    self.deliver_local(
+                        room.id,
+                        encode_frame(
+                            {
+                                "event": "partial",
+                                "stream_id": stream_id,
+                                "room_id": room.id,
+                                "sender_id": self.ai_user_id,
+                                "content": delta,
+                                "message_type": "text",
+                                "user_type": "ai",
+                            }
+                        ),
+                    )
+            answer = "".join(collected)
+            content = answer
+        except Exception as e:
+            # 스트림이 중간에 끊기면 이미 보낸 partial 말풍선을 같은 stream_id의 안내 메시지 하나로 교체
+            # (잘린 답변은 컨텍스트에 남기지 않음)
+            logger.error(f"OpenAI stream interrupted for room {room.id}: {e}")
+            answer = ""
+            content = "죄송합니다. 현재 AI 응답을 생성할 수 없습니다."
+
+        if content.strip():
+            message = {
+                "room_id": room.id,
+                "title": room.title,
+                "sender_id": self.ai_user_id,
+                "content": content,
+                "message_type": "text",
+                "filename": "None",
+                "user_type": "ai",
+                "timestamp": datetime.now().isoformat(),
+                "stream_id": stream_id,  # 클라이언트가 partial 말풍선을 최종 메시지로 교체할 때 사용
+            }
+            await self.send_message(message)
+        return answer
+
+    async def send_message(self, message: dict) -> asyncio.Future | None:
+        """
+        Kafka에 메시지를 전송합니다. 브로드캐스트는 consumer가 담당합니다.
+
+        pipelined 모드에서는 브로커 응답을 기다리지 않고 전송 Future를 반환하며,
+        전송 실패는 Future의 콜백에서 로깅됩니다. 같은 room_id는 같은 파티션으로 가므로 방 내 순서는 유지됩니다.
+        """
         if not message:  # None이거나 빈 딕셔너리인 경우 처리
             logger.error(f"{message}")
             logger.error("Received empty message")
-            return
+            return None
         if self.producer:
             try:
                 # room_id를 파티션 키로 설정하여 순서 보장
@@ -350,32 +522,53 @@ class ConnectionManager:
                 if room_id is None:
                     raise ValueError("Message must include 'room_id' to ensure partition consistency")
 
-                # 메시지 전송 (room_id를 key로 설정)
-                await self.producer.send_and_wait(
-                    topic=self.chat_topic, key=str(room_id).encode("utf-8"), value=json.dumps(message).encode("utf-8")  # room_id를 파티션 키로 사용
-                )
-                logger.info("Message sent successfully")
+                key = str(room_id).encode("utf-8")  # room_id를 파티션 키로 사용
+                value = encode_message(message, legacy_json=self.message_codec == "json")
+
+                if self.producer_mode == "sync":
+                    await self.producer.send_and_wait(topic=self.chat_topic, key=key, value=value)
+                    logger.info("Message sent successfully")
+                    return None
+
+                # 버퍼에 적재만 하고 반환 (버퍼가 가득 찬 경우에만 대기)
+                future = await self.producer.send(topic=self.chat_topic, key=key, value=value)
+                future.add_done_callback(lambda f: self._on_send_done(f, message))
+                return future
             except Exception as e:
                 logger.error(f"Failed to send message to Kafka: {e}")
                 logger.error(f"Message that failed: {message}")
         else:
             logger.warning("Kafka producer not initialized")
+        return None
+
+    @staticmethod
+    def _on_send_done(future: asyncio.Future, message: dict):
+        if future.cancelled():
+            logger.error(f"Kafka send cancelled: {message}")
+        elif future.exception():
+            logger.error(f"Failed to send message to Kafka: {future.exception()}")
+            logger.error(f"Message that failed: {message}")
 
     async def broadcast_kafka_message(self, message: dict):
-        """Kafka에서 수신한 메시지를 웹소켓 클라이언트에게 브로드캐스트합니다."""
+        """Kafka에서 수신한 메시지를 저장 버퍼에 넣고, 방 채널을 통해 모든 워커의 웹소켓에 브로드캐스트합니다."""
+        # MongoDB 저장은 write-behind 버퍼가 배치로 처리하므로 전달이 저장을 기다리지 않음
+        message_buffer.add(message)
+
         room_id = message.get("room_id")
-        if room_id in self.active_connections:
-            message_model = Message(**message)
+        if room_id is None:
+            return
 
-            engine = await mongo.get_engine()
-            if engine:
-                await engine.save(message_model)
+        # 한 번만 직렬화해서 방 채널에 publish (해당 방 소켓을 가진 워커만 구독 중)
+        frame = encode_frame(message)
+        if not await self.room_channels.publish(room_id, frame):
+            # Redis 장애 시 최소한 이 워커의 소켓에는 직접 전달
+            self.deliver_local(room_id, frame)
 
-            for websocket in self.active_connections[room_id].values():
-                try:
-                    await websocket.send_json(message)
-                except Exception as e:
-                    logger.error(f"Failed to send message to websocket: {e}")
+    def deliver_local(self, room_id: int, frame: str):
+        """이 워커에 연결된 방의 웹소켓 송신 큐로 프레임을 전달합니다."""
+        connections = self.active_connections.get(room_id)
+        if connections:
+            fan_out_frame(list(connections.values()), frame)
 
     async def consume_messages(self):
         """Kafka에서 메시지를 소비하여 웹소켓으로 브로드캐스트합니다."""
@@ -393,13 +586,18 @@ class ConnectionManager:
 
                         if msg and msg.value:
                             try:
-                                # 바이트 메시지를 디코딩하고 파싱
-                                message_data = json.loads(msg.value.decode("utf-8"))
-                                logger.info(f"Received message: {message_data}")
+                                # 압축 레코드와 기존 JSON 레코드를 모두 디코딩
+                                record, title = decode_record(msg.value)
+                                if title is None:
+                                    # 제목이 없는 레코드(제목 필드가 생략된 레코드 등)는 이미 적재된 방 상태만 사용 (연결이 없는 방은 조회/적재하지 않음)
+                                    room_state = room_state_cache.get(record.room_id)
+                                    title = room_state.title if room_state and room_state.title else ""
+                                message_data = record.to_message(title)
+                                logger.debug(f"Received message: {message_data}")
 
                                 await self.broadcast_kafka_message(message_data)
-                            except json.JSONDecodeError as je:
-                                logger.error(f"JSON Decode Error: {je}")
+                            except (ValueError, KeyError, TypeError) as de:
+                                logger.error(f"Chat record decode error: {de}")
                                 logger.error(f"Raw message value: {msg.value}")
                             except Exception as e:
                                 logger.error(f"Error processing message: {e}")
@@ -73,6 +73,7 @@ async def get_room_messages(
     room_id: int,
     page: int = Query(1, gt=0),
     page_size: int = Query(50, gt=0, le=100),
+    before: str | None = Query(None, description="이전 응답의 pagination.next_cursor (지정하면 page 대신 커서로 조회)"),
     mongo: AIOEngine = Depends(mongo_db),
     room_service: RoomService = Depends(get_room_service),
     current_user: dict = Depends(get_current_user),
@@ -80,7 +81,7 @@ async def get_room_messages(
     user_id = current_user.get("user_id")
     if user_id is None:
         raise HTTPException(status_code=404, detail="User ID는 None일 수 없습니다.")
-    return await room_service.get_room_messages(mongo, page=page, page_size=page_size, room_id=room_id)
+    return await room_service.get_room_messages(mongo, page=page, page_size=page_size, room_id=room_id, before=before)
 
 
 # 관리 학생 목록 조회
@@ -1,11 +1,21 @@
 from typing import Optional
 
-from fastapi import APIRouter, Depends, File, Form, Query, UploadFile, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    UploadFile,
+    status,
+)
 from fastapi.responses import Response
 
 from src.app.common.utils.dependency import get_current_user
-from src.app.common.utils.image import NCPStorageService  # type: ignore
+from src.app.common.utils.image import NCPStorageService, StoredImage  # type: ignore
 from src.app.v1.post.schema.post import (
+    ImageDerivative,
     LikeRequest,
     PostCreateRequest,
     PostUpdateRequest,
@@ -14,14 +24,44 @@ from src.app.v1.post.service.post import PostService
 
 router = APIRouter(prefix="/posts", tags=["Posts"])
 
+MAX_LIKE_STATUS_POSTS = 50
+MIN_SEARCH_KEYWORD_LENGTH = 2  # 한글 두 글자 단어까지 검색되도록
+
+
+def get_image_derivatives(uploaded_images: list[StoredImage | None]) -> dict[str, ImageDerivative]:
+    return {image.image_path: ImageDerivative(thumbnail_path=image.thumbnail_path, webp_path=image.webp_path) for image in uploaded_images if image}
+
 
 @router.get("/me")
 async def get_my_posts(
     page: int = Query(default=1, gt=0),
+    cursor: Optional[str] = Query(default=None, description="커서 페이지네이션 (빈 값이면 첫 페이지, 응답의 next_cursor로 다음 페이지)"),
     post_service: PostService = Depends(PostService),
     user_info: dict = Depends(get_current_user),
 ):
-    return await post_service.get_my_posts(page=page, user_id=user_info.get("user_id"))  # type: ignore
+    return await post_service.get_my_posts(page=page, cursor=cursor, user_id=user_info.get("user_id"))  # type: ignore
+
+
+@router.get("/likes")
+async def get_like_posts(
+    post_ids: list[str] = Query(..., description="좋아요 여부를 조회할 게시글 id 목록 (예: ?post_ids=a&post_ids=b)"),
+    post_service: PostService = Depends(PostService),
+    user_info: dict = Depends(get_current_user),
+):
+    if len(post_ids) > MAX_LIKE_STATUS_POSTS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"게시글은 최대 {MAX_LIKE_STATUS_POSTS}개까지 조회할 수 있습니다.")
+    return await post_service.get_like_posts(user_id=user_info.get("user_id"), post_ids=post_ids)  # type: ignore
+
+
+@router.get("/search")
+async def search_posts(
+    q: str = Query(..., max_length=50, description="검색어 (게시글 본문, 유사도 순)"),
+    cursor: Optional[str] = Query(default=None, description="커서 페이지네이션 (응답의 next_cursor로 다음 페이지)"),
+    post_service: PostService = Depends(PostService),
+):
+    if len(q.strip()) < MIN_SEARCH_KEYWORD_LENGTH:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"검색어는 {MIN_SEARCH_KEYWORD_LENGTH}글자 이상 입력해주세요.")
+    return await post_service.search_posts(keyword=q, cursor=cursor)
 
 
 @router.post("/write", status_code=status.HTTP_201_CREATED)
@@ -35,14 +75,16 @@ async def post_write(
     ncp_storage_service: NCPStorageService = Depends(NCPStorageService),
     user_info: dict = Depends(get_current_user),
 ):
-    uploaded_images = ncp_storage_service.upload_images([image1, image2, image3])
+    uploaded_images = await ncp_storage_service.upload_post_images([image1, image2, image3])
+    image_paths = [image.image_path if image else None for image in uploaded_images]
 
     post = PostCreateRequest(
         content=content,
-        image1=uploaded_images[0],
-        image2=uploaded_images[1],
-        image3=uploaded_images[2],
+        image1=image_paths[0],
+        image2=image_paths[1],
+        image3=image_paths[2],
         is_with_teacher=is_with_teacher,
+        derivatives=get_image_derivatives(uploaded_images),
     )
 
     return await post_service.create_post(user_id=user_info.get("user_id"), post=post)  # type: ignore
@@ -65,13 +107,15 @@ async def post_update(
     ncp_storage_service: NCPStorageService = Depends(NCPStorageService),
     user_info: dict = Depends(get_current_user),
 ):
-    uploaded_images = ncp_storage_service.upload_images([image1, image2, image3])
+    uploaded_images = await ncp_storage_service.upload_post_images([image1, image2, image3])
+    image_paths = [image.image_path if image else None for image in uploaded_images]
     update_post = PostUpdateRequest(
         content=content,
-        image1=uploaded_images[0],
-        image2=uploaded_images[1],
-        image3=uploaded_images[2],
+        image1=image_paths[0],
+        image2=image_paths[1],
+        image3=image_paths[2],
         is_with_teacher=is_with_teacher,
+        derivatives=get_image_derivatives(uploaded_images),
     )
     await post_service.update_post(user_id=user_info.get("user_id"), post=update_post, post_id=post_id)  # type: ignore
     return Response(status_code=status.HTTP_200_OK)
@@ -111,14 +155,16 @@ async def get_like_post(
 async def get_user_posts(
     user_id: str,
     page: int = Query(default=1, gt=0),
+    cursor: Optional[str] = Query(default=None, description="커서 페이지네이션 (빈 값이면 첫 페이지, 응답의 next_cursor로 다음 페이지)"),
     post_service: PostService = Depends(PostService),
 ):
-    return await post_service.get_user_posts(user_id=user_id, page=page)
+    return await post_service.get_user_posts(user_id=user_id, page=page, cursor=cursor)
 
 
 @router.get("")
 async def get_posts(
     page: int = Query(default=1, gt=0),
+    cursor: Optional[str] = Query(default=None, description="커서 페이지네이션 (빈 값이면 첫 페이지, 응답의 next_cursor로 다음 페이지)"),
     post_service: PostService = Depends(PostService),
 ):
-    return await post_service.get_posts(page=page)
+    return await post_service.get_posts(page=page, cursor=cursor)
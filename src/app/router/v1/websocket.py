@@ -7,9 +7,10 @@ from fastapi import (
     WebSocketException,
     status,
 )
+from src.app.common.utils.room_state import room_state_cache
 from src.app.common.utils.websocket_manager import manager
 from src.app.v1.chat.repository.chat_repository import ChatRepository
-from src.app.v1.chat.repository.room_repository import RoomRepository
+from src.app.v1.chat.entity.room import Room
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -35,11 +36,13 @@ async def websocket(
             await websocket.send_json({"error": "User ID를 찾을 수 없습니다.", "code": status.WS_1008_POLICY_VIOLATION})
             raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason="User ID를 찾을 수 없습니다.")
 
-        room = await RoomRepository.get_room(room_id=room_id)
-        if room is None:
+        # 방 상태 캐시에서만 조회 (캐시에 없을 때만 한 번의 쿼리로 적재)
+        room_state = await room_state_cache.load(room_id)
+        if room_state is None:
             await websocket.send_text("Room ID를 찾을 수 없습니다. 연결이 끊어집니다.")
             await websocket.close(code=4004)
             return
+        room = Room(id=room_state.room_id, title=room_state.title, help_checked=room_state.help_checked)
 
         user_type = await ChatRepository.get_user_role(user_id=user_id)
         if user_type is None:
@@ -67,8 +70,9 @@ async def websocket(
                 content = data
                 filename = None
 
-            # DB에서 최신 help_checked 상태 가져오기
-            new_help_checked = await RoomRepository.get_help_checked_from_db(room_id)
+            # 캐시된 최신 help_checked 상태 가져오기 (변경 시 이벤트로 갱신되며, 캐시 적중 시 DB 조회 없음)
+            room_state = await room_state_cache.load(room_id) or room_state
+            new_help_checked = room_state.help_checked
 
             # 상태가 변경된 경우만 업데이트
             if room.help_checked != new_help_checked:
@@ -92,4 +96,4 @@ async def websocket(
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
     finally:
-        await manager.disconnect(room_id, user_id)
+        await manager.disconnect(room_id, user_id, websocket)
@@ -3,6 +3,7 @@ import pdb
 import re
 import string
 from datetime import datetime
+from functools import partial
 import random
 from uuid import uuid4
 
@@ -15,11 +16,13 @@ from ulid import ulid  # type: ignore
 
 from src.app.common.models.tag import Tag
 from src.app.common.utils.consts import SocialProvider, UserRole
+from src.app.common.utils.room_header import room_header_cache
 from src.app.v1.user.entity.organization import Organization
 from src.app.v1.user.entity.student import Student
 from src.app.v1.user.entity.study_group import StudyGroup
 from src.app.v1.user.entity.teacher import Teacher
 from src.app.v1.user.entity.user import User
+from src.config.database.postgresql import run_after_commit
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
@@ -123,6 +126,7 @@ class OAuthRepository:
 
             user.first_login = False
             await session.commit()
+            await run_after_commit(partial(room_header_cache.invalidate_user, user.id))
             return user
 
         except IntegrityError as e:
@@ -161,6 +165,7 @@ class OAuthRepository:
 
             user.first_login = False
             await session.commit()
+            await run_after_commit(partial(room_header_cache.invalidate_user, user.id))
             return user
         except IntegrityError as e:
             await session.rollback()
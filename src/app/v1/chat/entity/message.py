@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Optional
 
 from bson import ObjectId
 from odmantic import Field, Model
@@ -15,8 +16,10 @@ class Message(Model):
     message_type: MessageType
     filename: str
     content: str
+    thumbnail: Optional[str] = None  # 이미지 메시지의 썸네일 URL
     user_type: str
     timestamp: datetime
+    counted: bool = False  # 저장 버퍼가 방 요약(RoomSummary)의 메시지 수에 반영하는 메시지인지 여부
 
     model_config = {
         "collection": "chat",
@@ -7,8 +7,8 @@ from src.config.database import Base
 class Participant(Base):
     __tablename__ = "participants"
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
-    student_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("users.id"), nullable=False)
-    teacher_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
-    room_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("rooms.id"), nullable=False)
+    student_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("users.id"), nullable=False, index=True)
+    teacher_id: Mapped[int] = mapped_column(BigInteger, nullable=False, index=True)
+    room_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("rooms.id"), nullable=False, index=True)
     user = relationship("User", back_populates="participant")
     room = relationship("Room", back_populates="participant")
@@ -0,0 +1,20 @@
+from datetime import datetime
+from typing import Optional
+
+from odmantic import Field, Model
+
+
+# MongoDB Collection (방별 최근 메시지/메시지 수 프로젝션, 메시지 저장 시 갱신)
+class RoomSummary(Model):
+    room_id: int = Field(primary_field=True)
+    message_count: int = 0
+    last_message: Optional[str] = None
+    last_message_type: Optional[str] = None
+    last_sender_id: Optional[int] = None
+    last_activity: Optional[datetime] = None
+    backfilled: bool = False  # 버퍼가 세지 않은 메시지(배포 이전 등)까지 반영되었는지 여부
+    applied_batches: list[str] = Field(default_factory=list)  # 최근 반영한 저장 배치 (재시도 시 중복 $inc 방지)
+
+    model_config = {
+        "collection": "room_summaries",
+    }
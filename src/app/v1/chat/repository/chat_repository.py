@@ -4,7 +4,7 @@ from sqlalchemy.exc import NoResultFound, SQLAlchemyError
 from sqlalchemy.future import select
 
 from src.app.v1.user.entity.user import User
-from src.config.database.postgresql import SessionLocal
+from src.config.database.postgresql import get_db_session
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -14,7 +14,7 @@ class ChatRepository:
 
     @classmethod
     async def get_user_role(cls, user_id):
-        async with SessionLocal() as session:
+        async with get_db_session() as session:
             try:
                 query = select(User.role).where(User.id == user_id)
                 result = await session.execute(query)
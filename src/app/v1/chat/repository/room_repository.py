@@ -1,27 +1,32 @@
 import logging
-
 from datetime import datetime
+from functools import partial
 
+from bson import ObjectId
 from fastapi import HTTPException
 from odmantic import AIOEngine, query
+from pymongo import ASCENDING, DESCENDING, UpdateOne
 from sqlalchemy import and_, func
 from sqlalchemy.exc import NoResultFound, SQLAlchemyError
 from sqlalchemy.future import select
 from sqlalchemy.orm import aliased
 
-from src.config.database.mongo import MongoDB
 from src.app.common.models.tag import Tag
 from src.app.common.utils.consts import UserRole
+from src.app.common.utils.room_header import RoomHeader, room_header_cache
+from src.app.common.utils.room_state import room_state_cache
+from src.app.common.utils.websocket_manager import manager
 from src.app.v1.chat.entity.message import Message
 from src.app.v1.chat.entity.participant import Participant
 from src.app.v1.chat.entity.room import Room
+from src.app.v1.chat.entity.room_summary import RoomSummary
 from src.app.v1.chat.schema.room_response import RoomHelpResponse, RoomListResponse
 from src.app.v1.user.entity.student import Student
 from src.app.v1.user.entity.study_group import StudyGroup
 from src.app.v1.user.entity.teacher import Teacher
 from src.app.v1.user.entity.user import User
-from src.config.database.postgresql import SessionLocal
-from src.app.common.utils.websocket_manager import manager
+from src.config.database.mongo import MongoDB
+from src.config.database.postgresql import get_db_session, run_after_commit
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -29,12 +34,15 @@ logger = logging.getLogger(__name__)
 
 mongo = MongoDB()
 
+# 방별 메시지 히스토리 커서 페이지네이션용 인덱스
+MESSAGE_HISTORY_INDEX = "room_id_timestamp_id"
+
 
 class RoomRepository:
 
     @classmethod
     async def room_exists(cls, room_id: int) -> int:
-        async with SessionLocal() as session:
+        async with get_db_session() as session:
             try:
                 query = select(Room).where(Room.id == room_id)
                 result = await session.execute(query)
@@ -51,29 +59,9 @@ class RoomRepository:
                 logger.error(f"An unexpected error occurred: {e}")
                 return False
 
-    @classmethod
-    async def get_room(cls, room_id: int) -> Room | None:
-        async with SessionLocal() as session:
-            try:
-                query = select(Room).where(Room.id == room_id)
-                result = await session.execute(query)
-                room = result.scalar_one_or_none()
-
-                return room
-
-            except NoResultFound:
-                logger.warning(f"Room: {room_id}가 존재하지 않습니다.")
-                return None
-            except SQLAlchemyError as e:
-                logger.error(f"Database error occurred: {e}")
-                return None
-            except Exception as e:
-                logger.error(f"An unexpected error occurred: {e}")
-                return None
-
     @staticmethod
     async def user_exists(user_id: int) -> int:
-        async with SessionLocal() as session:
+        async with get_db_session() as session:
             try:
                 query = select(User).where(User.id == int(user_id))
                 result = await session.execute(query)
@@ -92,7 +80,7 @@ class RoomRepository:
 
     @staticmethod
     async def check_user_student(user_id: int) -> bool:
-        async with SessionLocal() as session:
+        async with get_db_session() as session:
             try:
                 result = await session.execute(select(User.role).where(User.id == user_id))
                 role = result.scalar_one_or_none()
@@ -107,7 +95,7 @@ class RoomRepository:
 
     @staticmethod
     async def get_teacher_id_with_student(user_id: int) -> int | None:
-        async with SessionLocal() as session:
+        async with get_db_session() as session:
             try:
                 # user_id로 student를 찾고, 그 student의 student_group을 통해 teacher_id 조회
                 query = (
@@ -129,7 +117,7 @@ class RoomRepository:
 
     @staticmethod
     async def create_room_and_participant(request, student_id: int, teacher_id: int):
-        async with SessionLocal() as session:
+        async with get_db_session() as session:
             # 새로운 방 생성
             new_room = Room(title=request.title, help_checked=False)
 
@@ -187,7 +175,7 @@ class RoomRepository:
 
     @staticmethod
     async def delete_room_and_participant(room_id: int):
-        async with SessionLocal() as session:
+        async with get_db_session() as session:
             try:
                 # 방 찾기
                 room = await session.get(Room, room_id)
@@ -208,13 +196,17 @@ class RoomRepository:
 
                 await session.commit()
 
+                # AI 대화 컨텍스트 / 방 헤더 캐시 정리 (요청 트랜잭션이 실제로 commit된 뒤)
+                await run_after_commit(partial(manager.ai_context.clear, room_id))
+                await run_after_commit(partial(room_header_cache.invalidate_room, room_id))
+
             except SQLAlchemyError as e:
                 await session.rollback()
                 raise HTTPException(status_code=500, detail=f"데이터베이스 오류: {str(e)}")
 
     @staticmethod
     async def update_help_checked(room_id: int) -> Room:
-        async with SessionLocal() as session:
+        async with get_db_session() as session:
             try:
                 query = select(Room).where(Room.id == room_id)
                 result = await session.execute(query)
@@ -228,8 +220,12 @@ class RoomRepository:
 
                 await session.commit()
 
+                # 워커별 방 상태 캐시 갱신 이벤트 전파 (요청 트랜잭션이 실제로 commit된 뒤)
+                await run_after_commit(partial(room_state_cache.publish_help_checked, room.id, room.help_checked))
+                await run_after_commit(partial(room_header_cache.invalidate_room, room.id))
+
                 # 상태 변경에 따른 시스템 메시지 전송
-                await manager.handle_help_check_update(room, room.help_checked)
+                await run_after_commit(partial(manager.handle_help_check_update, room, room.help_checked))
 
                 logger.info(f"Room ID {room_id} help_checked 상태가 {room.help_checked}로 변경되었습니다.")
 
@@ -243,140 +239,200 @@ class RoomRepository:
                 raise HTTPException(status_code=500, detail="{e}")
 
     @staticmethod
-    async def get_help_checked_from_db(room_id: int) -> bool:
-        """PostgreSQL에서 Room의 help_checked 상태를 조회합니다."""
-        async with SessionLocal() as session:
-            try:
-                query = select(Room).where(Room.id == room_id)
-                result = await session.execute(query)
-                room = result.scalar_one_or_none()
-
-                if room is None:
-                    logger.warning(f"Room {room_id}을(를) 찾을 수 없습니다.")
-                    raise HTTPException(status_code=404, detail="해당 Room ID : {room_id}는 존재하지 않습니다.")
-
-                return room.help_checked
-
-            except Exception as e:
-                logging.error(f"DB에서 help_checked 상태 조회 중 오류 발생: {e}")
-                return False
-
-    @staticmethod
-    async def get_profile_images(room_id: int) -> tuple[str, str] | None:
-        async with SessionLocal() as session:
+    async def get_room_header(room_id: int) -> RoomHeader | None:
+        """
+        방, 참여자, 프로필 이미지, 닉네임을 한 번의 조인 쿼리로 조회합니다. (Redis 캐시 우선)
+        방이 없으면 None을 반환합니다.
+        """
+        header = await room_header_cache.get(room_id)
+        if header is not None:
+            return header
+
+        async with get_db_session() as session:
             try:
-                # User 테이블에 별칭 생성
-                Student = aliased(User)
-                Teacher = aliased(User)
-                # room_id로 participant 조회하고 각각의 user 정보를 join
+                StudentUser = aliased(User)
+                TeacherUser = aliased(User)
+                StudentTag = aliased(Tag)
+                TeacherTag = aliased(Tag)
                 query = (
-                    select(Student.profile_image.label("student_profile"), Teacher.profile_image.label("teacher_profile"))
-                    .join(Participant, Student.id == Participant.student_id)
-                    .join(Teacher, Teacher.id == Participant.teacher_id, isouter=True)
-                    .where(Participant.room_id == room_id)
+                    select(
+                        Room.id,
+                        Room.title,
+                        Room.help_checked,
+                        Participant.student_id,
+                        Participant.teacher_id,
+                        StudentUser.profile_image.label("student_profile"),
+                        TeacherUser.profile_image.label("teacher_profile"),
+                        StudentTag.nickname.label("student_nickname"),
+                        TeacherTag.nickname.label("teacher_nickname"),
+                    )
+                    .outerjoin(Participant, Participant.room_id == Room.id)
+                    .outerjoin(StudentUser, StudentUser.id == Participant.student_id)
+                    .outerjoin(TeacherUser, TeacherUser.id == Participant.teacher_id)
+                    .outerjoin(StudentTag, StudentTag.user_id == Participant.student_id)
+                    .outerjoin(TeacherTag, TeacherTag.user_id == Participant.teacher_id)
+                    .where(Room.id == room_id)
+                    .limit(1)
                 )
-
                 result = await session.execute(query)
-                profile_images = result.first()
-
-                if not profile_images:
-                    return None
-
-                return profile_images.student_profile, profile_images.teacher_profile
-
+                row = result.first()
             except SQLAlchemyError as e:
-                logger.error(f"Database error occurred while fetching teacher ID: {e}")
+                logger.error(f"Database error occurred: {e}")
                 raise HTTPException(status_code=500, detail="DB 오류 발생")
-            except Exception as e:
-                logger.error(f"An unexpected error occurred: {e}")
-                raise HTTPException(status_code=500, detail="{e}")
-
-    @staticmethod
-    async def get_nicknames_by_room_id(room_id: int) -> dict[str, str | None]:
-        async with SessionLocal() as session:
-            """
-            room_id를 기준으로 Participant에서 student_id와 teacher_id를 가져와,
-            해당 user에 연결된 Tag 엔티티에서 nickname을 조회합니다.
-
-            Returns:
-                dict[str, str | None]: 학생 및 교사의 닉네임.
-                    {
-                        "student_nickname": "학생 닉네임" or None,
-                        "teacher_nickname": "교사 닉네임" or None
-                    }
-            """
-            try:
-                # room_id로 Participant에서 student_id와 teacher_id 가져오기
-                participant = await session.execute(select(Participant.student_id, Participant.teacher_id).where(Participant.room_id == room_id))
-                participant = participant.one_or_none()
-
-                if not participant:
-                    return {"student_nickname": None, "teacher_nickname": None}
 
-                student_id, teacher_id = participant
+        if row is None:
+            return None
 
-                # student_id로 Tag의 nickname 조회
-                student_tag = await session.execute(select(Tag.nickname).join(User).where(User.id == student_id))
-                student_nickname = student_tag.scalar_one_or_none()
+        header = RoomHeader(**row._asdict())
+        await room_header_cache.set(header)
+        return header
 
-                # teacher_id로 Tag의 nickname 조회
-                teacher_tag = await session.execute(select(Tag.nickname).join(User).where(User.id == teacher_id))
-                teacher_nickname = teacher_tag.scalar_one_or_none()
-
-                return {
-                    "student_nickname": student_nickname,
-                    "teacher_nickname": teacher_nickname,
-                }
-            except SQLAlchemyError as e:
-                logger.error(f"Database error occurred: {e}")
-                raise HTTPException(status_code=500, detail="DB 오류 발생")
-            except Exception as e:
-                logger.error(f"An unexpected error occurred: {e}")
-                raise HTTPException(status_code=500, detail=str(e))
+    @staticmethod
+    async def ensure_message_indexes(mongo: AIOEngine):
+        """메시지 히스토리 조회용 (room_id, timestamp, _id) 복합 인덱스를 생성합니다. (이미 있으면 무시)"""
+        collection = mongo.get_collection(Message)
+        await collection.create_index(
+            [("room_id", ASCENDING), ("timestamp", DESCENDING), ("_id", DESCENDING)],
+            name=MESSAGE_HISTORY_INDEX,
+        )
 
     @staticmethod
     async def find_messages_by_room(room_id: int, mongo: AIOEngine, page: int = 1, page_size: int = 50) -> list[Message]:
         skip = (page - 1) * page_size
-        messages = await mongo.find(Message, Message.room_id == room_id, sort=query.desc(Message.timestamp), skip=skip, limit=page_size)
+        messages = await mongo.find(
+            Message,
+            Message.room_id == room_id,
+            sort=(query.desc(Message.timestamp), query.desc(Message.id)),
+            skip=skip,
+            limit=page_size,
+        )
+        return list(messages)
+
+    @staticmethod
+    async def find_messages_before(room_id: int, mongo: AIOEngine, before: tuple[datetime, ObjectId] | None = None, limit: int = 50) -> list[Message]:
+        """
+        (timestamp, _id) 기준 커서 이전의 메시지를 최신순으로 조회합니다.
+        skip 없이 인덱스에서 바로 시작 위치를 찾으므로 오래된 페이지도 첫 페이지와 비용이 같습니다.
+        """
+        conditions = [Message.room_id == room_id]
+        if before is not None:
+            timestamp, message_id = before
+            conditions.append(
+                query.or_(
+                    Message.timestamp < timestamp,
+                    query.and_(Message.timestamp == timestamp, Message.id < message_id),
+                )
+            )
+        messages = await mongo.find(
+            Message,
+            *conditions,
+            sort=(query.desc(Message.timestamp), query.desc(Message.id)),
+            limit=limit,
+        )
         return list(messages)
 
     @staticmethod
     async def count_messages(room_id: int, mongo: AIOEngine) -> int:
-        return await mongo.count(Message, Message.room_id == room_id)
+        """방 요약의 메시지 수를 반환합니다. (메시지 컬렉션 count 대신 요약 문서 하나만 읽음)"""
+        summaries = await RoomRepository.get_room_summaries(mongo, [room_id])
+        summary = summaries.get(room_id)
+        return summary.message_count if summary else 0
+
+    @staticmethod
+    async def find_latest_messages(mongo: AIOEngine, room_ids: list[int]) -> list[dict]:
+        """
+        여러 방의 최근 메시지와 메시지 수를 집계 한 번으로 조회합니다. (_id = room_id)
+        uncounted_count는 저장 버퍼가 요약에 반영하지 않는 메시지(배포 이전, 방 생성 시 직접 저장 등)의 수입니다.
+        """
+        pipeline = [
+            {"$match": {"room_id": {"$in": room_ids}}},
+            {"$sort": {"room_id": 1, "timestamp": -1, "_id": -1}},
+            {
+                "$group": {
+                    "_id": "$room_id",
+                    "message_count": {"$sum": 1},
+                    "uncounted_count": {"$sum": {"$cond": [{"$eq": ["$counted", True]}, 0, 1]}},
+                    "last_message": {"$first": "$content"},
+                    "last_message_type": {"$first": "$message_type"},
+                    "last_sender_id": {"$first": "$sender_id"},
+                    "last_activity": {"$first": "$timestamp"},
+                }
+            },
+        ]
+        return await mongo.get_collection(Message).aggregate(pipeline).to_list(length=None)
+
+    @staticmethod
+    async def get_room_summaries(mongo: AIOEngine, room_ids: list[int]) -> dict[int, RoomSummary]:
+        """
+        여러 방의 요약(최근 메시지, 메시지 수)을 한 번에 조회합니다.
+
+        요약은 메시지 저장 버퍼가 갱신하며, 버퍼가 세지 않은 메시지가 반영되지 않은 방은
+        메시지 컬렉션 집계 한 번으로 채운 뒤(backfilled) 이후로는 요약만 읽습니다.
+        """
+        if not room_ids:
+            return {}
+
+        summaries = {summary.room_id: summary for summary in await mongo.find(RoomSummary, query.in_(RoomSummary.room_id, room_ids))}
+        missing = [room_id for room_id in room_ids if room_id not in summaries or not summaries[room_id].backfilled]
+        if not missing:
+            return summaries
+
+        rows = await RoomRepository.find_latest_messages(mongo, missing)
+
+        counts = {row["_id"]: row["uncounted_count"] for row in rows}
+
+        # 버퍼는 저장한 메시지(counted)를 배치마다 $inc로 세므로, 백필은 버퍼가 세지 않는 메시지만 더함
+        # 저장은 됐지만 아직 $inc 전인 메시지가 있어도 양쪽에서 두 번 세지 않으며, $set으로 덮어쓰지도 않음
+        operations = []
+        for room_id in missing:
+            operations.append(UpdateOne({"_id": room_id}, {"$setOnInsert": {"message_count": 0}}, upsert=True))
+            operations.append(
+                UpdateOne(
+                    {"_id": room_id, "backfilled": {"$ne": True}},
+                    {"$inc": {"message_count": counts.get(room_id, 0)}, "$set": {"backfilled": True}},
+                )
+            )
+        for row in rows:
+            last = {key: row[key] for key in ("last_message", "last_message_type", "last_sender_id", "last_activity")}
+            operations.append(
+                UpdateOne(
+                    {"_id": row["_id"], "$or": [{"last_activity": None}, {"last_activity": {"$lte": row["last_activity"]}}]},
+                    {"$set": last},
+                )
+            )
+        try:
+            await mongo.get_collection(RoomSummary).bulk_write(operations, ordered=True)
+        except Exception as e:
+            logger.error(f"Failed to backfill room summaries: {e}")
+
+        # 버퍼가 동시에 갱신했을 수 있으므로 채운 요약을 다시 읽음
+        for summary in await mongo.find(RoomSummary, query.in_(RoomSummary.room_id, missing)):
+            summaries[summary.room_id] = summary
+        return summaries
 
     @staticmethod
     async def get_room_list(mongo: AIOEngine, user_id: int) -> list[RoomListResponse] | None:
-        async with SessionLocal() as session:
+        async with get_db_session() as session:
             try:
                 # 사용자가 참여한 방 목록 조회
                 rooms = await session.execute(select(Room).join(Participant).where(Participant.student_id == user_id))
                 rooms = rooms.scalars().all()
 
+                # 모든 방의 최근 메시지를 요약 컬렉션에서 한 번에 조회
+                summaries = await RoomRepository.get_room_summaries(mongo, [room.id for room in rooms])
+
                 result = []
 
                 for room in rooms:
-                    # 각 방의 최신 메시지 조회
-                    recent_messages = await mongo.find(Message, Message.room_id == room.id, sort=query.desc(Message.timestamp), limit=1)
-                    if recent_messages:
-                        message = recent_messages[0]
-
-                        room_response = RoomListResponse(
-                            room_id=room.id,
-                            title=room.title,
-                            help_checked=room.help_checked,
-                            recent_message=message.content,
-                            recent_update=message.timestamp,
-                            user_id=user_id,
-                        )
-                    else:
-                        room_response = RoomListResponse(
-                            room_id=room.id,
-                            title=room.title,
-                            help_checked=room.help_checked,
-                            recent_message=None,
-                            recent_update=None,
-                            user_id=user_id,
-                        )
+                    summary = summaries.get(room.id)
+                    room_response = RoomListResponse(
+                        room_id=room.id,
+                        title=room.title,
+                        help_checked=room.help_checked,
+                        recent_message=summary.last_message if summary else None,
+                        recent_update=summary.last_activity if summary else None,
+                        user_id=user_id,
+                    )
                     result.append(room_response)
 
                 return result
@@ -390,7 +446,7 @@ class RoomRepository:
 
     @staticmethod
     async def get_teacher_and_students(user_id: int):
-        async with SessionLocal() as session:
+        async with get_db_session() as session:
             try:
                 # 1. Get teacher info
                 teacher_query = (
@@ -451,54 +507,34 @@ class RoomRepository:
 
     @staticmethod
     async def get_room_help_list(mongo: AIOEngine, user_id: int) -> list[RoomHelpResponse] | None:
-        async with SessionLocal() as session:
+        async with get_db_session() as session:
             try:
-                # teacher_user_id로 참여한 방 중 help_checked가 true인 방 목록 조회
-                rooms = await session.execute(
-                    select(Room).join(Participant).where(and_(Participant.teacher_id == user_id, Room.help_checked == True))
+                # 도움 요청 중인 방, 참여 학생, 학생 닉네임을 한 번의 쿼리로 조회
+                rows = await session.execute(
+                    select(Room.id, Room.help_checked, Participant.student_id, Tag.nickname)
+                    .join(Participant, Participant.room_id == Room.id)
+                    .outerjoin(Tag, Tag.user_id == Participant.student_id)
+                    .where(and_(Participant.teacher_id == user_id, Room.help_checked == True))
                 )
-                rooms = rooms.scalars().all()
+                rows = rows.all()
 
-                result = []
+                # 모든 방의 최근 메시지를 요약 컬렉션에서 한 번에 조회
+                summaries = await RoomRepository.get_room_summaries(mongo, [row.id for row in rows])
 
-                for room in rooms:
-                    # 각 방의 최신 메시지 조회
-                    recent_messages = await mongo.find(Message, Message.room_id == room.id, sort=query.desc(Message.timestamp), limit=1)
-
-                    # 해당 방에 참여한 student_id 조회
-                    participants = await session.execute(select(Participant).where(Participant.room_id == room.id))
-                    participant = participants.scalar_one_or_none()
-
-                    # participant의 student_id로 Tag와 User를 통해 nickname 조회
-                    nickname = None
-                    if participant:
-                        tags = await session.execute(select(Tag).join(User).where(User.id == participant.student_id))
-                        tag = tags.scalar_one_or_none()
-                        if tag:
-                            nickname = tag.nickname
-
-                    if recent_messages:
-                        message = recent_messages[0]
-                        room_response = RoomHelpResponse(
-                            room_id=room.id,
-                            student_id=participant.student_id if participant else None,
-                            student_nickname=nickname,
-                            help_checked=room.help_checked,
-                            recent_message=message.content,
-                            recent_update=message.timestamp,
-                        )
-                    else:
-                        room_response = RoomHelpResponse(
-                            room_id=room.id,
-                            student_id=participant.student_id if participant else None,
-                            student_nickname=nickname,
-                            help_checked=room.help_checked,
-                            recent_message=None,
-                            recent_update=None,
-                        )
+                result = []
+                for row in rows:
+                    summary = summaries.get(row.id)
+                    room_response = RoomHelpResponse(
+                        room_id=row.id,
+                        student_id=row.student_id,
+                        student_nickname=row.nickname,
+                        help_checked=row.help_checked,
+                        recent_message=summary.last_message if summary else None,
+                        recent_update=summary.last_activity if summary else None,
+                    )
                     result.append(room_response)
 
-                return result if result else []
+                return result
 
             except SQLAlchemyError as e:
                 logger.error(f"Database error occurred while fetching teacher ID: {e}")
@@ -4,6 +4,7 @@ from odmantic import Field
 from pydantic import BaseModel, ConfigDict
 
 from src.app.common.utils.consts import MessageType
+from src.app.common.utils.room_header import RoomHeader
 from src.app.v1.chat.entity.message import Message
 from src.app.v1.chat.entity.room import Room
 
@@ -35,14 +36,16 @@ class RoomListResponse(BaseModel):
 class PaginationResponse(BaseModel):
     next: int | None
     previous: int | None
-    total_pages: int
-    total_messages: int
+    total_pages: int | None = None  # 커서 조회에서는 전체 개수를 세지 않음
+    total_messages: int | None = None
+    next_cursor: str | None = None  # 더 오래된 메시지를 조회할 before 커서
 
 
 class RoomMessageResponse(BaseModel):
     sender_id: int
     content: str
     filename: str
+    thumbnail: str | None = None
     timestamp: datetime
     message_type: MessageType
     user_type: str
@@ -64,7 +67,7 @@ class RoomMessagesListResponse(BaseModel):
     @classmethod
     def from_room_and_messages(
         cls,
-        room: Room,
+        room: Room | RoomHeader,
         messages: list[Message],
         ai_profile: str,
         student_profile: str,
@@ -73,8 +76,9 @@ class RoomMessagesListResponse(BaseModel):
         teacher_nickname: str,
         next_num: int | None,
         previous: int | None,
-        total_pages: int,
-        total_messages: int,
+        total_pages: int | None,
+        total_messages: int | None,
+        next_cursor: str | None = None,
     ) -> "RoomMessagesListResponse":
         return cls(
             room_id=room.id,
@@ -90,13 +94,20 @@ class RoomMessagesListResponse(BaseModel):
                     sender_id=msg.sender_id,
                     content=msg.content,
                     filename=msg.filename,
+                    thumbnail=msg.thumbnail,
                     timestamp=msg.timestamp,
                     message_type=msg.message_type,
                     user_type=msg.user_type,
                 )
                 for msg in messages
             ],
-            pagination=PaginationResponse(next=next_num, previous=previous, total_pages=total_pages, total_messages=total_messages),
+            pagination=PaginationResponse(
+                next=next_num,
+                previous=previous,
+                total_pages=total_pages,
+                total_messages=total_messages,
+                next_cursor=next_cursor,
+            ),
         )
 
 
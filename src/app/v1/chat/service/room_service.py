@@ -1,6 +1,12 @@
+from datetime import datetime
+
+from bson import ObjectId
+from bson.errors import InvalidId
 from fastapi import HTTPException
 from odmantic import AIOEngine
 
+from src.app.common.utils.cursor import decode_cursor, encode_cursor
+from src.app.v1.chat.entity.message import Message
 from src.app.v1.chat.repository.room_repository import RoomRepository
 from src.app.v1.chat.schema.room_request import RoomCreateRequest
 from src.app.v1.chat.schema.room_response import (
@@ -17,6 +23,18 @@ from src.app.v1.chat.schema.room_response import (
 AI_PROFILE = "https://kr.object.ncloudstorage.com/backendsam/AI_Profile/AI_chat.jpg"
 
 
+def encode_message_cursor(message: Message) -> str:
+    return encode_cursor(message.timestamp.isoformat(), str(message.id))
+
+
+def decode_message_cursor(cursor: str) -> tuple[datetime, ObjectId]:
+    timestamp, message_id = decode_cursor(cursor, 2)
+    try:
+        return datetime.fromisoformat(timestamp), ObjectId(message_id)
+    except (TypeError, ValueError, InvalidId):
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+
+
 class RoomService:
 
     def __init__(self, room_repository: RoomRepository):
@@ -72,39 +90,43 @@ class RoomService:
 
         return await self.room_repository.get_room_list(mongo, user_id)
 
-    async def get_room_messages(self, mongo: AIOEngine, page: int, page_size: int, room_id: int) -> RoomMessagesListResponse | None:
-        is_room = await self.room_repository.get_room(room_id=room_id)
-        if not is_room:
+    async def get_room_messages(
+        self, mongo: AIOEngine, page: int, page_size: int, room_id: int, before: str | None = None
+    ) -> RoomMessagesListResponse | None:
+        # 방/참여자/프로필/닉네임을 한 번에 조회 (캐시)
+        header = await self.room_repository.get_room_header(room_id)
+        if not header:
             raise HTTPException(status_code=404, detail="채팅방 id를 찾을 수 없습니다.")
-
-        profiles = await self.room_repository.get_profile_images(room_id)
-        if not profiles:
+        if header.student_id is None:
             raise HTTPException(status_code=404, detail="Profile을 찾을 수 없습니다.")
 
-        nicknames = await self.room_repository.get_nicknames_by_room_id(room_id)
-        if not nicknames:
-            raise HTTPException(status_code=404, detail="닉네임을 찾을 수 없습니다.")
-        student_nickname = nicknames.get("student_nickname", "학생")
-        teacher_nickname = nicknames.get("teacher_nickname", "교사")
-
-        student_profile, teacher_profile = profiles
-
-        messages = await self.room_repository.find_messages_by_room(room_id, mongo, page, page_size)
-        total_messages = await self.room_repository.count_messages(room_id, mongo)
-        total_pages = (total_messages + page_size - 1) // page_size
+        if before is not None:
+            # 커서 조회: 다음 페이지 존재 여부는 한 개 더 읽어서 판단 (전체 개수는 세지 않음)
+            messages = await self.room_repository.find_messages_before(room_id, mongo, decode_message_cursor(before), page_size + 1)
+            has_more = len(messages) > page_size
+            messages = messages[:page_size]
+            next_num = previous = total_pages = total_messages = None
+        else:
+            messages = await self.room_repository.find_messages_by_room(room_id, mongo, page, page_size)
+            total_messages = await self.room_repository.count_messages(room_id, mongo)
+            total_pages = (total_messages + page_size - 1) // page_size
+            has_more = (page * page_size) < total_messages
+            next_num = page + 1 if has_more else None
+            previous = page - 1 if page > 1 else None
 
         return RoomMessagesListResponse.from_room_and_messages(
-            room=is_room,
+            room=header,
             messages=messages,
             ai_profile=AI_PROFILE,
-            student_profile=student_profile or "default_student_image.jpg",
-            teacher_profile=teacher_profile or "default_teacher_image.jpg",
-            student_nickname=student_nickname or "학생",
-            teacher_nickname=teacher_nickname or "선생님",
-            next_num=page + 1 if (page * page_size) < total_messages else None,
-            previous=page - 1 if page > 1 else None,
+            student_profile=header.student_profile or "default_student_image.jpg",
+            teacher_profile=header.teacher_profile or "default_teacher_image.jpg",
+            student_nickname=header.student_nickname or "학생",
+            teacher_nickname=header.teacher_nickname or "선생님",
+            next_num=next_num,
+            previous=previous,
             total_pages=total_pages,
             total_messages=total_messages,
+            next_cursor=encode_message_cursor(messages[-1]) if has_more and messages else None,
         )
 
     # 관리 학생 목록 조회
@@ -1,12 +1,17 @@
+from functools import partial
+
 from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from src.app.common.models.tag import Tag
+from src.app.common.utils.post_cache import post_cache
 from src.app.v1.comment.entity.comment import Comment
 from src.app.v1.comment.entity.comment_tag import CommentTag
 from src.app.v1.post.entity.post import Post
+from src.app.v1.post.repository.post import PostRepository
 from src.app.v1.user.entity.user import User
+from src.config.database.postgresql import run_after_commit
 
 
 class CommentRepository:
@@ -80,7 +85,8 @@ class CommentRepository:
         if post:
             post.comment_count += 1
             session.add(post)
-            await session.flush()
+            await PostRepository.refresh_post_cards(session, Post.id == post.id)
+            await run_after_commit(partial(post_cache.invalidate_post, post.external_id))
 
     async def decrement_comment_count(self, session: AsyncSession, post_id: int, is_parent: bool):
         """댓글 삭제 시 comment_count 감소 (대댓글 제외)"""
@@ -93,4 +99,5 @@ class CommentRepository:
         if post and post.comment_count > 0:  # 음수 방지
             post.comment_count -= 1
             session.add(post)
-            await session.flush()
+            await PostRepository.refresh_post_cards(session, Post.id == post.id)
+            await run_after_commit(partial(post_cache.invalidate_post, post.external_id))
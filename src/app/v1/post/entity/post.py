@@ -5,6 +5,7 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -20,7 +21,7 @@ class Post(Base):
     __tablename__ = "posts"
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True, nullable=False)
-    external_id: Mapped[str] = mapped_column(String(26), nullable=False)
+    external_id: Mapped[str] = mapped_column(String(26), nullable=False, unique=True, index=True)
     author_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("users.id"), nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
     visibility: Mapped[str] = mapped_column(Enum(Visibility), default=Visibility.PUBLIC, nullable=False)
@@ -33,6 +34,9 @@ class Post(Base):
     __table_args__ = (
         CheckConstraint("like_count >= 0", name="check_positive_like_count"),
         CheckConstraint("comment_count >= 0", name="check_positive_comment_count"),
+        # 피드 (created_at, id) 커서 정렬 / 사용자별 게시글 목록
+        Index("ix_posts_created_at_id", "created_at", "id"),
+        Index("ix_posts_author_id_created_at", "author_id", "created_at"),
     )
 
     # @validates("like_count", "comment_count") # 파이썬 코드 레벨에서 유효성 검사
@@ -0,0 +1,50 @@
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.config.database import Base
+
+
+# 피드 카드 읽기 모델 (게시글/작성자/이미지/선생님 정보를 미리 합쳐 둔 프로젝션, 게시글/프로필 쓰기 시 갱신)
+class PostCard(Base):
+    __tablename__ = "post_cards"
+
+    post_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True)
+    external_id: Mapped[str] = mapped_column(String(26), nullable=False, unique=True)
+    author_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    like_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    comment_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    is_with_teacher: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    created_at: Mapped[DateTime] = mapped_column(DateTime, nullable=False)
+
+    # 작성자 (학생)
+    nickname: Mapped[str | None] = mapped_column(String(12), nullable=True)
+    profile_image: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    career_aspiration: Mapped[str | None] = mapped_column(String(30), nullable=True)
+    interest: Mapped[str | None] = mapped_column(String(30), nullable=True)
+
+    # 피드용 이미지 (썸네일 우선, 최대 3개)
+    image1: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    image2: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    image3: Mapped[str | None] = mapped_column(String(255), nullable=True)
+
+    # 담당 선생님 (is_with_teacher인 경우)
+    teacher_user_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    teacher_nickname: Mapped[str | None] = mapped_column(String(12), nullable=True)
+    teacher_profile_image: Mapped[str | None] = mapped_column(String(255), nullable=True)
+
+    __table_args__ = (
+        Index("ix_post_cards_created_at_post_id", "created_at", "post_id"),
+        Index("ix_post_cards_author_id_created_at_post_id", "author_id", "created_at", "post_id"),
+        # 본문 검색 (pg_trgm)
+        Index("ix_post_cards_content_trgm", "content", postgresql_using="gin", postgresql_ops={"content": "gin_trgm_ops"}),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import BigInteger, ForeignKey, Numeric, String
+from sqlalchemy import BigInteger, ForeignKey, Index, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.config.database import Base
@@ -10,3 +10,6 @@ class PostImage(Base):
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True, nullable=False)
     image_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("images.id"), nullable=False)
     post_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("posts.id"), nullable=False)
+
+    # 게시글별 이미지를 등록 순서대로 조회
+    __table_args__ = (Index("ix_post_images_post_id_id", "post_id", "id"),)
@@ -1,4 +1,4 @@
-from sqlalchemy import BigInteger, DateTime, ForeignKey
+from sqlalchemy import BigInteger, DateTime, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -12,3 +12,6 @@ class PostLike(Base):
     user_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("users.id"), nullable=False)
     post_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("posts.id"), nullable=False)
     created_at: Mapped[DateTime] = mapped_column(DateTime, nullable=False, server_default=func.now())
+
+    # 같은 사용자가 같은 게시글에 좋아요를 한 번만 기록 (멱등 처리용)
+    __table_args__ = (UniqueConstraint("user_id", "post_id", name="uq_post_likes_user_post"),)
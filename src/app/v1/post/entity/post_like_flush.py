@@ -0,0 +1,13 @@
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from src.config.database import Base
+
+
+# 좋아요 수 write-behind 카운터가 DB에 반영한 배치 (같은 배치를 두 번 반영하지 않도록 기록)
+class PostLikeFlush(Base):
+    __tablename__ = "post_like_flushes"
+
+    batch_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    created_at: Mapped[DateTime] = mapped_column(DateTime, nullable=False, server_default=func.now())
@@ -1,17 +1,24 @@
 # type: ignore
 import os
+from datetime import datetime
+from functools import partial
 
 from dotenv import load_dotenv
 from fastapi import HTTPException
-from sqlalchemy import delete, func, select
-from sqlalchemy.orm import joinedload
+from sqlalchemy import and_, case, delete, func, or_, select, true, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import aliased, joinedload
 from starlette import status
 from ulid import ulid  # type: ignore
 
 from src.app.common.models.image import Image
 from src.app.common.models.tag import Tag
 from src.app.common.utils.consts import UserRole
+from src.app.common.utils.cursor import decode_cursor, encode_cursor
+from src.app.common.utils.like_counter import like_counter
+from src.app.common.utils.post_cache import post_cache
 from src.app.v1.post.entity.post import Post
+from src.app.v1.post.entity.post_card import PostCard
 from src.app.v1.post.entity.post_image import PostImage
 from src.app.v1.post.entity.post_like import PostLike
 from src.app.v1.post.schema.post import PostCreateRequest, PostUpdateRequest
@@ -19,13 +26,190 @@ from src.app.v1.user.entity.student import Student
 from src.app.v1.user.entity.study_group import StudyGroup
 from src.app.v1.user.entity.teacher import Teacher
 from src.app.v1.user.entity.user import User
-from src.config.database.postgresql import SessionLocal
+from src.config.database.postgresql import get_db_session, run_after_commit
+
+FEED_IMAGE_LIMIT = 3
+FEED_PAGE_SIZE = 10
+
+
+def encode_post_cursor(card: PostCard) -> str:
+    return encode_cursor(card.created_at.isoformat(), card.post_id)
+
+
+def decode_post_cursor(cursor: str) -> tuple[datetime, int]:
+    created_at, post_id = decode_cursor(cursor, 2)
+    try:
+        return datetime.fromisoformat(created_at), int(post_id)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="잘못된 커서입니다.")
+
+
+def decode_search_cursor(cursor: str) -> tuple[float, int]:
+    score, post_id = decode_cursor(cursor, 2)
+    try:
+        return float(score), int(post_id)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="잘못된 커서입니다.")
+
+
+POST_CARD_COLUMNS = [
+    "post_id",
+    "external_id",
+    "author_id",
+    "content",
+    "like_count",
+    "comment_count",
+    "is_with_teacher",
+    "created_at",
+    "nickname",
+    "profile_image",
+    "career_aspiration",
+    "interest",
+    "image1",
+    "image2",
+    "image3",
+    "teacher_user_id",
+    "teacher_nickname",
+    "teacher_profile_image",
+]
+
+
+def get_post_card_query(condition):
+    """condition에 해당하는 게시글의 피드 카드를 만드는 SELECT 입니다. (POST_CARD_COLUMNS 순서)"""
+    # 게시글별 이미지 3개 (썸네일 우선)
+    ranked = (
+        select(
+            PostImage.post_id,
+            func.coalesce(Image.thumbnail_path, Image.image_path).label("path"),
+            func.row_number().over(partition_by=PostImage.post_id, order_by=PostImage.id).label("position"),
+        )
+        .join(Image, Image.id == PostImage.image_id)
+        .where(PostImage.post_id.in_(select(Post.id).where(condition)))
+        .subquery()
+    )
+    images = (
+        select(
+            ranked.c.post_id,
+            *[
+                func.max(case((ranked.c.position == position, ranked.c.path))).label(f"image{position}")
+                for position in range(1, FEED_IMAGE_LIMIT + 1)
+            ],
+        )
+        .where(ranked.c.position <= FEED_IMAGE_LIMIT)
+        .group_by(ranked.c.post_id)
+        .subquery()
+    )
+
+    # 학생의 담당 선생님 (한 명)
+    TeacherUser = aliased(User)
+    TeacherTag = aliased(Tag)
+    teacher = (
+        select(TeacherUser.id.label("user_id"), TeacherTag.nickname, TeacherUser.profile_image)
+        .select_from(StudyGroup)
+        .join(Teacher, Teacher.id == StudyGroup.teacher_id)
+        .join(TeacherUser, TeacherUser.id == Teacher.user_id)
+        .outerjoin(TeacherTag, TeacherTag.user_id == TeacherUser.id)
+        .where(StudyGroup.student_id == Student.id)
+        .order_by(StudyGroup.id)
+        .limit(1)
+        .lateral("teacher")
+    )
+
+    return (
+        select(
+            Post.id,
+            Post.external_id,
+            Post.author_id,
+            Post.content,
+            Post.like_count,
+            Post.comment_count,
+            Post.is_with_teacher,
+            Post.created_at,
+            Tag.nickname,
+            User.profile_image,
+            Student.career_aspiration,
+            Student.interest,
+            images.c.image1,
+            images.c.image2,
+            images.c.image3,
+            teacher.c.user_id,
+            teacher.c.nickname,
+            teacher.c.profile_image,
+        )
+        .join(User, Post.author_id == User.id)
+        .join(Student, User.id == Student.user_id)
+        .join(Tag, User.id == Tag.user_id)
+        .outerjoin(images, images.c.post_id == Post.id)
+        .outerjoin(teacher, Post.is_with_teacher.is_(True))
+        .where(condition)
+    )
+
+
+def card_to_feed(card: PostCard) -> dict:
+    post_data = {
+        "nickname": card.nickname,
+        "user_id": card.author_id,
+        "profile_image": card.profile_image,
+        "career_aspiration": card.career_aspiration,
+        "interest": card.interest,
+        "like_count": card.like_count,
+        "comment_count": card.comment_count,
+        "post_id": card.external_id,
+        "image1": card.image1,
+        "image2": card.image2,
+        "image3": card.image3,
+        "content": card.content,
+        "created_at": card.created_at.isoformat(),
+    }
+    if card.is_with_teacher and card.teacher_user_id is not None:
+        post_data["teacher"] = {
+            "nickname": card.teacher_nickname,
+            "user_id": card.teacher_user_id,
+            "profile_image": card.teacher_profile_image,
+        }
+    return post_data
 
 
 class PostRepository:
+    @staticmethod
+    async def refresh_post_cards(session, condition) -> list[str]:
+        """
+        condition에 해당하는 게시글의 피드 카드(post_cards)를 다시 만듭니다. 갱신된 게시글 id(external_id)를 반환합니다.
+        원본 변경과 같은 트랜잭션에서 호출해야 합니다.
+        """
+        await session.flush()
+        query = insert(PostCard).from_select(POST_CARD_COLUMNS, get_post_card_query(condition))
+        query = query.on_conflict_do_update(
+            index_elements=[PostCard.post_id],
+            set_={column: query.excluded[column] for column in POST_CARD_COLUMNS if column != "post_id"},
+        ).returning(PostCard.external_id)
+        result = await session.execute(query)
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def refresh_user_post_cards(session, user_id: int) -> list[str]:
+        """프로필이 바뀐 사용자가 작성자이거나 담당 선생님으로 표시되는 게시글의 카드를 갱신합니다."""
+        student_user_ids = (
+            select(Student.user_id)
+            .join(StudyGroup, StudyGroup.student_id == Student.id)
+            .join(Teacher, Teacher.id == StudyGroup.teacher_id)
+            .where(Teacher.user_id == user_id)
+        )
+        post_ids = await PostRepository.refresh_post_cards(
+            session, or_(Post.author_id == user_id, and_(Post.is_with_teacher.is_(True), Post.author_id.in_(student_user_ids)))
+        )
+        for post_id in post_ids:
+            await run_after_commit(partial(post_cache.invalidate_post, post_id))
+        return post_ids
+
+    @staticmethod
+    async def _invalidate_deleted_post(post_id: str, author_id: int):
+        await post_cache.invalidate_post(post_id)
+        await post_cache.invalidate_feed(author_id)
+
     @staticmethod
     async def create_post(user_id: str, post_id: ulid, post: PostCreateRequest):
-        async with SessionLocal() as session:
+        async with get_db_session() as session:
             new_post = Post(
                 external_id=str(post_id),
                 author_id=int(user_id),
@@ -44,21 +228,28 @@ class PostRepository:
 
             for idx, image_path in enumerate(image_paths, start=1):
                 if image_path:
-                    new_image = Image(image_path=image_path)
+                    derivative = post.derivatives.get(image_path)
+                    new_image = Image(
+                        image_path=image_path,
+                        thumbnail_path=derivative.thumbnail_path if derivative else None,
+                        webp_path=derivative.webp_path if derivative else None,
+                    )
                     session.add(new_image)
                     await session.flush()
 
                     post_image = PostImage(image_id=new_image.id, post_id=new_post.id)
                     session.add(post_image)
 
+            await PostRepository.refresh_post_cards(session, Post.id == new_post.id)
             await session.commit()
             await session.refresh(new_post)
+            await run_after_commit(partial(post_cache.invalidate_feed, new_post.author_id))
 
             return {"post_id": new_post.external_id}
 
     @staticmethod
     async def get_post(post_id: str):
-        async with SessionLocal() as session:
+        async with get_db_session() as session:
             # 게시글과 관련 정보를 조회하는 쿼리
             query = (
                 select(Post, User, Student)
@@ -81,10 +272,10 @@ class PostRepository:
             image_result = await session.execute(image_query)
             images = image_result.scalars().all()
 
-            # 이미지 URL 설정
+            # 이미지 URL 설정 (WebP 변환본이 있으면 우선 사용)
             image_paths = [None, None, None]
             for idx, img in enumerate(images[:3]):
-                image_paths[idx] = img.image_path if img else None  # type: ignore
+                image_paths[idx] = (img.webp_path or img.image_path) if img else None  # type: ignore
 
             # 선생님 정보 조회 (is_with_teacher가 True인 경우)
             teacher_info = None
@@ -92,8 +283,10 @@ class PostRepository:
                 teacher_query = (
                     select(User)
                     .options(joinedload(User.tag))  # Tag 정보를 즉시 로딩
-                    .join(StudyGroup, StudyGroup.teacher_id == User.id)  # StudyGroup 테이블과 조인
+                    .join(Teacher, Teacher.user_id == User.id)
+                    .join(StudyGroup, StudyGroup.teacher_id == Teacher.id)  # StudyGroup은 teachers.id를 참조
                     .where(StudyGroup.student_id == student.id)  # 현재 학생의 ID로 필터링
+                    .order_by(StudyGroup.id)  # 피드 카드와 같은 선생님
                     .limit(1)
                 )
                 teacher_result = await session.execute(teacher_query)
@@ -128,7 +321,7 @@ class PostRepository:
 
     @staticmethod
     async def update_post(user_id: str, post_id: str, post: PostUpdateRequest):
-        async with SessionLocal() as session:
+        async with get_db_session() as session:
             # 게시글 조회
             query = select(Post).where(Post.external_id == post_id)
             result = await session.execute(query)
@@ -160,8 +353,13 @@ class PostRepository:
 
                     # 새 이미지 추가
                     for image_url in new_images:
-                        # Image 테이블에 새 이미지 추가
-                        new_image = Image(image_path=image_url)
+                        # Image 테이블에 새 이미지 추가 (파생 이미지 경로 포함)
+                        derivative = post.derivatives.get(image_url)
+                        new_image = Image(
+                            image_path=image_url,
+                            thumbnail_path=derivative.thumbnail_path if derivative else None,
+                            webp_path=derivative.webp_path if derivative else None,
+                        )
                         session.add(new_image)
                         await session.flush()
 
@@ -169,7 +367,9 @@ class PostRepository:
                         post_image = PostImage(post_id=existing_post.id, image_id=new_image.id)
                         session.add(post_image)
 
+                await PostRepository.refresh_post_cards(session, Post.id == existing_post.id)
                 await session.commit()
+                await run_after_commit(partial(post_cache.invalidate_post, post_id))
 
             except Exception as e:
                 await session.rollback()
@@ -177,7 +377,7 @@ class PostRepository:
 
     @staticmethod
     async def delete_post(user_id: str, post_id: str):
-        async with SessionLocal() as session:
+        async with get_db_session() as session:
             try:
                 # 게시글 조회
                 query = select(Post).where(Post.external_id == post_id)
@@ -195,10 +395,11 @@ class PostRepository:
                 await session.execute(delete(PostImage).where(PostImage.post_id == post.id))
                 await session.flush()
 
-                # 게시글 삭제
+                # 게시글 삭제 (피드 카드는 FK ON DELETE CASCADE로 함께 삭제)
                 await session.execute(delete(Post).where(Post.id == post.id))
 
                 await session.commit()
+                await run_after_commit(partial(PostRepository._invalidate_deleted_post, post.external_id, post.author_id))
 
             except HTTPException:
                 await session.rollback()
@@ -207,34 +408,39 @@ class PostRepository:
                 await session.rollback()
                 raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
+    @staticmethod
+    async def _get_post_id(session, post_id: str) -> int:
+        result = await session.execute(select(Post.id).where(Post.external_id == post_id))
+        internal_post_id = result.scalar_one_or_none()
+        if not internal_post_id:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
+        return internal_post_id
+
     @staticmethod
     async def like_post(user_id: str, post_id: str):
-        async with SessionLocal() as session:
+        """
+        좋아요를 기록합니다. 이미 좋아요한 경우에도 같은 결과를 반환합니다. (멱등)
+        게시글 행은 잠그지 않고, 좋아요 수는 Redis 카운터로 증가시킨 뒤 주기적으로 DB에 반영합니다.
+        """
+        async with get_db_session() as session:
             try:
-                # post 존재 여부 확인
-                post_query = select(Post).where(Post.external_id == post_id)
-                post_result = await session.execute(post_query)
-                post = post_result.scalar_one_or_none()
-
-                if not post:
-                    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
-
-                # 이미 좋아요 했는지 확인
-                existing_like = await session.execute(select(PostLike).where(PostLike.user_id == int(user_id), PostLike.post_id == post.id))
-                if existing_like.scalar_one_or_none():
-                    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Already liked this post")
+                internal_post_id = await PostRepository._get_post_id(session, post_id)
 
-                # 좋아요 추가
-                new_like = PostLike(user_id=int(user_id), post_id=post.id)
-                session.add(new_like)
-
-                # 게시글의 좋아요 수 증가
-                post.like_count += 1
+                query = (
+                    insert(PostLike)
+                    .values(user_id=int(user_id), post_id=internal_post_id)
+                    .on_conflict_do_nothing(index_elements=[PostLike.user_id, PostLike.post_id])
+                    .returning(PostLike.id)
+                )
+                result = await session.execute(query)
+                inserted = result.scalar_one_or_none() is not None
 
                 await session.commit()
+                if inserted:
+                    await run_after_commit(partial(like_counter.add, post_id, 1))
 
                 return {
-                    "post_id": post.external_id,
+                    "post_id": post_id,
                     "user_id": int(user_id),
                     "liked": True,
                 }
@@ -248,34 +454,21 @@ class PostRepository:
 
     @staticmethod
     async def unlike_post(user_id: str, post_id: str):
-        async with SessionLocal() as session:
+        """좋아요를 취소합니다. 좋아요하지 않은 경우에도 같은 결과를 반환합니다. (멱등)"""
+        async with get_db_session() as session:
             try:
-                # post 존재 여부 확인
-                post_query = select(Post).where(Post.external_id == post_id)
-                post_result = await session.execute(post_query)
-                post = post_result.scalar_one_or_none()
-
-                if not post:
-                    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Post not found")
-
-                # 좋아요 레코드 찾기
-                like_query = select(PostLike).where(PostLike.user_id == int(user_id), PostLike.post_id == post.id)
-                like_result = await session.execute(like_query)
-                like = like_result.scalar_one_or_none()
-
-                if not like:
-                    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Haven't liked this post yet")
-
-                # 좋아요 삭제
-                await session.delete(like)
+                internal_post_id = await PostRepository._get_post_id(session, post_id)
 
-                # 게시글의 좋아요 수 감소
-                post.like_count = max(0, post.like_count - 1)  # 음수 방지
+                query = delete(PostLike).where(PostLike.user_id == int(user_id), PostLike.post_id == internal_post_id).returning(PostLike.id)
+                result = await session.execute(query)
+                deleted = result.scalar_one_or_none() is not None
 
                 await session.commit()
+                if deleted:
+                    await run_after_commit(partial(like_counter.add, post_id, -1))
 
                 return {
-                    "post_id": post.external_id,
+                    "post_id": post_id,
                     "user_id": int(user_id),
                     "liked": False,
                 }
@@ -289,7 +482,7 @@ class PostRepository:
 
     @staticmethod
     async def get_like_post(user_id: str, post_id: str):
-        async with SessionLocal() as session:
+        async with get_db_session() as session:
             try:
                 # post 존재 여부 확인
                 post_query = select(Post).where(Post.external_id == post_id)
@@ -315,99 +508,63 @@ class PostRepository:
                 raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
     @staticmethod
-    async def get_posts(page: int):
-        PAGE_SIZE = 10
-
-        async with SessionLocal() as session:
-            # 전체 게시글 수 조회
-            total_count_query = select(func.count(Post.id))
-            total_count_result = await session.execute(total_count_query)
-            total_count = total_count_result.scalar()
-
-            # 메인 쿼리 - 모든 필요한 관계를 한 번에 로드
+    async def get_like_posts(user_id: str, post_ids: list[str]):
+        """여러 게시글에 대한 좋아요 여부를 한 번의 쿼리로 조회합니다. (없는 게시글은 False)"""
+        async with get_db_session() as session:
             query = (
-                select(Post, User, Student, Tag)
-                .join(User, Post.author_id == User.id)
-                .join(Student, User.id == Student.user_id)
-                .join(Tag, User.id == Tag.user_id)
-                .order_by(Post.created_at.desc())
-                .offset((page - 1) * PAGE_SIZE)
-                .limit(PAGE_SIZE)
+                select(Post.external_id)
+                .join(PostLike, PostLike.post_id == Post.id)
+                .where(PostLike.user_id == int(user_id), Post.external_id.in_(post_ids))
             )
+            result = await session.execute(query)
+            liked = set(result.scalars().all())
+
+            return {
+                "user_id": int(user_id),
+                "likes": {post_id: post_id in liked for post_id in post_ids},
+            }
+
+    @staticmethod
+    async def _get_feed_page(session, condition, page: int, cursor: str | None) -> dict:
+        """
+        피드 한 페이지를 post_cards에서 조회합니다. (조인 없이 (created_at, post_id) 인덱스 범위 스캔)
+        cursor가 주어지면 (created_at, post_id) 키 범위로 조회하고 전체 개수는 세지 않습니다. (빈 문자열은 첫 페이지)
+        """
+        query = select(PostCard).where(condition)
+        if cursor is not None:
+            query = query.order_by(PostCard.created_at.desc(), PostCard.post_id.desc()).limit(FEED_PAGE_SIZE + 1)
+            if cursor:
+                query = query.where(tuple_(PostCard.created_at, PostCard.post_id) < tuple_(*decode_post_cursor(cursor)))
 
             result = await session.execute(query)
-            rows = result.all()
+            cards = result.scalars().all()
+            has_more = len(cards) > FEED_PAGE_SIZE
+            cards = cards[:FEED_PAGE_SIZE]
 
-            posts = []
-            for row in rows:
-                post, user, student, tag = row
-
-                # 이미지 조회
-                images_query = (
-                    select(Image.image_path)
-                    .join(PostImage, Image.id == PostImage.image_id)
-                    .where(PostImage.post_id == post.id)
-                    .order_by(PostImage.id)
-                    .limit(3)
-                )
-                images_result = await session.execute(images_query)
-                image_paths = [path[0] for path in images_result]
-
-                # 3개까지 채우기
-                while len(image_paths) < 3:
-                    image_paths.append(None)
-
-                # 선생님 정보 조회 (is_with_teacher가 True인 경우)
-                teacher_info = None
-                if post.is_with_teacher:
-                    teacher_query = (
-                        select(User)
-                        .options(joinedload(User.tag))  # Tag 정보를 즉시 로딩
-                        .join(StudyGroup, StudyGroup.teacher_id == User.id)  # StudyGroup 테이블과 조인
-                        .where(StudyGroup.student_id == student.id)  # 현재 학생의 ID로 필터링
-                        .limit(1)
-                    )
-                    teacher_result = await session.execute(teacher_query)
-                    teacher = teacher_result.unique().scalar_one_or_none()
-                    if teacher:
-                        teacher_info = {
-                            "nickname": teacher.tag.nickname if teacher.tag else None,
-                            "user_id": teacher.id,
-                            "profile_image": teacher.profile_image,
-                        }
-
-                post_data = {
-                    "nickname": tag.nickname,
-                    "user_id": user.id,
-                    "profile_image": user.profile_image,
-                    "career_aspiration": student.career_aspiration,
-                    "interest": student.interest,
-                    "like_count": post.like_count,
-                    "comment_count": post.comment_count,
-                    "post_id": post.external_id,
-                    "image1": image_paths[0],
-                    "image2": image_paths[1],
-                    "image3": image_paths[2],
-                    "content": post.content,
-                    "created_at": post.created_at.isoformat(),
-                }
+            next_cursor = encode_post_cursor(cards[-1]) if has_more else None
+            return {"pagination": {"next": None, "previous": None, "next_cursor": next_cursor}, "posts": [card_to_feed(card) for card in cards]}
 
-                if teacher_info:
-                    post_data["teacher"] = teacher_info
+        total_count_result = await session.execute(select(func.count()).select_from(PostCard).where(condition))
+        total_count = total_count_result.scalar()
 
-                posts.append(post_data)
+        query = query.order_by(PostCard.created_at.desc(), PostCard.post_id.desc()).offset((page - 1) * FEED_PAGE_SIZE).limit(FEED_PAGE_SIZE)
+        result = await session.execute(query)
+        cards = result.scalars().all()
 
-            next_page = page + 1 if (page * PAGE_SIZE) < total_count else None
-            previous_page = page - 1 if page > 1 else None
+        # 페이지네이션 정보
+        next_page = page + 1 if (page * FEED_PAGE_SIZE) < total_count else None
+        previous_page = page - 1 if page > 1 else None
 
-            return {"pagination": {"next": next_page, "previous": previous_page}, "posts": posts}
+        return {"pagination": {"next": next_page, "previous": previous_page}, "posts": [card_to_feed(card) for card in cards]}
 
     @staticmethod
-    async def get_user_posts(user_id: str, page: int):
-        PAGE_SIZE = 10
+    async def get_posts(page: int, cursor: str | None = None):
+        async with get_db_session() as session:
+            return await PostRepository._get_feed_page(session, true(), page, cursor)
 
-        async with SessionLocal() as session:
-            # 전체 게시글 수 조회 (해당 사용자의)
+    @staticmethod
+    async def get_user_posts(user_id: str, page: int, cursor: str | None = None):
+        async with get_db_session() as session:
             user_query = select(User.id).where(User.id == int(user_id))
             user_result = await session.execute(user_query)
             internal_user_id = user_result.scalar_one_or_none()
@@ -415,87 +572,30 @@ class PostRepository:
             if not internal_user_id:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
-            # 전체 게시글 수 조회 (해당 사용자의)
-            total_count_query = select(func.count(Post.id)).where(Post.author_id == internal_user_id)
-            total_count_result = await session.execute(total_count_query)
-            total_count = total_count_result.scalar()
-
-            # 메인 쿼리 - 사용자의 게시글만 필터링
-            query = (
-                select(Post, User, Student, Tag)
-                .join(User, Post.author_id == User.id)
-                .join(Student, User.id == Student.user_id)
-                .join(Tag, User.id == Tag.user_id)
-                .where(Post.author_id == internal_user_id)  # internal id로 필터링
-                .order_by(Post.created_at.desc())
-                .offset((page - 1) * PAGE_SIZE)
-                .limit(PAGE_SIZE)
-            )
+            # 사용자의 게시글만 필터링 (internal id)
+            return await PostRepository._get_feed_page(session, PostCard.author_id == internal_user_id, page, cursor)
 
+    @staticmethod
+    async def search_posts(keyword: str, cursor: str | None = None):
+        """
+        게시글 본문을 trigram 단어 유사도(pg_trgm)로 검색합니다. (post_cards.content GIN 인덱스)
+        유사도가 높은 순으로 정렬하고 (유사도, post_id) 키 범위로 커서 페이지네이션합니다.
+        """
+        score = func.word_similarity(keyword, PostCard.content)
+        query = (
+            select(PostCard, score.label("score"))
+            .where(PostCard.content.op("%>")(keyword))  # keyword <% content (인덱스를 타도록 컬럼을 왼쪽에)
+            .order_by(score.desc(), PostCard.post_id.desc())
+            .limit(FEED_PAGE_SIZE + 1)
+        )
+        if cursor:
+            query = query.where(tuple_(score, PostCard.post_id) < tuple_(*decode_search_cursor(cursor)))
+
+        async with get_db_session() as session:
             result = await session.execute(query)
             rows = result.all()
 
-            posts = []
-            for row in rows:
-                post, user, student, tag = row
-
-                # 이미지 조회
-                images_query = (
-                    select(Image.image_path)
-                    .join(PostImage, Image.id == PostImage.image_id)
-                    .where(PostImage.post_id == post.id)
-                    .order_by(PostImage.id)
-                    .limit(3)
-                )
-                images_result = await session.execute(images_query)
-                image_paths = [path[0] for path in images_result]
-
-                # 3개까지 채우기
-                while len(image_paths) < 3:
-                    image_paths.append(None)
-
-                # 선생님 정보 조회 (is_with_teacher가 True인 경우)
-                teacher_info = None
-                if post.is_with_teacher:
-                    teacher_query = (
-                        select(User)
-                        .options(joinedload(User.tag))  # Tag 정보를 즉시 로딩
-                        .join(StudyGroup, StudyGroup.teacher_id == User.id)  # StudyGroup 테이블과 조인
-                        .where(StudyGroup.student_id == student.id)  # 현재 학생의 ID로 필터링
-                        .limit(1)
-                    )
-                    teacher_result = await session.execute(teacher_query)
-                    teacher = teacher_result.unique().scalar_one_or_none()
-                    if teacher:
-                        teacher_info = {
-                            "nickname": teacher.tag.nickname if teacher.tag else None,
-                            "user_id": teacher.id,
-                            "profile_image": teacher.profile_image,
-                        }
-
-                post_data = {
-                    "nickname": tag.nickname,
-                    "user_id": user.id,
-                    "profile_image": user.profile_image,
-                    "career_aspiration": student.career_aspiration,
-                    "interest": student.interest,
-                    "like_count": post.like_count,
-                    "comment_count": post.comment_count,
-                    "post_id": post.external_id,
-                    "image1": image_paths[0],
-                    "image2": image_paths[1],
-                    "image3": image_paths[2],
-                    "content": post.content,
-                    "created_at": post.created_at.isoformat(),
-                }
-
-                if teacher_info:
-                    post_data["teacher"] = teacher_info
-
-                posts.append(post_data)
-
-            # 페이지네이션 정보
-            next_page = page + 1 if (page * PAGE_SIZE) < total_count else None
-            previous_page = page - 1 if page > 1 else None
-
-            return {"pagination": {"next": next_page, "previous": previous_page}, "posts": posts}
+        has_more = len(rows) > FEED_PAGE_SIZE
+        rows = rows[:FEED_PAGE_SIZE]
+        next_cursor = encode_cursor(rows[-1][1], rows[-1][0].post_id) if has_more else None
+        return {"pagination": {"next": None, "previous": None, "next_cursor": next_cursor}, "posts": [card_to_feed(card) for card, _ in rows]}
@@ -3,12 +3,19 @@ from typing import Optional
 from pydantic import BaseModel, Field
 
 
+class ImageDerivative(BaseModel):
+    thumbnail_path: str | None = None
+    webp_path: str | None = None
+
+
 class PostCreateRequest(BaseModel):
     content: str = Field(..., max_length=300)
     image1: str | None = None
     image2: str | None = None
     image3: str | None = None
     is_with_teacher: bool = False
+    # 원본 이미지 URL별 파생 이미지 경로
+    derivatives: dict[str, ImageDerivative] = Field(default_factory=dict)
 
 
 class PostUpdateRequest(BaseModel):
@@ -17,6 +24,8 @@ class PostUpdateRequest(BaseModel):
     image2: str | None = None
     image3: str | None = None
     is_with_teacher: Optional[bool] = False
+    # 원본 이미지 URL별 파생 이미지 경로
+    derivatives: dict[str, ImageDerivative] = Field(default_factory=dict)
 
 
 class PostDeleteRequest(BaseModel):
@@ -1,6 +1,8 @@
 from fastapi import File
 from ulid import ulid  # type: ignore
 
+from src.app.common.utils.like_counter import like_counter
+from src.app.common.utils.post_cache import post_cache
 from src.app.v1.post.repository.post import PostRepository  # type: ignore
 from src.app.v1.post.schema.post import PostCreateRequest, PostUpdateRequest
 
@@ -12,8 +14,11 @@ class PostService:
     def create_post(self, user_id: str, post: PostCreateRequest):
         return self.post_repository.create_post(user_id=user_id, post_id=ulid(), post=post)
 
-    def get_post(self, post_id: str):
-        return self.post_repository.get_post(post_id=post_id)
+    async def get_post(self, post_id: str):
+        post = await post_cache.get_post(post_id, lambda: self.post_repository.get_post(post_id=post_id))
+        # 아직 DB에 반영되지 않은 좋아요 수 반영
+        await like_counter.apply([post])
+        return post
 
     def update_post(self, user_id: str, post_id: str, post: PostUpdateRequest):
         return self.post_repository.update_post(user_id=user_id, post_id=post_id, post=post)
@@ -28,14 +33,30 @@ class PostService:
         if like == False:
             return self.post_repository.unlike_post(user_id, post_id)
 
-    def get_like_post(self, user_id: str, post_id: str):
-        return self.post_repository.get_like_post(user_id=user_id, post_id=post_id)
-
-    def get_posts(self, page: int):
-        return self.post_repository.get_posts(page=page)
-
-    def get_my_posts(self, user_id: str, page: int):
-        return self.post_repository.get_user_posts(user_id=user_id, page=page)
-
-    def get_user_posts(self, user_id: str, page: int):
-        return self.post_repository.get_user_posts(user_id=user_id, page=page)
+    async def get_like_post(self, user_id: str, post_id: str):
+        like = await self.post_repository.get_like_post(user_id=user_id, post_id=post_id)
+        await like_counter.apply([like])
+        return like
+
+    def get_like_posts(self, user_id: str, post_ids: list[str]):
+        return self.post_repository.get_like_posts(user_id=user_id, post_ids=list(dict.fromkeys(post_ids)))
+
+    async def search_posts(self, keyword: str, cursor: str | None = None):
+        result = await self.post_repository.search_posts(keyword=keyword.strip(), cursor=cursor)
+        await like_counter.apply(result["posts"])
+        return result
+
+    async def get_posts(self, page: int, cursor: str | None = None):
+        feed = await post_cache.get_feed_page(None, page, cursor, lambda: self.post_repository.get_posts(page=page, cursor=cursor))
+        await like_counter.apply(feed["posts"])
+        return feed
+
+    def get_my_posts(self, user_id: str, page: int, cursor: str | None = None):
+        return self.get_user_posts(user_id=user_id, page=page, cursor=cursor)
+
+    async def get_user_posts(self, user_id: str, page: int, cursor: str | None = None):
+        feed = await post_cache.get_feed_page(
+            int(user_id), page, cursor, lambda: self.post_repository.get_user_posts(user_id=user_id, page=page, cursor=cursor)
+        )
+        await like_counter.apply(feed["posts"])
+        return feed
@@ -13,7 +13,7 @@ class Student(Base):
     career_aspiration: Mapped[str] = mapped_column(String(30), nullable=True)
     interest: Mapped[str] = mapped_column(String(30), nullable=True)
     description: Mapped[str] = mapped_column(String(25), nullable=True)
-    user_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("users.id"), nullable=False)
+    user_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("users.id"), nullable=False, index=True)
 
     # one-to-one 관계
     user = relationship("User", back_populates="student", uselist=False)
@@ -6,6 +6,7 @@ import re
 import string
 import uuid
 from datetime import datetime, timedelta
+from functools import partial
 from typing import Union
 
 import jwt
@@ -27,6 +28,7 @@ from src.app.common.utils.redis_utils import (
     mark_jti_used,
     save_to_redis,
 )
+from src.app.common.utils.room_header import room_header_cache
 from src.app.common.utils.security import (
     ALGORITHM,
     SECRET_KEY,
@@ -43,6 +45,7 @@ from src.app.common.utils.verify_password import (
     verify_password,
 )
 from src.app.v1.auth.repository.oauth_repository import OAuthRepository
+from src.app.v1.post.repository.post import PostRepository
 from src.app.v1.user.entity.organization import Organization
 from src.app.v1.user.entity.student import Student
 from src.app.v1.user.entity.teacher import Teacher
@@ -61,6 +64,7 @@ from src.app.v1.user.schema.responseDto import (
     TeacherAddProfileResponse,
     StudentAddProfileResponse,
 )
+from src.config.database.postgresql import run_after_commit
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
@@ -520,6 +524,9 @@ class UserService:
 
         try:
             new_group = await self.user_repo.create_study_group(session, student_id, teacher_id)
+            # 선생님과 함께 쓴 게시글의 피드 카드에 담당 선생님 반영
+            await PostRepository.refresh_user_post_cards(session, current_user["user_id"])
+            await session.commit()
             logger.info(f"Study group created: {new_group}")
             return {"message": "study group이 성공적으로 생성되었습니다."}
         except Exception as e:
@@ -709,7 +716,11 @@ class UserService:
         if "description" in update_data:
             student.description = update_data["description"]
 
+        # 피드 카드에 노출되는 닉네임/프로필 정보 갱신
+        await PostRepository.refresh_user_post_cards(session, user.id)
         await session.commit()
+        # 채팅방 헤더에 노출되는 닉네임/프로필 이미지 캐시 무효화
+        await run_after_commit(partial(room_header_cache.invalidate_user, user.id))
 
         return {"message": "학생 프로필이 성공적으로 업데이트되었습니다."}
 
@@ -751,7 +762,11 @@ class UserService:
         if "position" in update_data:
             organization.position = update_data["position"]
 
+        # 피드 카드에 노출되는 닉네임/프로필 정보 갱신
+        await PostRepository.refresh_user_post_cards(session, user.id)
         await session.commit()
+        # 채팅방 헤더에 노출되는 닉네임/프로필 이미지 캐시 무효화
+        await run_after_commit(partial(room_header_cache.invalidate_user, user.id))
 
         return {"message": "선생님 프로필이 성공적으로 업데이트되었습니다."}
 
@@ -8,8 +8,10 @@ from src.app.v1.chat.entity.room import Room
 from src.app.v1.comment.entity.comment import Comment
 from src.app.v1.comment.entity.comment_tag import CommentTag
 from src.app.v1.post.entity.post import Post
+from src.app.v1.post.entity.post_card import PostCard
 from src.app.v1.post.entity.post_image import PostImage
 from src.app.v1.post.entity.post_like import PostLike
+from src.app.v1.post.entity.post_like_flush import PostLikeFlush
 from src.app.v1.user.entity.organization import Organization
 from src.app.v1.user.entity.student import Student
 from src.app.v1.user.entity.study_group import StudyGroup
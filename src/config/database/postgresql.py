@@ -1,7 +1,12 @@
+import logging
 import os
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Awaitable, Callable
 
 from dotenv import load_dotenv
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
@@ -10,6 +15,8 @@ from sqlalchemy.orm import declarative_base
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 
 DATABASE_URL = os.environ.get("PG_DATABASE_URL")
 
@@ -32,4 +39,93 @@ SessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+# 요청 범위 세션용 (요청 트랜잭션에 savepoint로 참여)
+RequestSessionLocal = async_sessionmaker(
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+    join_transaction_mode="create_savepoint",
+)
+
 Base = declarative_base()
+
+
+class RequestSession:
+    """
+    HTTP 요청 하나가 공유하는 DB 세션입니다. (처음 사용할 때 커넥션을 한 번만 가져옴)
+
+    세션은 요청 트랜잭션에 savepoint로 참여하므로 리포지토리의 commit/rollback은 savepoint 단위로 동작하고,
+    실제 commit은 요청이 끝날 때 한 번만 수행됩니다.
+    """
+
+    def __init__(self):
+        self._connection: AsyncConnection | None = None
+        self._session: AsyncSession | None = None
+        self._after_commit: list[Callable[[], Awaitable]] = []
+        self.closed = False
+
+    async def get(self) -> AsyncSession:
+        if self._session is None:
+            self._connection = await engine.connect()
+            await self._connection.begin()
+            self._session = RequestSessionLocal(bind=self._connection)
+        return self._session
+
+    async def close(self, commit: bool):
+        self.closed = True
+        if self._session is not None:
+            try:
+                await self._session.close()
+                if commit:
+                    await self._connection.commit()
+                else:
+                    await self._connection.rollback()
+            finally:
+                await self._connection.close()
+                self._session = None
+                self._connection = None
+
+        if commit:
+            for callback in self._after_commit:
+                await _run_callback(callback)
+        self._after_commit.clear()
+
+    def add_after_commit(self, callback: Callable[[], Awaitable]):
+        self._after_commit.append(callback)
+
+
+request_session: ContextVar[RequestSession | None] = ContextVar("request_session", default=None)
+
+
+@asynccontextmanager
+async def get_db_session() -> AsyncIterator[AsyncSession]:
+    """
+    요청 범위 세션이 있으면 그 세션을, 없으면(웹소켓, 백그라운드 작업 등) 새 세션을 제공합니다.
+    요청 범위 세션은 여기서 닫지 않고 요청이 끝날 때 미들웨어가 정리합니다.
+    """
+    scope = request_session.get()
+    if scope is not None and not scope.closed:
+        yield await scope.get()
+        return
+
+    async with SessionLocal() as session:
+        yield session
+
+
+async def _run_callback(callback: Callable[[], Awaitable]):
+    try:
+        await callback()
+    except Exception as e:
+        logger.error(f"After-commit callback failed: {e}")
+
+
+async def run_after_commit(callback: Callable[[], Awaitable]):
+    """
+    요청 트랜잭션이 실제로 commit된 뒤에 callback을 실행합니다. (캐시 무효화 등)
+    요청 범위 세션이 없으면 바로 실행하므로, 호출하는 쪽에서 commit 이후에 호출해야 합니다.
+    """
+    scope = request_session.get()
+    if scope is not None and not scope.closed:
+        scope.add_after_commit(callback)
+        return
+    await _run_callback(callback)
@@ -16,7 +16,13 @@ from dotenv import load_dotenv
 from fastapi import APIRouter, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.app.common.middlewares.db_session import DBSessionMiddleware
+from src.app.common.utils.like_counter import like_counter
+from src.app.common.utils.message_buffer import message_buffer
+from src.app.common.utils.room_state import room_state_cache
 from src.app.common.utils.websocket_manager import manager
+from src.app.v1.chat.repository.room_repository import RoomRepository
+from src.config.database.mongo import mongodb
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
@@ -37,6 +43,9 @@ load_dotenv()
 KAFKA_SERVER = os.environ.get("KAFKA_SERVER")
 CHAT_TOPIC = os.environ.get("CHAT_TOPIC")
 CONSUMER_GROUP = os.environ.get("CONSUMER_GROUP")
+KAFKA_LINGER_MS = int(os.environ.get("KAFKA_LINGER_MS", "5"))
+KAFKA_MAX_BATCH_SIZE = int(os.environ.get("KAFKA_MAX_BATCH_SIZE", "65536"))
+KAFKA_COMPRESSION = os.environ.get("KAFKA_COMPRESSION", "gzip")
 
 
 @asynccontextmanager
@@ -46,6 +55,11 @@ async def lifespan(app: FastAPI):
         bootstrap_servers=KAFKA_SERVER,  # type: ignore
         # value_serializer=lambda x: json.dumps(x).encode("utf-8"),
         acks="all",
+        # 파이프라인 전송: 짧게 모아서 압축 배치로 전송, 재시도 시에도 파티션 내 순서 유지
+        enable_idempotence=True,
+        linger_ms=KAFKA_LINGER_MS,
+        max_batch_size=KAFKA_MAX_BATCH_SIZE,
+        compression_type=KAFKA_COMPRESSION or None,
     )
     await producer.start()  # type: ignore
 
@@ -63,16 +77,28 @@ async def lifespan(app: FastAPI):
     )
     await consumer.start()
 
+    # 메시지 히스토리 커서 조회용 인덱스 보장 (실패해도 서버는 기동)
+    try:
+        await RoomRepository.ensure_message_indexes(await mongodb.get_engine())
+    except Exception as e:
+        logger.error(f"Failed to ensure chat message indexes: {e}")
+
+    await message_buffer.start()
     await manager.initialize(producer, consumer)
+    await room_state_cache.start()
+    await like_counter.start()
 
-    # Kafka consumer 작업 시작
-    asyncio.create_task(manager.consume_messages())
+    # Kafka consumer 작업은 manager.initialize에서 시작됨
     yield
 
     # Ensure clean shutdown
+    await like_counter.stop()
+    await room_state_cache.stop()
     await manager.stop()
     await producer.stop()  # type: ignore
     await consumer.stop()  # type: ignore
+    # 소비가 끝난 뒤 남은 메시지를 모두 저장
+    await message_buffer.stop()
 
 
 main_router = APIRouter(prefix="/api/v1")
@@ -90,6 +116,9 @@ main_router.include_router(websocket_router)
 app = FastAPI(debug=True, lifespan=lifespan)
 app.include_router(main_router)
 
+# 요청 단위 DB 세션 (리포지토리들이 하나의 커넥션/트랜잭션을 공유)
+app.add_middleware(DBSessionMiddleware)
+
 
 @app.middleware("http")
 async def cors_debugging(request: Request, call_next):
@@ -0,0 +1,227 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.app.common.utils import ai_context
+from src.app.common.utils.ai_context import (
+    APPEND_TURNS_SCRIPT,
+    AIContextCache,
+    estimate_tokens,
+    get_context_key,
+    get_pending_key,
+    merge_turns,
+)
+from src.app.v1.chat.repository.room_repository import RoomRepository
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.commands.append((name, args, kwargs))
+
+    async def execute(self):
+        return [await getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+
+class FakeRedis:
+    """명령 하나(스크립트 포함)가 원자적으로 실행되는 Redis 흉내"""
+
+    def __init__(self):
+        self.values: dict = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def lrange(self, key, start, end):
+        return list(self.values.get(key, []))
+
+    async def rpush(self, key, *values):
+        self.values.setdefault(key, []).extend(values)
+
+    async def lpush(self, key, *values):
+        for value in values:
+            self.values.setdefault(key, []).insert(0, value)
+
+    async def expire(self, key, ttl):
+        pass
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+    async def eval(self, script, numkeys, key, pending_key, budget, ttl, *turns):
+        # APPEND_TURNS_SCRIPT와 같은 동작
+        assert script == APPEND_TURNS_SCRIPT and numkeys == 2
+        await asyncio.sleep(0)
+        items = self.values.setdefault(key, [])
+        items.extend(turns)
+        total, keep_from = 0, len(items)
+        for index in range(len(items) - 1, -1, -1):
+            total += estimate_tokens(json.loads(items[index])["content"])
+            if total > budget:
+                break
+            keep_from = index
+        if keep_from:
+            self.values.setdefault(pending_key, []).extend(items[:keep_from])
+            del items[:keep_from]
+        return keep_from
+
+
+@pytest.fixture
+def context(monkeypatch):
+    engine = object()
+    mongo = SimpleNamespace(get_engine=lambda: asyncio.sleep(0, result=engine))
+    cache = AIContextCache(client=None, mongo=mongo)
+    cache._redis = FakeRedis()
+    cache.summarized = []
+
+    async def fake_fold_summary(room_id, dropped):
+        cache.summarized.append(dropped)
+
+    monkeypatch.setattr(cache, "_fold_summary", fake_fold_summary)
+    return cache
+
+
+def contents(turns: list[dict]) -> list[str]:
+    return [turn["content"][0] for turn in turns]
+
+
+def test_연속된_AI_조각_병합():
+    """50자 단위로 저장된 AI 답변 조각이 하나의 턴으로 합쳐지는지 테스트"""
+    turns = [
+        {"role": "user", "content": "질문"},
+        {"role": "assistant", "content": "첫 번째 조각. "},
+        {"role": "assistant", "content": "두 번째 조각."},
+    ]
+
+    assert merge_turns(turns) == [
+        {"role": "user", "content": "질문"},
+        {"role": "assistant", "content": "첫 번째 조각. 두 번째 조각."},
+    ]
+
+
+def test_토큰_예산_초과시_오래된_턴부터_제외(monkeypatch):
+    """토큰 예산을 넘으면 최근 턴만 남기는지 테스트"""
+    turns = [{"role": "user", "content": "가" * 100} for _ in range(5)]
+    monkeypatch.setattr(ai_context, "CONTEXT_TOKEN_BUDGET", estimate_tokens("가" * 100) * 2)
+
+    kept = AIContextCache._fit_budget(turns)
+
+    assert kept == turns[-2:]
+
+
+@pytest.mark.asyncio
+async def test_캐시가_없으면_Mongo_히스토리로_채움(context, monkeypatch):
+    """Redis에 컨텍스트가 없을 때 Mongo 최근 메시지로 채우고, 방금 보낸 질문은 중복시키지 않는지 테스트"""
+    messages = [  # 최신순
+        SimpleNamespace(user_type="student", message_type="text", content="지금 질문"),
+        SimpleNamespace(user_type="ai", message_type="text", content="답변 뒷부분"),
+        SimpleNamespace(user_type="ai", message_type="text", content="답변 앞부분 "),
+        SimpleNamespace(user_type="system", message_type="text", content="시스템 메시지"),
+        SimpleNamespace(user_type="student", message_type="image", content="https://example.com/a.png"),
+        SimpleNamespace(user_type="student", message_type="text", content="이전 질문"),
+    ]
+    calls = []
+
+    async def fake_find_messages_by_room(room_id, engine, page, page_size):
+        calls.append(room_id)
+        return messages
+
+    monkeypatch.setattr(RoomRepository, "find_messages_by_room", fake_find_messages_by_room)
+
+    first = await context.build_messages(1, "지금 질문")
+    second = await context.build_messages(1, "지금 질문")
+
+    assert first == [
+        {"role": "user", "content": "이전 질문"},
+        {"role": "assistant", "content": "답변 앞부분 답변 뒷부분"},
+        {"role": "user", "content": "지금 질문"},
+    ]
+    assert second == first
+    assert calls == [1]  # 두 번째부터는 Redis에서 읽음
+
+
+@pytest.mark.asyncio
+async def test_예산을_넘은_턴은_요약으로_넘김(context, monkeypatch):
+    """답변을 추가해 예산을 넘으면 오래된 턴을 잘라 요약 대상으로 넘기는지 테스트"""
+    monkeypatch.setattr(ai_context, "CONTEXT_TOKEN_BUDGET", estimate_tokens("가" * 100) * 2)
+
+    await context.append_exchange(1, "가" * 100, "나" * 100)
+    await context.append_exchange(1, "다" * 100, "라" * 100)
+    await asyncio.gather(*context._tasks)
+
+    remaining = [json.loads(raw)["content"][0] for raw in context._redis.values[get_context_key(1)]]
+    assert remaining == ["다", "라"]
+    assert [contents(dropped) for dropped in context.summarized] == [["가", "나"]]
+    assert not context._redis.values.get(get_pending_key(1))
+
+
+@pytest.mark.asyncio
+async def test_동시에_끝난_답변도_턴을_잃지_않음(context, monkeypatch):
+    """두 답변이 동시에 추가되어도 예산 안의 최근 턴은 모두 남는지 테스트"""
+    monkeypatch.setattr(ai_context, "CONTEXT_TOKEN_BUDGET", estimate_tokens("가" * 100) * 4)
+    await context.append_exchange(1, "가" * 100, "나" * 100)
+
+    await asyncio.gather(context.append_exchange(1, "다" * 100, "라" * 100), context.append_exchange(1, "마" * 100, "바" * 100))
+
+    remaining = [json.loads(raw)["content"][0] for raw in context._redis.values[get_context_key(1)]]
+    assert sorted(remaining) == ["다", "라", "마", "바"]
+
+
+@pytest.mark.asyncio
+async def test_요약_중에_잘린_턴도_이어서_요약(context, monkeypatch):
+    """요약이 진행 중일 때 잘린 턴도 버리지 않고, 진행 중인 요약이 끝난 뒤 이어서 요약하는지 테스트"""
+    monkeypatch.setattr(ai_context, "CONTEXT_TOKEN_BUDGET", estimate_tokens("가" * 100) * 2)
+    release = asyncio.Event()
+    summarized = []
+
+    async def slow_fold_summary(room_id, dropped):
+        summarized.append(contents(dropped))
+        await release.wait()
+
+    monkeypatch.setattr(context, "_fold_summary", slow_fold_summary)
+
+    await context.append_exchange(1, "가" * 100, "나" * 100)
+    await context.append_exchange(1, "다" * 100, "라" * 100)
+    await asyncio.sleep(0)
+    await context.append_exchange(1, "마" * 100, "바" * 100)  # 첫 요약이 진행 중
+    assert len(context._tasks) == 1
+
+    release.set()
+    await asyncio.gather(*context._tasks)
+
+    assert summarized == [["가", "나"], ["다", "라"]]
+    assert not context._tasks and 1 not in context._summarizing
+
+
+@pytest.mark.asyncio
+async def test_요약_실패시_턴을_대기_리스트에_보존(context, monkeypatch):
+    """요약 호출이 실패해도 잘린 턴이 대기 리스트에 남아 다음 요약 때 다시 시도되는지 테스트"""
+    monkeypatch.setattr(ai_context, "CONTEXT_TOKEN_BUDGET", estimate_tokens("가" * 100) * 2)
+
+    async def failing_fold_summary(room_id, dropped):
+        raise ConnectionError("openai unavailable")
+
+    monkeypatch.setattr(context, "_fold_summary", failing_fold_summary)
+
+    await context.append_exchange(1, "가" * 100, "나" * 100)
+    await context.append_exchange(1, "다" * 100, "라" * 100)
+    await asyncio.gather(*context._tasks)
+
+    pending = [json.loads(raw) for raw in context._redis.values[get_pending_key(1)]]
+    assert contents(pending) == ["가", "나"]
+    assert 1 not in context._summarizing
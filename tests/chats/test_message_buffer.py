@@ -0,0 +1,126 @@
+from datetime import datetime
+
+import pytest
+from pymongo.errors import BulkWriteError
+
+from src.app.common.utils import message_buffer as buffer_module
+from src.app.common.utils.message_buffer import MessageWriteBuffer
+
+
+class FakeCollection:
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.batches: list[list[dict]] = []
+        self.summary_operations: list = []
+
+    async def insert_many(self, documents, ordered=True):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("mongo unavailable")
+        self.batches.append(list(documents))
+
+    async def bulk_write(self, operations, ordered=True):
+        self.summary_operations.extend(operations)
+
+
+class FakeEngine:
+    def __init__(self, collection: FakeCollection):
+        self.collection = collection
+
+    def get_collection(self, model):
+        return self.collection
+
+
+class FakeMongo:
+    def __init__(self, collection: FakeCollection):
+        self.engine = FakeEngine(collection)
+
+    async def get_engine(self):
+        return self.engine
+
+
+def make_message(content: str, room_id: int = 1) -> dict:
+    return {
+        "room_id": room_id,
+        "title": "테스트 방",
+        "sender_id": 1,
+        "content": content,
+        "message_type": "text",
+        "filename": "None",
+        "user_type": "student",
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
+@pytest.fixture(autouse=True)
+def fast_retry(monkeypatch):
+    monkeypatch.setattr(buffer_module, "FLUSH_SIZE", 2)
+    monkeypatch.setattr(buffer_module.asyncio, "sleep", _no_sleep)
+
+
+async def _no_sleep(_):
+    return None
+
+
+@pytest.mark.asyncio
+async def test_배치_단위_insert_many():
+    """FLUSH_SIZE 단위로 묶어서 저장하는지 테스트"""
+    collection = FakeCollection()
+    buffer = MessageWriteBuffer(FakeMongo(collection))
+    for i in range(3):
+        buffer.add(make_message(f"메시지 {i}"))
+
+    await buffer.flush()
+
+    assert [len(batch) for batch in collection.batches] == [2, 1]
+    assert buffer.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_flush_실패시_재시도():
+    """일시적인 오류 후 재시도로 저장되는지 테스트"""
+    collection = FakeCollection(failures=2)
+    buffer = MessageWriteBuffer(FakeMongo(collection))
+    buffer.add(make_message("재시도"))
+
+    await buffer.flush()
+
+    assert len(collection.batches) == 1
+    assert collection.batches[0][0]["content"] == "재시도"
+
+
+@pytest.mark.asyncio
+async def test_중복키_오류는_성공으로_처리():
+    """이미 저장된 문서로 인한 중복 키 오류는 다시 시도하지 않는지 테스트"""
+
+    class DuplicateCollection(FakeCollection):
+        async def insert_many(self, documents, ordered=True):
+            raise BulkWriteError({"writeErrors": [{"index": 0, "code": 11000}]})
+
+    buffer = MessageWriteBuffer(FakeMongo(DuplicateCollection()))
+    buffer.add(make_message("중복"))
+
+    await buffer.flush()
+
+    assert buffer.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_저장된_메시지로_방_요약_갱신(monkeypatch):
+    """flush된 메시지 수만큼 방별 카운트를 올리고 가장 최근 메시지를 요약에 기록하는지 테스트"""
+    monkeypatch.setattr(buffer_module, "FLUSH_SIZE", 10)
+    collection = FakeCollection()
+    buffer = MessageWriteBuffer(FakeMongo(collection))
+    for message in [make_message("첫번째"), make_message("다른 방", room_id=2), make_message("마지막")]:
+        buffer.add(message)
+
+    await buffer.flush()
+
+    updates = {}
+    for operation in collection.summary_operations:
+        updates.setdefault(operation._filter["_id"], []).append(operation._doc)
+    assert updates[1][1]["$inc"] == {"message_count": 2}
+    assert updates[1][2]["$set"]["last_message"] == "마지막"
+    assert updates[2][1]["$inc"] == {"message_count": 1}
+    # 버퍼가 센 메시지는 백필 집계에서 제외되도록 표시
+    assert all(document["counted"] for document in collection.batches[0])
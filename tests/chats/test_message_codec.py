@@ -0,0 +1,63 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from src.app.common.utils.message_codec import (
+    decode_record,
+    encode_message,
+    from_epoch_ms,
+    to_epoch_ms,
+)
+
+
+def make_message(**overrides) -> dict:
+    message = {
+        "room_id": 7,
+        "title": "수학 보고서",
+        "sender_id": 3,
+        "content": "안녕하세요",
+        "message_type": "text",
+        "filename": "None",
+        "user_type": "student",
+        "timestamp": "2024-12-05T10:20:30.123000",
+    }
+    message.update(overrides)
+    return message
+
+
+def test_압축_레코드_왕복_변환():
+    """압축 포맷으로 인코딩한 레코드가 기존 메시지 형태로 복원되는지 테스트"""
+    message = make_message(stream_id="abc")
+
+    value = encode_message(message)
+    record, title = decode_record(value)
+
+    assert title == "수학 보고서"
+    assert record.to_message(title) == message
+    assert len(value) < len(json.dumps(message).encode("utf-8")) / 2
+
+
+def test_기존_JSON_레코드도_디코딩():
+    """배포 중 섞여 들어오는 기존 JSON 레코드를 그대로 읽는지 테스트"""
+    message = make_message(message_type="image", filename="a.png", content="https://example.com/a.png")
+
+    record, title = decode_record(encode_message(message, legacy_json=True))
+
+    assert title == "수학 보고서"
+    assert record.to_message(title) == message
+
+
+def test_알_수_없는_버전은_거부():
+    with pytest.raises(ValueError):
+        decode_record(b'[99,1,1,0,0,"x",0]')
+    with pytest.raises(ValueError):
+        decode_record(b'[1,7,3,0,0,"x",0]')  # 배포된 적 없는 v1 포맷
+
+
+def test_타임스탬프는_가장_가까운_밀리초로_변환():
+    """부동소수점 오차로 밀리초가 내림되어 1ms씩 밀리지 않는지 테스트"""
+    start = 1733361630000
+
+    assert all(to_epoch_ms(from_epoch_ms(ms)) == ms for ms in range(start, start + 1000))
+    assert to_epoch_ms(datetime(2024, 12, 5, 10, 20, 30, 999)) == to_epoch_ms(datetime(2024, 12, 5, 10, 20, 30, 1000))
@@ -0,0 +1,64 @@
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+
+from src.app.v1.chat.entity.message import Message
+from src.app.v1.chat.repository.room_repository import RoomRepository
+from src.app.v1.chat.service.room_service import (
+    decode_message_cursor,
+    encode_message_cursor,
+)
+
+
+class FakeEngine:
+    def __init__(self):
+        self.calls: list[tuple] = []
+
+    async def find(self, model, *queries, sort=None, skip=0, limit=None):
+        self.calls.append((queries, sort, skip, limit))
+        return []
+
+
+def make_message() -> Message:
+    return Message(
+        room_id=1,
+        title="방",
+        sender_id=1,
+        message_type="text",
+        filename="None",
+        content="안녕",
+        user_type="student",
+        timestamp=datetime(2024, 12, 5, 10, 20, 30, 123000),
+    )
+
+
+def test_메시지_커서_왕복_변환():
+    """커서가 (timestamp, _id)로 정확히 복원되는지 테스트"""
+    message = make_message()
+
+    timestamp, message_id = decode_message_cursor(encode_message_cursor(message))
+
+    assert timestamp == message.timestamp
+    assert message_id == message.id
+
+
+def test_잘못된_커서는_400():
+    with pytest.raises(HTTPException) as exc_info:
+        decode_message_cursor("not-a-cursor")
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_커서_조회는_skip_없이_키_범위로_조회():
+    """커서 이전 메시지를 skip 없이 (timestamp, _id) 범위 조건으로 조회하는지 테스트"""
+    engine = FakeEngine()
+    before = (datetime(2024, 12, 5), ObjectId())
+
+    await RoomRepository.find_messages_before(1, engine, before, limit=21)
+
+    queries, sort, skip, limit = engine.calls[0]
+    assert skip == 0 and limit == 21
+    assert "$or" in str(queries[1])
+    assert [dict(expression) for expression in sort] == [{"timestamp": -1}, {"_id": -1}]
@@ -0,0 +1,140 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.app.common.utils import websocket_manager as websocket_manager_module
+from src.app.common.utils.room_channel import RoomChannelRouter, get_room_channel
+from src.app.common.utils.websocket_manager import ConnectionManager
+
+
+class FakePubSub:
+    def __init__(self):
+        self.channels: list[str] = []
+        self.calls: list[tuple[str, str]] = []
+        self.events: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, channel):
+        self.calls.append(("subscribe", channel))
+        self.channels.append(channel)
+
+    async def unsubscribe(self, channel):
+        self.calls.append(("unsubscribe", channel))
+        self.channels.remove(channel)
+
+    async def get_message(self, ignore_subscribe_messages=True, timeout=1.0):
+        try:
+            return await asyncio.wait_for(self.events.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def aclose(self):
+        pass
+
+
+class FakeRedis:
+    def __init__(self, fail_publish: bool = False):
+        self.fail_publish = fail_publish
+        self.pubsubs: list[FakePubSub] = []
+        self.published: list[tuple[str, str]] = []
+
+    def pubsub(self):
+        pubsub = FakePubSub()
+        self.pubsubs.append(pubsub)
+        return pubsub
+
+    async def publish(self, channel, frame):
+        if self.fail_publish:
+            raise ConnectionError("redis down")
+        self.published.append((channel, frame))
+        # 구독 중인 워커에 전달
+        for pubsub in self.pubsubs:
+            if channel in pubsub.channels:
+                pubsub.events.put_nowait({"type": "message", "channel": channel, "data": frame})
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.frames: list[str] = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, frame: str):
+        self.frames.append(frame)
+
+    async def close(self, code: int = 1000):
+        pass
+
+
+def make_router(redis: FakeRedis, on_frame=None) -> RoomChannelRouter:
+    router = RoomChannelRouter(on_frame=on_frame or (lambda room_id, frame: None))
+    router._redis = redis
+    router._pubsub = redis.pubsub()
+    return router
+
+
+def make_manager(redis: FakeRedis) -> ConnectionManager:
+    manager = ConnectionManager()
+    manager.room_channels = make_router(redis, on_frame=manager.deliver_local)
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_방의_첫_연결에서만_구독하고_마지막_연결이_끊기면_해제(monkeypatch):
+    """같은 방에 연결이 여러 개여도 채널은 한 번만 구독하고, 모든 연결이 끊겨야 구독을 해제하는지 테스트"""
+    monkeypatch.setattr(websocket_manager_module.room_state_cache, "evict", lambda room_id: None)
+    redis = FakeRedis()
+    manager = make_manager(redis)
+    pubsub = manager.room_channels._pubsub
+    room = SimpleNamespace(id=1)
+
+    await manager.connect(FakeWebSocket(), room, user_id=1)
+    await manager.connect(FakeWebSocket(), room, user_id=2)
+    await manager.disconnect(1, 1)
+    assert pubsub.calls == [("subscribe", get_room_channel(1))]
+
+    await manager.disconnect(1, 2)
+    assert pubsub.calls == [("subscribe", get_room_channel(1)), ("unsubscribe", get_room_channel(1))]
+
+    # 이미 해제한 방은 다시 해제하지 않음
+    await manager.room_channels.unsubscribe(1)
+    assert len(pubsub.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_방_채널_메시지를_해당_방_로컬_연결로_전달():
+    """공유 pubsub으로 받은 프레임을 채널 이름의 방 번호로 찾아 그 방의 로컬 연결에만 전달하는지 테스트"""
+    redis = FakeRedis()
+    manager = make_manager(redis)
+    sockets = {room_id: FakeWebSocket() for room_id in (1, 2)}
+    for room_id, websocket in sockets.items():
+        await manager.connect(websocket, SimpleNamespace(id=room_id), user_id=room_id)
+    await manager.room_channels.start()
+
+    await manager.room_channels.publish(2, '{"content":"안녕"}')
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+    assert sockets[1].frames == []
+    assert sockets[2].frames == ['{"content":"안녕"}']
+    await manager.room_channels.stop()
+    for room_id in sockets:
+        await manager.active_connections[room_id][room_id].close()
+
+
+@pytest.mark.asyncio
+async def test_publish_실패시_로컬_연결에_직접_전달(monkeypatch):
+    """Redis publish가 실패해도 이 워커의 방 연결에는 프레임이 전달되는지 테스트"""
+    monkeypatch.setattr(websocket_manager_module, "message_buffer", SimpleNamespace(add=lambda message: None))
+    redis = FakeRedis(fail_publish=True)
+    manager = make_manager(redis)
+    websocket = FakeWebSocket()
+    await manager.connect(websocket, SimpleNamespace(id=1), user_id=1)
+
+    await manager.broadcast_kafka_message({"room_id": 1, "content": "안녕"})
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    assert websocket.frames == ['{"room_id":1,"content":"안녕"}']
+    await manager.active_connections[1][1].close()
@@ -0,0 +1,166 @@
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from src.app.common.utils.room_header import (
+    RoomHeader,
+    RoomHeaderCache,
+    get_room_header_key,
+    get_user_rooms_key,
+)
+from src.app.v1.chat.repository import room_repository
+from src.app.v1.chat.repository.room_repository import RoomRepository
+from src.app.v1.post.repository.post import PostRepository
+from src.app.v1.user.service.user_service import UserService
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.commands.append((name, args, kwargs))
+
+    async def execute(self):
+        return [await getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values: dict = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    async def sadd(self, key, *members):
+        self.values.setdefault(key, set()).update(str(member) for member in members)
+
+    async def smembers(self, key):
+        return self.values.get(key, set())
+
+    async def expire(self, key, ttl):
+        pass
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+
+class FakeResult:
+    def __init__(self, row):
+        self.row = row
+
+    def first(self):
+        return self.row
+
+
+class FakeSession:
+    def __init__(self, rows: list[dict]):
+        self.rows = rows
+        self.queries = []
+
+    async def execute(self, query):
+        self.queries.append(query)
+        return FakeResult(SimpleNamespace(_asdict=lambda: self.rows[len(self.queries) - 1]))
+
+
+def make_row(**overrides) -> dict:
+    row = {
+        "id": 1,
+        "title": "수학 보고서",
+        "help_checked": False,
+        "student_id": 10,
+        "teacher_id": 20,
+        "student_profile": "student.jpeg",
+        "teacher_profile": "teacher.jpeg",
+        "student_nickname": "학생",
+        "teacher_nickname": "선생님",
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = RoomHeaderCache()
+    cache._redis = FakeRedis()
+    monkeypatch.setattr(room_repository, "room_header_cache", cache)
+    return cache
+
+
+def use_session(monkeypatch, session: FakeSession):
+    @asynccontextmanager
+    async def fake_get_db_session():
+        yield session
+
+    monkeypatch.setattr(room_repository, "get_db_session", fake_get_db_session)
+
+
+@pytest.mark.asyncio
+async def test_방_헤더는_한번_조회후_캐시에서_읽음(cache, monkeypatch):
+    """방/참여자/프로필/닉네임을 한 번의 쿼리로 읽고, 다음 요청은 DB 없이 캐시에서 읽는지 테스트"""
+    session = FakeSession([make_row()])
+    use_session(monkeypatch, session)
+
+    first = await RoomRepository.get_room_header(1)
+    second = await RoomRepository.get_room_header(1)
+
+    assert first == second == RoomHeader(**make_row())
+    assert len(session.queries) == 1
+    assert str(session.queries[0]).count("LEFT OUTER JOIN") == 5
+    assert cache._redis.values[get_user_rooms_key(10)] == {"1"}
+    assert cache._redis.values[get_user_rooms_key(20)] == {"1"}
+
+
+@pytest.mark.asyncio
+async def test_프로필_변경시_참여한_방_헤더만_무효화(cache):
+    """사용자 무효화가 그 사용자가 참여한 방의 헤더만 지우는지 테스트"""
+    await cache.set(RoomHeader(**make_row()))
+    await cache.set(RoomHeader(**make_row(id=2, student_id=11)))
+
+    await cache.invalidate_user(10)
+
+    assert get_room_header_key(1) not in cache._redis.values
+    assert get_room_header_key(2) in cache._redis.values
+    assert get_user_rooms_key(10) not in cache._redis.values
+
+
+@pytest.mark.asyncio
+async def test_닉네임_변경후_방_헤더에_새_닉네임_반영(cache, monkeypatch):
+    """학생 프로필 수정이 commit된 뒤 방 헤더 캐시를 무효화해 새 닉네임을 다시 읽는지 테스트"""
+    use_session(monkeypatch, FakeSession([make_row(), make_row(student_nickname="새닉네임")]))
+    monkeypatch.setattr("src.app.v1.user.service.user_service.room_header_cache", cache)
+    assert (await RoomRepository.get_room_header(1)).student_nickname == "학생"
+
+    user = SimpleNamespace(id=10, tag=SimpleNamespace(nickname="학생"), student=SimpleNamespace(), profile_image=None)
+
+    async def get_students_profile(user_id, session):
+        return user
+
+    async def refresh_user_post_cards(session, user_id):
+        pass
+
+    class ProfileSession:
+        async def commit(self):
+            pass
+
+    monkeypatch.setattr(PostRepository, "refresh_user_post_cards", refresh_user_post_cards)
+    service = UserService(user_repo=SimpleNamespace(get_students_profile=get_students_profile), storage_service=None)
+
+    await service.update_student_profile(10, {"nickname": "새닉네임"}, ProfileSession())
+
+    assert (await RoomRepository.get_room_header(1)).student_nickname == "새닉네임"
@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from src.app.common.utils import room_state as room_state_module
+from src.app.common.utils.room_state import RoomState, RoomStateCache
+
+
+class FakePubSub:
+    def __init__(self, events: list):
+        self.events = events
+        self.closed = False
+
+    async def subscribe(self, channel):
+        pass
+
+    async def listen(self):
+        for event in self.events:
+            if isinstance(event, Exception):
+                raise event
+            yield event
+        await asyncio.Event().wait()  # 연결이 유지되는 동안 대기
+
+    async def aclose(self):
+        self.closed = True
+
+
+class FakeRedis:
+    def __init__(self, connections: list[list]):
+        self.pubsubs = [FakePubSub(events) for events in connections]
+        self.created = 0
+
+    def pubsub(self):
+        pubsub = self.pubsubs[self.created]
+        self.created += 1
+        return pubsub
+
+
+@pytest.mark.asyncio
+async def test_Redis_연결이_끊겨도_다시_구독(monkeypatch):
+    """pub/sub 연결 오류 후 리스너가 종료되지 않고 다시 구독하며, 놓친 이벤트가 있을 수 있는 캐시는 비우는지 테스트"""
+    monkeypatch.setattr(room_state_module, "ROOM_STATE_RECONNECT_DELAY", 0)
+    cache = RoomStateCache()
+    cache._redis = FakeRedis([[ConnectionError("redis down")], []])
+    cache._states[1] = RoomState(room_id=1, title="방", help_checked=False)
+
+    await cache.start()
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    assert cache._redis.created == 2
+    assert cache._redis.pubsubs[0].closed
+    assert cache.get(1) is None
+
+    await cache.stop()
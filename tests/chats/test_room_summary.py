@@ -0,0 +1,199 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from src.app.common.utils import message_buffer as buffer_module
+from src.app.common.utils.message_buffer import MessageWriteBuffer
+from src.app.v1.chat.entity.message import Message
+from src.app.v1.chat.entity.room_summary import RoomSummary
+from src.app.v1.chat.repository.room_repository import RoomRepository
+
+
+class FakeMessageCollection:
+    def __init__(self, documents: list[dict]):
+        self.documents = documents
+
+    async def insert_many(self, documents, ordered=True):
+        self.documents.extend(documents)
+
+
+class FakeSummaryCollection:
+    """요약 갱신에 쓰는 연산($setOnInsert, $set, $inc, $push, $ne, $or)만 적용하는 Mongo 흉내"""
+
+    def __init__(self):
+        self.documents: dict[int, dict] = {}
+        self.pause_next: asyncio.Event | None = None
+        self.fail_before_apply = 0
+        self.fail_after_apply = 0
+
+    async def bulk_write(self, operations, ordered=True):
+        gate, self.pause_next = self.pause_next, None
+        if gate:
+            await gate.wait()
+        if self.fail_before_apply:
+            self.fail_before_apply -= 1
+            raise ConnectionError("mongo unavailable")
+        for operation in operations:
+            self.apply(operation._filter, operation._doc, operation._upsert)
+        if self.fail_after_apply:
+            # 서버에는 반영됐지만 응답을 받지 못한 경우
+            self.fail_after_apply -= 1
+            raise ConnectionError("connection reset")
+
+    def apply(self, filter: dict, update: dict, upsert: bool):
+        document = self.documents.get(filter["_id"])
+        if document is None:
+            if not upsert:
+                return
+            document = self.documents[filter["_id"]] = {"_id": filter["_id"], **update.get("$setOnInsert", {})}
+        elif not self.matches(document, filter):
+            return
+        document.update(update.get("$set", {}))
+        for key, value in update.get("$inc", {}).items():
+            document[key] = document.get(key, 0) + value
+        for key, value in update.get("$push", {}).items():
+            document[key] = (document.get(key, []) + value["$each"])[value["$slice"] :]
+
+    def matches(self, document: dict, filter: dict) -> bool:
+        for key, condition in filter.items():
+            value = document.get(key)
+            if key == "$or":
+                if not any(self.matches(document, sub) for sub in condition):
+                    return False
+            elif isinstance(condition, dict) and "$ne" in condition:
+                if condition["$ne"] in (value if isinstance(value, list) else [value]):
+                    return False
+            elif isinstance(condition, dict) and "$lte" in condition:
+                if value is None or value > condition["$lte"]:
+                    return False
+            elif value != condition:
+                return False
+        return True
+
+
+class FakeEngine:
+    def __init__(self, messages: list[dict]):
+        self.messages = FakeMessageCollection(messages)
+        self.summaries = FakeSummaryCollection()
+
+    def get_collection(self, model):
+        return self.summaries if model is RoomSummary else self.messages
+
+    async def find(self, model, *queries, **kwargs):
+        return [
+            RoomSummary(room_id=document["_id"], **{k: v for k, v in document.items() if k != "_id"})
+            for document in self.summaries.documents.values()
+        ]
+
+
+class FakeMongo:
+    def __init__(self, engine: FakeEngine):
+        self.engine = engine
+
+    async def get_engine(self):
+        return self.engine
+
+
+def make_message(content: str) -> dict:
+    return {
+        "room_id": 1,
+        "title": "테스트 방",
+        "sender_id": 1,
+        "content": content,
+        "message_type": "text",
+        "filename": "None",
+        "user_type": "student",
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    # 배포 이전에 저장되어 버퍼가 세지 않은 메시지 2개
+    old = [Message(**make_message(f"이전 {i}")).model_dump_doc() for i in range(2)]
+    for document in old:
+        del document["counted"]
+    engine = FakeEngine(old)
+
+    async def fake_find_latest_messages(mongo, room_ids):
+        # find_latest_messages 집계와 같은 결과
+        documents = [document for document in engine.messages.documents if document["room_id"] in room_ids]
+        if not documents:
+            return []
+        latest = max(documents, key=lambda document: document["timestamp"])
+        return [
+            {
+                "_id": 1,
+                "message_count": len(documents),
+                "uncounted_count": sum(1 for document in documents if document.get("counted") is not True),
+                "last_message": latest["content"],
+                "last_message_type": latest["message_type"],
+                "last_sender_id": latest["sender_id"],
+                "last_activity": latest["timestamp"],
+            }
+        ]
+
+    monkeypatch.setattr(RoomRepository, "find_latest_messages", staticmethod(fake_find_latest_messages))
+    return engine
+
+
+async def _no_sleep(_):
+    return None
+
+
+@pytest.mark.asyncio
+async def test_백필과_요약_반영_전의_flush가_겹쳐도_한번만_셈(engine):
+    """버퍼가 메시지를 저장했지만 아직 $inc 하기 전에 백필이 끼어들어도 메시지를 두 번 세지 않는지 테스트"""
+    buffer = MessageWriteBuffer(FakeMongo(engine))
+    for i in range(3):
+        buffer.add(make_message(f"새 메시지 {i}"))
+
+    gate = asyncio.Event()
+    engine.summaries.pause_next = gate
+    flush = asyncio.create_task(buffer.flush())
+    while len(engine.messages.documents) < 5:
+        await asyncio.sleep(0)
+
+    summaries = await RoomRepository.get_room_summaries(engine, [1])
+    assert summaries[1].message_count == 2  # 버퍼가 세지 않은 이전 메시지만 반영
+
+    gate.set()
+    await flush
+
+    assert engine.summaries.documents[1]["message_count"] == 5
+    assert engine.summaries.documents[1]["backfilled"] is True
+    assert engine.summaries.documents[1]["last_message"] == "새 메시지 2"
+
+    # 이미 백필된 방은 다시 더하지 않음
+    await RoomRepository.get_room_summaries(engine, [1])
+    assert engine.summaries.documents[1]["message_count"] == 5
+
+
+@pytest.mark.asyncio
+async def test_반영_후_응답을_못받은_요약_재시도는_중복되지_않음(engine, monkeypatch):
+    """요약 갱신이 반영된 뒤 오류가 나서 재시도해도 같은 배치를 두 번 세지 않는지 테스트"""
+    monkeypatch.setattr(buffer_module.asyncio, "sleep", _no_sleep)
+    buffer = MessageWriteBuffer(FakeMongo(engine))
+    engine.summaries.fail_after_apply = 1
+    buffer.add(make_message("첫 메시지"))
+    buffer.add(make_message("두 번째 메시지"))
+
+    await buffer.flush()
+
+    assert engine.summaries.documents[1]["message_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_요약_갱신이_끝내_실패하면_다음_flush에서_반영(engine, monkeypatch):
+    """재시도까지 실패한 요약 갱신을 버리지 않고 다음 flush에서 반영하는지 테스트"""
+    monkeypatch.setattr(buffer_module.asyncio, "sleep", _no_sleep)
+    buffer = MessageWriteBuffer(FakeMongo(engine))
+    engine.summaries.fail_before_apply = buffer_module.FLUSH_RETRIES + 1
+    buffer.add(make_message("메시지"))
+
+    await buffer.flush()
+    assert 1 not in engine.summaries.documents
+
+    await buffer.flush()  # 새 메시지가 없어도 재시도
+    assert engine.summaries.documents[1]["message_count"] == 1
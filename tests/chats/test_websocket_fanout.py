@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from src.app.common.utils import websocket_fanout
+from src.app.common.utils.websocket_fanout import ClientConnection, fan_out
+
+
+class FakeWebSocket:
+    def __init__(self, delay: float = 0):
+        self.delay = delay
+        self.frames: list[str] = []
+        self.closed_code: int | None = None
+
+    async def send_text(self, frame: str):
+        await asyncio.sleep(self.delay)
+        self.frames.append(frame)
+
+    async def close(self, code: int = 1000):
+        self.closed_code = code
+
+
+@pytest.mark.asyncio
+async def test_메시지_한번_직렬화_후_전달():
+    """모든 연결에 동일한 프레임이 전달되는지 테스트"""
+    sockets = [FakeWebSocket(), FakeWebSocket()]
+    connections = [ClientConnection(ws, room_id=1, user_id=i) for i, ws in enumerate(sockets)]
+
+    delivered = fan_out(connections, {"room_id": 1, "content": "안녕하세요"})
+    await asyncio.sleep(0.01)
+
+    assert delivered == 2
+    assert sockets[0].frames == sockets[1].frames == ['{"room_id":1,"content":"안녕하세요"}']
+    for connection in connections:
+        await connection.close()
+
+
+@pytest.mark.asyncio
+async def test_느린_클라이언트는_다른_연결을_막지_않고_퇴출됨(monkeypatch):
+    """느린 소켓의 큐가 넘쳐도 빠른 소켓은 계속 수신하고, 유예 시간 후 느린 소켓은 끊기는지 테스트"""
+    monkeypatch.setattr(websocket_fanout, "SEND_QUEUE_SIZE", 1)
+    monkeypatch.setattr(websocket_fanout, "SLOW_CLIENT_GRACE", 0)
+
+    evicted = []
+
+    async def on_evict(connection):
+        evicted.append(connection.user_id)
+
+    slow, fast = FakeWebSocket(delay=10), FakeWebSocket()
+    slow_conn = ClientConnection(slow, room_id=1, user_id=1, on_evict=on_evict)
+    fast_conn = ClientConnection(fast, room_id=1, user_id=2, on_evict=on_evict)
+
+    for i in range(4):
+        fan_out([slow_conn, fast_conn], {"seq": i})
+        await asyncio.sleep(0.001)
+    await asyncio.sleep(0.01)
+
+    assert len(fast.frames) == 4
+    assert evicted == [1]
+    assert slow.closed_code == 1013
+    await fast_conn.close()
+
+
+@pytest.mark.asyncio
+async def test_퇴출_task는_참조를_유지하고_예외를_로깅(caplog):
+    """전송 실패로 시작한 퇴출 task가 끝날 때까지 참조되고, 퇴출 처리 중 예외가 유실되지 않는지 테스트"""
+
+    class BrokenWebSocket(FakeWebSocket):
+        async def send_text(self, frame: str):
+            raise ConnectionError("socket closed")
+
+    async def on_evict(connection):
+        raise RuntimeError("disconnect failed")
+
+    connection = ClientConnection(BrokenWebSocket(), room_id=1, user_id=1, on_evict=on_evict)
+    connection.enqueue("frame")
+    while not connection._writer_task.done():
+        await asyncio.sleep(0)
+
+    assert len(connection._close_tasks) == 1
+    await asyncio.gather(*connection._close_tasks, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert not connection._close_tasks
+    assert "Failed to evict client: room=1, user=1: disconnect failed" in caplog.text
@@ -0,0 +1,234 @@
+import asyncio
+import base64
+import binascii
+import io
+import json
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from PIL import Image as PILImage
+
+from src.app.common.utils import websocket_manager as websocket_manager_module
+from src.app.common.utils.websocket_manager import ConnectionManager
+
+
+class FakeS3Client:
+    """boto3처럼 업로드가 끝나면 파일 객체를 닫는 가짜 S3 클라이언트"""
+
+    def __init__(self):
+        self.objects: dict[str, bytes] = {}
+        self.fileobjs: dict[str, object] = {}
+
+    def upload_fileobj(self, fileobj, bucket, key, ExtraArgs=None):
+        self.fileobjs[key] = fileobj
+        self.objects[key] = fileobj.read()
+        fileobj.close()
+
+
+def make_manager() -> ConnectionManager:
+    manager = ConnectionManager()
+    manager.s3_client = FakeS3Client()
+    manager.bucket_name = "bucket"
+    return manager
+
+
+def make_image_content(width: int = 400, height: int = 300) -> tuple[bytes, str]:
+    buffer = io.BytesIO()
+    PILImage.new("RGB", (width, height), "blue").save(buffer, format="JPEG")
+    data = buffer.getvalue()
+    return data, "data:image/jpeg;base64," + base64.b64encode(data).decode()
+
+
+def test_채팅_이미지_원본과_썸네일_업로드():
+    """업로드 후 boto3가 버퍼를 닫아도 썸네일이 만들어지고, 원본은 처음부터 온전히 올라가는지 테스트"""
+    manager = make_manager()
+    data, content = make_image_content()
+
+    thumbnail_path = manager._put_image(content, "chat_images/room_1/a.jpg", "image/jpeg")
+
+    assert thumbnail_path == "chat_images/room_1/a_thumbnail.webp"
+    assert manager.s3_client.objects["chat_images/room_1/a.jpg"] == data
+    assert manager.s3_client.objects[thumbnail_path].startswith(b"RIFF")
+
+
+@pytest.mark.parametrize("size", [6, 12, 13, 14])
+def test_청크_경계와_패딩에서_base64_디코딩(monkeypatch, size):
+    """청크 크기에 딱 맞거나 패딩(=, ==)으로 끝나는 입력도 한 번에 디코딩한 것과 같은지 테스트"""
+    monkeypatch.setattr(websocket_manager_module, "IMAGE_DECODE_CHUNK", 8)
+    data = bytes(range(size))
+    encoded = base64.b64encode(data).decode()
+
+    assert ConnectionManager._decode_base64_chunked(encoded).getvalue() == data
+    assert ConnectionManager._decode_base64_chunked("data:image/png;base64," + encoded).getvalue() == data
+
+
+@pytest.mark.parametrize("content", ["QUJDRA", "QUJD\nRA==", "QUJD!!=="])
+def test_잘못된_base64는_오류(monkeypatch, content):
+    """패딩이 틀리거나 base64 문자가 아닌 입력을 조용히 버리지 않고 오류로 처리하는지 테스트"""
+    monkeypatch.setattr(websocket_manager_module, "IMAGE_DECODE_CHUNK", 8)
+
+    with pytest.raises(binascii.Error):
+        ConnectionManager._decode_base64_chunked(content)
+
+
+@pytest.mark.asyncio
+async def test_잘못된_이미지_데이터는_400():
+    manager = make_manager()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await manager.upload_image_to_storage("data:image/png;base64,QUJDRA", 1, "a.png")
+
+    assert exc_info.value.status_code == 400
+    assert manager.s3_client.objects == {}
+
+
+def test_디코딩한_버퍼를_복사_없이_업로드():
+    """디코딩한 버퍼를 그대로 처음부터 S3에 넘기는지 테스트"""
+    manager = make_manager()
+    data, content = make_image_content()
+
+    manager._put_image(content, "chat_images/room_1/b.jpg", "image/jpeg")
+
+    fileobj = manager.s3_client.fileobjs["chat_images/room_1/b.jpg"]
+    assert isinstance(fileobj, io.BytesIO)
+    assert manager.s3_client.objects["chat_images/room_1/b.jpg"] == data
+
+
+class FakeProducer:
+    def __init__(self):
+        self.sent: list[tuple[bytes, bytes]] = []
+        self.futures: list[asyncio.Future] = []
+        self.waited: list[bytes] = []
+
+    async def send(self, topic, key, value):
+        self.sent.append((key, value))
+        future = asyncio.get_running_loop().create_future()
+        self.futures.append(future)
+        return future
+
+    async def send_and_wait(self, topic, key, value):
+        self.waited.append(value)
+
+
+def make_chat_message(content: str, room_id: int = 1) -> dict:
+    return {
+        "room_id": room_id,
+        "title": "방",
+        "sender_id": 1,
+        "content": content,
+        "message_type": "text",
+        "filename": "None",
+        "user_type": "student",
+        "timestamp": "2024-12-05T10:20:30.123000",
+    }
+
+
+@pytest.mark.asyncio
+async def test_pipelined_전송은_완료를_기다리지_않고_순서대로_적재():
+    """브로커 응답 전에도 다음 메시지를 보내고, 보낸 순서와 방 파티션 키가 유지되는지 테스트"""
+    manager = make_manager()
+    manager.producer = FakeProducer()
+    manager.producer_mode = "pipelined"
+
+    futures = [await manager.send_message(make_chat_message(f"메시지 {i}")) for i in range(3)]
+
+    assert not any(future.done() for future in futures)
+    assert [key for key, _ in manager.producer.sent] == [b"1"] * 3
+    assert [json.loads(value)["content"] for _, value in manager.producer.sent] == ["메시지 0", "메시지 1", "메시지 2"]
+
+
+@pytest.mark.asyncio
+async def test_pipelined_전송_실패는_콜백에서_로깅(caplog):
+    """await 하지 않은 전송 Future가 실패해도 예외가 유실되지 않고 실패한 메시지와 함께 로깅되는지 테스트"""
+    manager = make_manager()
+    manager.producer = FakeProducer()
+    manager.producer_mode = "pipelined"
+
+    future = await manager.send_message(make_chat_message("실패할 메시지"))
+    future.set_exception(ConnectionError("broker unavailable"))
+    await asyncio.sleep(0)
+
+    assert "Failed to send message to Kafka: broker unavailable" in caplog.text
+    assert "실패할 메시지" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_sync_모드는_메시지마다_전송_완료를_기다림():
+    manager = make_manager()
+    manager.producer = FakeProducer()
+    manager.producer_mode = "sync"
+
+    result = await manager.send_message(make_chat_message("동기 전송"))
+
+    assert result is None
+    assert manager.producer.sent == []
+    assert [json.loads(value)["content"] for value in manager.producer.waited] == ["동기 전송"]
+
+
+def make_chunk(content: str | None) -> SimpleNamespace:
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+
+async def make_stream(deltas: list, error: Exception | None = None):
+    for delta in deltas:
+        yield make_chunk(delta)
+    if error:
+        raise error
+
+
+def record_ai_frames(manager: ConnectionManager) -> tuple[list, list]:
+    local: list[dict] = []
+    sent: list[dict] = []
+
+    async def fake_send_message(message):
+        sent.append(message)
+
+    manager.deliver_local = lambda room_id, frame: local.append(json.loads(frame))
+    manager.send_message = fake_send_message
+    return local, sent
+
+
+@pytest.mark.asyncio
+async def test_AI_토큰은_로컬로만_보내고_최종_답변_하나만_전송():
+    """partial 프레임은 deliver_local로만 나가고, Kafka(→ Mongo)로는 stream_id가 같은 완성 답변 하나만 보내는지 테스트"""
+    manager = make_manager()
+    local, sent = record_ai_frames(manager)
+    room = SimpleNamespace(id=1, title="방")
+
+    answer = await manager.stream_ai_answer(room, make_stream(["안녕", None, "하세요"]))
+
+    assert answer == "안녕하세요"
+    assert [frame["content"] for frame in local] == ["안녕", "하세요"]
+    assert all(frame["event"] == "partial" for frame in local)
+    assert len(sent) == 1
+    assert sent[0]["content"] == "안녕하세요" and sent[0]["stream_id"] == local[0]["stream_id"]
+
+
+@pytest.mark.asyncio
+async def test_스트림이_중간에_실패해도_최종_메시지는_하나():
+    """토큰 일부를 보낸 뒤 스트림이 끊기면 같은 stream_id의 안내 메시지 하나만 보내고, 잘린 답변은 컨텍스트에 넣지 않는지 테스트"""
+    manager = make_manager()
+    local, sent = record_ai_frames(manager)
+    appended = []
+
+    async def build_messages(room_id, content):
+        return [{"role": "user", "content": content}]
+
+    async def append_exchange(room_id, question, answer):
+        appended.append(answer)
+
+    async def create(**kwargs):
+        return make_stream(["안녕"], error=ConnectionError("stream reset"))
+
+    manager.ai_context = SimpleNamespace(build_messages=build_messages, append_exchange=append_exchange)
+    manager.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    manager.ai_stream_mode = "direct"
+
+    await manager.ai_chat(SimpleNamespace(id=1, title="방"), "질문")
+
+    assert [frame["content"] for frame in local] == ["안녕"]
+    assert len(sent) == 1
+    assert sent[0]["stream_id"] == local[0]["stream_id"]
+    assert sent[0]["content"] == "죄송합니다. 현재 AI 응답을 생성할 수 없습니다."
+    assert appended == [""]
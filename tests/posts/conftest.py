@@ -0,0 +1,147 @@
+from contextlib import asynccontextmanager
+
+import pytest
+
+from src.app.v1.post.repository import post as post_repository
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.commands.append((name, args, kwargs))
+
+    async def execute(self):
+        return [await getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+
+class FakeRedis:
+    """게시글 캐시와 좋아요 카운터가 쓰는 명령만 흉내내는 인메모리 Redis"""
+
+    def __init__(self):
+        self.values: dict = {}
+        self.gets = 0
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def get(self, key):
+        self.gets += 1
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+    async def incr(self, key):
+        self.values[key] = str(int(self.values.get(key, 0)) + 1)
+
+    async def hincrby(self, key, field, amount):
+        hash_ = self.values.setdefault(key, {})
+        hash_[field] = str(int(hash_.get(field, 0)) + amount)
+
+    async def hmget(self, key, fields):
+        return [self.values.get(key, {}).get(field) for field in fields]
+
+    async def hgetall(self, key):
+        return dict(self.values.get(key, {}))
+
+    async def sadd(self, key, member):
+        self.values.setdefault(key, set()).add(member)
+
+    async def smembers(self, key):
+        return self.values.get(key, set())
+
+    async def exists(self, key):
+        return int(key in self.values)
+
+    async def rename(self, key, new_key):
+        self.values[new_key] = self.values.pop(key)
+
+    async def expire(self, key, ttl):
+        pass
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+    async def eval(self, script, numkeys, key, token):
+        # 잠금 해제 스크립트: 토큰이 같을 때만 삭제
+        if self.values.get(key) == token:
+            del self.values[key]
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+    def scalar(self):
+        return self.rows[0]
+
+    def scalars(self):
+        return self
+
+    def unique(self):
+        return self
+
+    def first(self):
+        return self.rows[0] if self.rows else None
+
+    def scalar_one_or_none(self):
+        return self.rows[0] if self.rows else None
+
+
+class FakeSession:
+    """execute 호출 순서대로 미리 정한 결과 행을 돌려주는 세션"""
+
+    def __init__(self, results: list[list]):
+        self.results = results
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return FakeResult(self.results[len(self.statements) - 1])
+
+    async def flush(self):
+        pass
+
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        pass
+
+
+@pytest.fixture
+def fake_redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def use_session(monkeypatch):
+    """결과 행 목록으로 FakeSession을 만들고 모듈의 get_db_session이 그 세션을 쓰도록 교체"""
+
+    def use(results: list[list], module=post_repository) -> FakeSession:
+        session = FakeSession(results)
+
+        @asynccontextmanager
+        async def fake_get_db_session():
+            yield session
+
+        monkeypatch.setattr(module, "get_db_session", fake_get_db_session)
+        return session
+
+    return use
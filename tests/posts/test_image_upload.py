@@ -0,0 +1,123 @@
+import io
+import threading
+import time
+
+import pytest
+from fastapi import HTTPException, UploadFile
+from PIL import Image as PILImage
+
+from src.app.common.utils import image as image_utils
+from src.app.common.utils.image import NCPStorageService, create_derivatives
+
+
+class FakeS3Client:
+    def __init__(self, fail_filenames: set[str] | None = None):
+        self.fail_filenames = fail_filenames or set()
+        self.uploaded: list[str] = []
+        self.deleted: list[str] = []
+        self.max_concurrency = 0
+        self._active = 0
+        self._lock = threading.Lock()
+
+    def upload_fileobj(self, fileobj, bucket, key, ExtraArgs=None):
+        with self._lock:
+            self._active += 1
+            self.max_concurrency = max(self.max_concurrency, self._active)
+        time.sleep(0.05)
+        with self._lock:
+            self._active -= 1
+        if fileobj.read() in self.fail_filenames:
+            raise ConnectionError("storage unavailable")
+        self.uploaded.append(key)
+
+    def delete_object(self, Bucket, Key):
+        self.deleted.append(Key)
+
+
+def make_service(client: FakeS3Client) -> NCPStorageService:
+    service = NCPStorageService(access_key="test", secret_key="test")
+    service.s3_client = client
+    return service
+
+
+def make_file(name: str, body: bytes = b"image") -> UploadFile:
+    return UploadFile(file=io.BytesIO(body), filename=name)
+
+
+def make_jpeg(width: int, height: int, orientation: int | None = None) -> bytes:
+    exif = PILImage.Exif()
+    exif[0x010F] = "TestCamera"  # Make
+    if orientation:
+        exif[0x0112] = orientation  # Orientation
+    buffer = io.BytesIO()
+    PILImage.new("RGB", (width, height), "red").save(buffer, format="JPEG", exif=exif.tobytes())
+    return buffer.getvalue()
+
+
+def test_채팅용_썸네일만_생성():
+    """kinds로 썸네일만 요청하면 큰 WebP 변환본은 만들지 않고, 파일 객체를 처음부터 읽는지 테스트"""
+    buffer = io.BytesIO(make_jpeg(800, 400))
+    buffer.seek(0, io.SEEK_END)
+
+    derivatives = create_derivatives(buffer, kinds=("thumbnail",))
+
+    assert list(derivatives) == ["thumbnail"]
+
+
+@pytest.mark.asyncio
+async def test_이미지_동시_업로드():
+    """여러 이미지가 동시에 업로드되고 입력 순서대로 결과가 반환되는지 테스트"""
+    client = FakeS3Client()
+    service = make_service(client)
+
+    stored = await service.upload_post_images([make_file("a.jpg"), None, make_file("c.png")])
+
+    assert stored[0].image_path.endswith(".jpg") and stored[1] is None and stored[2].image_path.endswith(".png")
+    assert client.max_concurrency == 2
+
+
+@pytest.mark.asyncio
+async def test_업로드_실패시_실패_목록_보고_및_정리():
+    """하나라도 실패하면 실패 정보를 담아 예외를 던지고 성공한 파일은 삭제하는지 테스트"""
+    client = FakeS3Client(fail_filenames={b"broken"})
+    service = make_service(client)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.upload_post_images([make_file("a.jpg"), make_file("b.jpg", b"broken"), make_file("c.bmp")])
+
+    failed = exc_info.value.detail["failed"]
+    assert [item["image"] for item in failed] == ["image2", "image3"]
+    assert exc_info.value.status_code == 502
+    assert client.deleted == client.uploaded
+
+
+def test_파생_이미지_생성_및_EXIF_제거(monkeypatch):
+    """썸네일/WebP가 긴 변 기준으로 축소되고, 회전 정보는 반영된 뒤 EXIF가 제거되는지 테스트"""
+    monkeypatch.setattr(image_utils, "THUMBNAIL_SIZE", 100)
+    monkeypatch.setattr(image_utils, "WEBP_MAX_SIZE", 300)
+
+    # Orientation 6: 90도 회전 -> 세로 이미지로 보여야 함
+    derivatives = create_derivatives(make_jpeg(800, 400, orientation=6))
+
+    with PILImage.open(io.BytesIO(derivatives["thumbnail"])) as thumbnail:
+        assert thumbnail.format == "WEBP"
+        assert thumbnail.size == (50, 100)
+        assert not thumbnail.getexif()
+    with PILImage.open(io.BytesIO(derivatives["webp"])) as webp:
+        assert webp.size == (150, 300)
+
+
+@pytest.mark.asyncio
+async def test_게시글_이미지_업로드시_파생_이미지_함께_저장():
+    """원본 옆에 썸네일/WebP가 업로드되고 URL이 함께 반환되는지 테스트"""
+    client = FakeS3Client()
+    service = make_service(client)
+
+    stored = await service.upload_post_images([make_file("a.jpg", make_jpeg(64, 64)), None])
+
+    assert stored[1] is None
+    original_key = stored[0].image_path.rsplit("/", 2)[-2:]
+    stem = "/".join(original_key).removesuffix(".jpg")
+    assert sorted(client.uploaded) == sorted([f"{stem}.jpg", f"{stem}_thumbnail.webp", f"{stem}_webp.webp"])
+    assert stored[0].thumbnail_path.endswith("_thumbnail.webp")
+    assert stored[0].webp_path.endswith("_webp.webp")
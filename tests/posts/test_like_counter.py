@@ -0,0 +1,142 @@
+import pytest
+
+from src.app.common.utils import like_counter as like_counter_module
+from src.app.common.utils.like_counter import (
+    LIKE_DELTA_KEY,
+    LIKE_FLUSH_BATCH_KEY,
+    LIKE_FLUSH_LOCK_KEY,
+    LIKE_FLUSHING_KEY,
+    LikeCounter,
+)
+from src.app.v1.chat.entity.room import Room  # noqa: F401 (매퍼 설정용)
+from src.app.v1.post.repository import post as post_repository
+from src.app.v1.post.repository.post import PostRepository
+from src.app.v1.user.entity.organization import Organization  # noqa: F401 (매퍼 설정용)
+
+
+class BrokenRedis:
+    async def hincrby(self, *args):
+        raise ConnectionError("redis down")
+
+
+@pytest.fixture
+def counter(monkeypatch, fake_redis):
+    counter = LikeCounter()
+    counter._redis = fake_redis
+    applied, invalidated = [], []
+
+    async def fake_apply_deltas(deltas, batch_id=None):
+        applied.append(deltas)
+        counter.batch_ids.append(batch_id)
+
+    async def fake_invalidate_post(post_id):
+        invalidated.append(post_id)
+
+    monkeypatch.setattr(counter, "_apply_deltas", fake_apply_deltas)
+    monkeypatch.setattr(like_counter_module.post_cache, "invalidate_post", fake_invalidate_post)
+    counter.applied, counter.invalidated, counter.batch_ids = applied, invalidated, []
+    return counter
+
+
+@pytest.mark.asyncio
+async def test_조회시_반영_전_증감을_더함(counter):
+    """DB에 반영되지 않은 증감(대기 중 + flush 중)을 응답의 like_count에 더하는지 테스트"""
+    await counter.add("a", 1)
+    await counter.add("a", 1)
+    await counter.add("b", -1)
+    counter._redis.values[LIKE_FLUSHING_KEY] = {"a": "3"}
+
+    posts = await counter.apply([{"post_id": "a", "like_count": 10}, {"post_id": "b", "like_count": 0}, {"post_id": "c", "like_count": 4}])
+
+    assert [post["like_count"] for post in posts] == [15, 0, 4]
+
+
+@pytest.mark.asyncio
+async def test_flush는_모인_증감을_한번에_반영(counter):
+    """flush 시 게시글별 증감을 합산해 한 번에 반영하고, 캐시를 무효화한 뒤 비우는지 테스트"""
+    for _ in range(100):
+        await counter.add("a", 1)
+    await counter.add("b", 1)
+    await counter.add("b", -1)
+
+    await counter.flush()
+    await counter.flush()
+
+    assert counter.applied == [{"a": 100}]
+    assert counter.invalidated == ["a"]
+    assert LIKE_DELTA_KEY not in counter._redis.values and LIKE_FLUSHING_KEY not in counter._redis.values
+
+
+@pytest.mark.asyncio
+async def test_정리_전에_중단된_flush는_같은_배치로_재시도(counter, monkeypatch):
+    """DB 반영 후 Redis 정리 전에 중단되면, 다음 flush가 같은 배치 id로 재시도해 중복 반영을 막을 수 있는지 테스트"""
+    await counter.add("a", 1)
+    original_delete = counter._redis.delete
+
+    async def broken_delete(*keys):
+        if LIKE_FLUSHING_KEY in keys:
+            raise ConnectionError("redis down")
+        await original_delete(*keys)
+
+    monkeypatch.setattr(counter._redis, "delete", broken_delete)
+    await counter.flush()
+    monkeypatch.setattr(counter._redis, "delete", original_delete)
+    await counter.flush()
+
+    assert counter.applied == [{"a": 1}, {"a": 1}]
+    assert counter.batch_ids[0] is not None and counter.batch_ids[0] == counter.batch_ids[1]
+    assert LIKE_FLUSH_BATCH_KEY not in counter._redis.values
+
+
+@pytest.mark.asyncio
+async def test_다른_인스턴스의_flush_잠금은_해제하지_않음(counter, monkeypatch):
+    """flush가 잠금 TTL보다 오래 걸려 다른 인스턴스가 잠금을 가져가면, 그 잠금을 지우지 않는지 테스트"""
+    await counter.add("a", 1)
+
+    async def slow_apply_deltas(deltas, batch_id=None):
+        counter._redis.values[LIKE_FLUSH_LOCK_KEY] = "other-instance"
+
+    monkeypatch.setattr(counter, "_apply_deltas", slow_apply_deltas)
+    await counter.flush()
+
+    assert counter._redis.values[LIKE_FLUSH_LOCK_KEY] == "other-instance"
+
+
+@pytest.mark.asyncio
+async def test_Redis_장애시_DB에_바로_반영(counter):
+    counter._redis = BrokenRedis()
+
+    await counter.add("a", 1)
+
+    assert counter.applied == [{"a": 1}]
+
+
+@pytest.mark.asyncio
+async def test_중복_좋아요는_카운트하지_않음(monkeypatch, use_session):
+    """이미 좋아요한 게시글에 다시 좋아요하면 에러 없이 성공하고 카운터는 증가하지 않는지 테스트"""
+    added = []
+
+    async def fake_add(post_id, delta):
+        added.append((post_id, delta))
+
+    monkeypatch.setattr(post_repository.like_counter, "add", fake_add)
+
+    for inserted_id in (1, None):
+        session = use_session([[10], [inserted_id]])
+        response = await PostRepository.like_post("7", "post-a")
+
+        assert response == {"post_id": "post-a", "user_id": 7, "liked": True}
+        assert "ON CONFLICT" in str(session.statements[1]).upper()
+
+    assert added == [("post-a", 1)]
+
+
+@pytest.mark.asyncio
+async def test_이미_반영한_배치는_건너뜀(use_session):
+    """배치 id 기록이 이미 있으면 좋아요 수를 다시 더하지 않는지 테스트"""
+    for recorded, expected_statements in (("batch-1", 4), (None, 1)):
+        session = use_session([[recorded], [], [], []], module=like_counter_module)
+        await LikeCounter._apply_deltas({"a": 3}, "batch-1")
+
+        assert len(session.statements) == expected_statements
+        assert "ON CONFLICT" in str(session.statements[0]).upper()
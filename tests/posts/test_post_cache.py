@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+
+from src.app.common.utils import post_cache as post_cache_module
+from src.app.common.utils.post_cache import LocalLRUCache, PostCache
+
+
+@pytest.fixture
+def cache(fake_redis):
+    cache = PostCache()
+    cache._redis = fake_redis
+    return cache
+
+
+def make_loader(post_ids: list[str]):
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"pagination": {"next": 2, "previous": None}, "posts": [{"post_id": post_id} for post_id in post_ids]}
+
+    return loader, calls
+
+
+@pytest.mark.asyncio
+async def test_피드_페이지_캐시와_게시글_단위_무효화(cache):
+    """피드 페이지를 캐시하고, 포함된 게시글이 바뀌면 해당 페이지만 무효화되는지 테스트"""
+    first_loader, first_calls = make_loader(["a", "b"])
+    second_loader, second_calls = make_loader(["c"])
+
+    await cache.get_feed_page(None, 1, None, first_loader)
+    await cache.get_feed_page(None, 2, None, second_loader)
+    await cache.get_feed_page(None, 1, None, first_loader)
+    assert len(first_calls) == 1
+
+    # 좋아요/댓글 수 변경
+    await cache.invalidate_post("a")
+    await cache.get_feed_page(None, 1, None, first_loader)
+    await cache.get_feed_page(None, 2, None, second_loader)
+
+    assert (len(first_calls), len(second_calls)) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_게시글_생성은_전체와_작성자_피드를_무효화(cache):
+    """게시글 생성/삭제 시 세대가 올라가 전체 피드와 작성자 피드 캐시가 무효화되는지 테스트"""
+    all_loader, all_calls = make_loader(["a"])
+    author_loader, author_calls = make_loader(["a"])
+    other_loader, other_calls = make_loader(["b"])
+
+    for _ in range(2):
+        await cache.get_feed_page(None, 1, None, all_loader)
+        await cache.get_feed_page(7, 1, None, author_loader)
+        await cache.get_feed_page(8, 1, None, other_loader)
+        await cache.invalidate_feed(7)
+
+    assert (len(all_calls), len(author_calls), len(other_calls)) == (2, 2, 1)
+
+
+@pytest.mark.asyncio
+async def test_만료_직후_동시_요청은_한번만_조회(cache):
+    """캐시가 비어 있을 때 동시에 들어온 요청 중 하나만 DB를 조회하는지 테스트"""
+    loader, calls = make_loader(["a"])
+
+    results = await asyncio.gather(*[cache.get_feed_page(None, 1, None, loader) for _ in range(5)])
+
+    assert len(calls) == 1
+    assert all(result == results[0] for result in results)
+
+
+def make_post_loader(contents: list[str]):
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        return {"post_id": "a", "like_count": 0, "content": contents[len(calls) - 1]}
+
+    return loader, calls
+
+
+@pytest.mark.asyncio
+async def test_게시글_상세는_워커_캐시에서_먼저_응답(cache, monkeypatch):
+    """버전 확인 주기 안의 반복 조회는 Redis도 거치지 않고, 주기가 지나면 버전만 확인하는지 테스트"""
+    loader, calls = make_post_loader(["원본"])
+
+    first = await cache.get_post("a", loader)
+    first["like_count"] = 100  # 호출자가 응답을 수정해도 캐시에는 영향 없음
+    gets = cache._redis.gets
+    second = await cache.get_post("a", loader)
+
+    assert len(calls) == 1
+    assert cache._redis.gets == gets
+    assert second["like_count"] == 0
+
+    monkeypatch.setattr(post_cache_module, "POST_VERSION_CHECK_INTERVAL", 0)
+    await cache.get_post("a", loader)
+
+    assert len(calls) == 1
+    assert cache._redis.gets == gets + 1  # 버전 키만 조회
+
+
+@pytest.mark.asyncio
+async def test_게시글_변경은_버전을_올려_모든_워커의_캐시를_무효화(cache, monkeypatch):
+    """다른 워커에서 수정/카운터 변경이 일어나면 버전이 올라가 이 워커의 캐시도 다시 조회되는지 테스트"""
+    monkeypatch.setattr(post_cache_module, "POST_VERSION_CHECK_INTERVAL", 0)
+    other_worker = PostCache()
+    other_worker._redis = cache._redis
+    loader, calls = make_post_loader(["원본", "수정본"])
+
+    await cache.get_post("a", loader)
+    await other_worker.invalidate_post("a")
+    post = await cache.get_post("a", loader)
+
+    assert len(calls) == 2
+    assert post["content"] == "수정본"
+
+
+def test_워커_캐시는_LRU와_TTL로_제거(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(post_cache_module.time, "monotonic", lambda: now[0])
+    local = LocalLRUCache(max_size=2, ttl=10)
+
+    local.set("a", 1)
+    local.set("b", 2)
+    local.get("a")
+    local.set("c", 3)  # 가장 오래 안 쓴 b 제거
+
+    assert (local.get("a"), local.get("b"), local.get("c")) == (1, None, 3)
+
+    now[0] = 10
+    assert local.get("a") is None
@@ -0,0 +1,160 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from src.app.common.utils.cursor import encode_cursor
+from src.app.v1.chat.entity.room import Room  # noqa: F401 (매퍼 설정용)
+from src.app.v1.post.repository import post as post_repository
+from src.app.v1.post.repository.post import (
+    PostRepository,
+    decode_post_cursor,
+    decode_search_cursor,
+    encode_post_cursor,
+)
+from src.app.v1.user.entity.organization import Organization  # noqa: F401 (매퍼 설정용)
+
+
+def make_card(index: int, **fields):
+    card = dict(
+        post_id=index,
+        external_id=f"post-{index}",
+        author_id=100 + index,
+        content="내용",
+        like_count=0,
+        comment_count=0,
+        is_with_teacher=False,
+        created_at=datetime(2024, 12, 5),
+        nickname=f"학생{index}",
+        profile_image=None,
+        career_aspiration="개발자",
+        interest="AI",
+        image1=None,
+        image2=None,
+        image3=None,
+        teacher_user_id=None,
+        teacher_nickname=None,
+        teacher_profile_image=None,
+    )
+    card.update(fields)
+    return SimpleNamespace(**card)
+
+
+@pytest.mark.asyncio
+async def test_피드는_카드_테이블만_조회(use_session):
+    """피드 페이지를 조인 없이 post_cards 한 테이블에서 조회하는지 테스트 (count + 카드)"""
+    cards = [make_card(index) for index in range(1, 11)]
+    cards[0] = make_card(1, image1="a.webp", image2="b.webp")
+    cards[1] = make_card(2, is_with_teacher=True, teacher_user_id=900, teacher_nickname="선생님", teacher_profile_image="teacher.png")
+    session = use_session([[len(cards)], cards])
+
+    response = await PostRepository.get_posts(page=1)
+
+    assert len(session.statements) == 2
+    assert " join " not in str(session.statements[1]).lower()
+    posts = response["posts"]
+    assert len(posts) == 10
+    assert (posts[0]["image1"], posts[0]["image2"], posts[0]["image3"]) == ("a.webp", "b.webp", None)
+    assert posts[0]["user_id"] == 101 and posts[0]["post_id"] == "post-1"
+    assert posts[1]["teacher"] == {"nickname": "선생님", "user_id": 900, "profile_image": "teacher.png"}
+    assert "teacher" not in posts[0]
+
+
+@pytest.mark.asyncio
+async def test_피드_카드_갱신은_한_번의_upsert(use_session):
+    """카드 갱신이 게시글별 상위 3개 이미지와 담당 선생님을 합쳐 한 번의 INSERT ... ON CONFLICT로 처리되는지 테스트"""
+    session = use_session([["post-1"]])
+
+    post_ids = await PostRepository.refresh_post_cards(session, post_repository.Post.id == 1)
+
+    assert post_ids == ["post-1"]
+    assert len(session.statements) == 1
+    sql = str(session.statements[0]).lower()
+    assert sql.startswith("insert into post_cards")
+    assert "row_number() over (partition by post_images.post_id" in sql
+    assert "left outer join lateral" in sql
+    assert "on conflict (post_id) do update" in sql
+
+
+@pytest.mark.asyncio
+async def test_커서_피드는_count_없이_다음_커서_반환(use_session):
+    """커서 모드에서는 전체 개수를 세지 않고, 한 개 더 읽어 다음 커서를 만드는지 테스트"""
+    cards = [make_card(index) for index in range(1, 12)]
+    session = use_session([cards])
+
+    response = await PostRepository.get_posts(page=1, cursor="")
+
+    # 카드 조회 한 번 (count 없음)
+    assert len(session.statements) == 1
+    assert "count(" not in str(session.statements[0]).lower()
+    assert len(response["posts"]) == 10
+    assert decode_post_cursor(response["pagination"]["next_cursor"]) == (cards[9].created_at, cards[9].post_id)
+
+
+@pytest.mark.asyncio
+async def test_커서_피드는_키_범위로_조회(use_session):
+    """커서 이후 페이지를 OFFSET 없이 (created_at, post_id) 범위 조건으로 조회하고, 마지막 페이지는 커서가 없는지 테스트"""
+    session = use_session([[make_card(1)]])
+
+    response = await PostRepository.get_posts(page=1, cursor=encode_post_cursor(make_card(2)))
+
+    sql = str(session.statements[0]).lower()
+    assert "(post_cards.created_at, post_cards.post_id) <" in sql
+    assert "offset" not in sql
+    assert response["pagination"]["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_검색은_유사도_순_커서_페이지네이션(use_session):
+    """본문 검색이 trigram 연산자로 인덱스를 타고, 유사도 순으로 정렬해 (유사도, post_id) 커서를 만드는지 테스트"""
+    rows = [(make_card(index), 1 - index / 100) for index in range(1, 12)]
+    session = use_session([rows, []])
+
+    response = await PostRepository.search_posts("수학 숙제")
+
+    sql = str(session.statements[0]).lower()
+    assert "post_cards.content %> " in sql
+    assert "order by word_similarity(" in sql
+    assert len(response["posts"]) == 10
+    assert decode_search_cursor(response["pagination"]["next_cursor"]) == (rows[9][1], rows[9][0].post_id)
+
+    await PostRepository.search_posts("수학 숙제", cursor=response["pagination"]["next_cursor"])
+
+    assert "(word_similarity(" in str(session.statements[1]).lower()
+
+
+@pytest.mark.asyncio
+async def test_게시글_상세의_선생님은_피드_카드와_같은_조인(use_session):
+    """상세 조회도 study_groups.teacher_id를 teachers.id로 조인해 피드 카드와 같은 담당 선생님을 보여주는지 테스트"""
+    post = SimpleNamespace(
+        id=1, external_id="post-1", is_with_teacher=True, like_count=0, comment_count=0, content="내용", created_at=datetime(2024, 12, 5)
+    )
+    user = SimpleNamespace(id=101, profile_image=None, tag=SimpleNamespace(nickname="학생1"))
+    student = SimpleNamespace(id=1, career_aspiration="개발자", interest="AI")
+    teacher = SimpleNamespace(id=900, profile_image="teacher.png", tag=SimpleNamespace(nickname="선생님"))
+    session = use_session([[(post, user, student)], [], [teacher]])
+
+    response = await PostRepository.get_post("post-1")
+
+    sql = str(session.statements[2]).lower()
+    assert "join study_groups on study_groups.teacher_id = teachers.id" in sql
+    assert "join teachers on teachers.user_id = users.id" in sql
+    assert response["teacher"] == {"nickname": "선생님", "profile_image": "teacher.png", "user_id": 900}
+
+
+def test_잘못된_피드_커서는_400():
+    with pytest.raises(HTTPException) as exc_info:
+        decode_post_cursor(encode_cursor("어제", "첫번째"))
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_여러_게시글_좋아요_여부를_한번에_조회(use_session):
+    """게시글 목록의 좋아요 여부를 쿼리 한 번으로 조회하고, 요청 순서대로 반환하는지 테스트"""
+    session = use_session([["post-3", "post-1"]])
+
+    response = await PostRepository.get_like_posts("7", ["post-1", "post-2", "post-3"])
+
+    assert len(session.statements) == 1
+    assert response == {"user_id": 7, "likes": {"post-1": True, "post-2": False, "post-3": True}}
@@ -0,0 +1,132 @@
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException
+
+from src.app.common.middlewares.db_session import DBSessionMiddleware
+from src.config.database import postgresql
+from src.config.database.postgresql import get_db_session, run_after_commit
+
+
+class FakeConnection:
+    def __init__(self, engine: "FakeEngine"):
+        self.engine = engine
+
+    async def begin(self):
+        pass
+
+    async def commit(self):
+        self.engine.commits += 1
+
+    async def rollback(self):
+        self.engine.rollbacks += 1
+
+    async def close(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self, bind):
+        self.bind = bind
+
+    async def close(self):
+        pass
+
+
+class FakeEngine:
+    def __init__(self):
+        self.checkouts = 0
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def connect(self):
+        self.checkouts += 1
+        return FakeConnection(self)
+
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(DBSessionMiddleware)
+
+    @app.get("/ok")
+    async def ok():
+        # 리포지토리 여러 개가 세션을 요청하는 상황
+        async with get_db_session() as first:
+            pass
+        async with get_db_session() as second:
+            pass
+        return {"same": first is second}
+
+    @app.get("/error")
+    async def error():
+        async with get_db_session():
+            pass
+        raise HTTPException(status_code=500, detail="boom")
+
+    @app.get("/no-db")
+    async def no_db():
+        return {}
+
+    return app
+
+
+@pytest.fixture
+def fake_engine(monkeypatch):
+    engine = FakeEngine()
+    monkeypatch.setattr(postgresql, "engine", engine)
+    monkeypatch.setattr(postgresql, "RequestSessionLocal", FakeSession)
+    return engine
+
+
+async def request(path: str) -> httpx.Response:
+    transport = httpx.ASGITransport(app=make_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path)
+
+
+@pytest.mark.asyncio
+async def test_요청당_커넥션_한번_커밋_한번(fake_engine):
+    """한 요청 안의 세션 요청은 같은 세션을 공유하고, 응답 전에 한 번만 커밋하는지 테스트"""
+    response = await request("/ok")
+
+    assert response.json() == {"same": True}
+    assert (fake_engine.checkouts, fake_engine.commits, fake_engine.rollbacks) == (1, 1, 0)
+
+
+@pytest.mark.asyncio
+async def test_5xx_응답은_롤백_DB_미사용시_커넥션_없음(fake_engine):
+    """서버 오류 응답이면 롤백하고, DB를 쓰지 않는 요청은 커넥션을 가져오지 않는지 테스트"""
+    await request("/error")
+    await request("/no-db")
+
+    assert (fake_engine.checkouts, fake_engine.commits, fake_engine.rollbacks) == (1, 0, 1)
+
+
+@pytest.mark.asyncio
+async def test_커밋_이후_콜백_실행(fake_engine):
+    """요청 트랜잭션이 commit된 뒤에만 after-commit 콜백이 실행되는지 테스트"""
+    events = []
+
+    async def callback():
+        events.append(fake_engine.commits)
+
+    app = make_app()
+
+    @app.get("/callback")
+    async def with_callback():
+        async with get_db_session():
+            await run_after_commit(callback)
+        assert events == []
+        return {}
+
+    @app.get("/callback-error")
+    async def with_callback_error():
+        async with get_db_session():
+            await run_after_commit(callback)
+        raise HTTPException(status_code=500, detail="boom")
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        await client.get("/callback")
+        await client.get("/callback-error")
+
+    assert events == [1]
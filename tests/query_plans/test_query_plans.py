@@ -0,0 +1,273 @@
+"""
+리포지토리의 주요 쿼리가 인덱스를 타는지 실행계획(EXPLAIN)으로 검사합니다.
+
+QUERY_PLAN_DATABASE_URL의 데이터베이스를 비우고 마이그레이션(head)과 시드 데이터를 적용한 뒤,
+실제 리포지토리 메서드가 실행하는 쿼리를 모두 EXPLAIN 합니다.
+enable_seqscan을 끄고 계획을 세우므로 사용할 수 있는 인덱스가 없을 때만 Seq Scan이 나오고, 이 경우 실패합니다.
+(전용 테스트 DB를 사용하세요. 환경 변수가 없으면 건너뜁니다.)
+"""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+from contextlib import asynccontextmanager
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from dotenv import load_dotenv
+from sqlalchemy import and_, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.app.common.models.tag import Tag
+from src.app.v1.chat.entity.participant import Participant
+from src.app.v1.chat.entity.room import Room
+from src.app.v1.chat.entity.room_summary import RoomSummary
+from src.app.v1.chat.repository import room_repository
+from src.app.v1.chat.repository.room_repository import RoomRepository
+from src.app.v1.chat.schema.room_response import RoomHelpResponse
+from src.app.v1.comment.repository.comment_repo import CommentRepository
+from src.app.v1.post.repository import post as post_repository
+from src.app.v1.post.repository.post import PostRepository
+from src.app.v1.user.entity.user import User
+
+load_dotenv()
+
+QUERY_PLAN_DATABASE_URL = os.environ.get("QUERY_PLAN_DATABASE_URL")
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+pytestmark = pytest.mark.skipif(QUERY_PLAN_DATABASE_URL is None, reason="QUERY_PLAN_DATABASE_URL environment variable is not set")
+
+SEED_SQL = [
+    # 1~1500: 학생, 1501~2000: 선생님
+    """
+    INSERT INTO users (email, password, first_login, role, is_active, is_privacy_accepted)
+    SELECT 'user' || g || '@example.com', 'hashed', false,
+           (CASE WHEN g <= 1500 THEN 'STUDENT' ELSE 'TEACHER' END)::user_role_enum, true, true
+    FROM generate_series(1, 2000) g
+    """,
+    "INSERT INTO students (school, grade, user_id) SELECT '학교', 1, g FROM generate_series(1, 1500) g",
+    "INSERT INTO teachers (user_id) SELECT g FROM generate_series(1501, 2000) g",
+    "INSERT INTO tags (nickname, user_id) SELECT 'n' || g, g FROM generate_series(1, 2000) g",
+    "INSERT INTO study_groups (student_id, teacher_id) SELECT g, (g % 500) + 1 FROM generate_series(1, 1500) g",
+    """
+    INSERT INTO posts (external_id, author_id, content, visibility, like_count, comment_count, is_with_teacher, created_at)
+    SELECT 'post-' || lpad(g::text, 8, '0'), (g % 1500) + 1, '내용', 'PUBLIC'::visibility, 0, 0, g % 2 = 0,
+           now() - (g || ' minutes')::interval
+    FROM generate_series(1, 20000) g
+    """,
+    "INSERT INTO images (image_path) SELECT 'image' || g || '.jpg' FROM generate_series(1, 20000) g",
+    "INSERT INTO post_images (image_id, post_id) SELECT g, g FROM generate_series(1, 20000) g",
+    "INSERT INTO post_likes (user_id, post_id) SELECT (g % 1500) + 1, g FROM generate_series(1, 20000) g",
+    "INSERT INTO comments (post_id, author_id, content, recomment_count) SELECT (g % 20000) + 1, (g % 1500) + 1, '댓글', 0 FROM generate_series(1, 40000) g",
+    "INSERT INTO comment_tags (comment_id, tag_id) SELECT g, (g % 2000) + 1 FROM generate_series(1, 40000, 4) g",
+    "INSERT INTO rooms (title, help_checked) SELECT '방', g % 3 = 0 FROM generate_series(1, 3000) g",
+    "INSERT INTO participants (id, student_id, teacher_id, room_id) SELECT g, (g % 1500) + 1, 1501 + (g % 500), g FROM generate_series(1, 3000) g",
+    """
+    INSERT INTO post_cards (post_id, external_id, author_id, content, like_count, comment_count, is_with_teacher, created_at, nickname, image1)
+    SELECT p.id, p.external_id, p.author_id, p.content, p.like_count, p.comment_count, p.is_with_teacher, p.created_at, 'n' || p.author_id, 'image' || p.id || '.jpg'
+    FROM posts p
+    """,
+    "ANALYZE",
+]
+
+
+async def reset_and_seed():
+    engine = create_async_engine(QUERY_PLAN_DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql("DROP SCHEMA public CASCADE")
+        await conn.exec_driver_sql("CREATE SCHEMA public")
+    await engine.dispose()
+
+    # 엔티티가 아닌 마이그레이션 기준으로 스키마/인덱스를 만듦
+    subprocess.run(
+        [sys.executable, "-m", "alembic", "upgrade", "head"],
+        cwd=PROJECT_ROOT,
+        env={**os.environ, "PG_DATABASE_URL": QUERY_PLAN_DATABASE_URL},
+        check=True,
+    )
+
+    engine = create_async_engine(QUERY_PLAN_DATABASE_URL)
+    async with engine.begin() as conn:
+        for sql in SEED_SQL:
+            await conn.exec_driver_sql(sql)
+    await engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def seeded_database():
+    asyncio.run(reset_and_seed())
+
+
+class ExplainingSession:
+    """실행하는 모든 쿼리의 실행계획을 먼저 수집하는 세션 래퍼"""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+        self.plans: list[tuple[str, dict]] = []
+
+    async def execute(self, statement, *args, **kwargs):
+        sql = str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+        connection = await self._session.connection()
+        result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+        plan = result.scalar()
+        self.plans.append((sql, json.loads(plan) if isinstance(plan, str) else plan))
+        return await self._session.execute(statement, *args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._session, name)
+
+
+def find_seq_scans(node: dict) -> list[str]:
+    scans = [node["Relation Name"]] if node["Node Type"] == "Seq Scan" else []
+    for child in node.get("Plans", []):
+        scans += find_seq_scans(child)
+    return scans
+
+
+def assert_no_seq_scans(session: ExplainingSession):
+    assert session.plans, "실행된 쿼리가 없습니다."
+    for sql, plan in session.plans:
+        scans = find_seq_scans(plan[0]["Plan"])
+        assert not scans, f"Seq Scan on {scans}:\n{sql}"
+
+
+@pytest_asyncio.fixture
+async def session(seeded_database, monkeypatch):
+    engine = create_async_engine(QUERY_PLAN_DATABASE_URL)
+    async with engine.connect() as conn:
+        await conn.begin()
+        await conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        explaining = ExplainingSession(AsyncSession(bind=conn, expire_on_commit=False, join_transaction_mode="create_savepoint"))
+
+        @asynccontextmanager
+        async def fake_get_db_session():
+            yield explaining
+
+        async def no_op(*args, **kwargs):
+            return None
+
+        monkeypatch.setattr(post_repository, "get_db_session", fake_get_db_session)
+        monkeypatch.setattr(post_repository, "run_after_commit", no_op)
+        monkeypatch.setattr(room_repository, "get_db_session", fake_get_db_session)
+        monkeypatch.setattr(room_repository.room_header_cache, "get", no_op)
+        monkeypatch.setattr(room_repository.room_header_cache, "set", no_op)
+
+        yield explaining
+
+        await explaining.close()
+        await conn.rollback()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_게시글_조회_쿼리(session):
+    await PostRepository.get_post("post-00000100")
+    await PostRepository.get_like_posts("3", ["post-00000100", "post-00000200"])
+
+    assert_no_seq_scans(session)
+
+
+@pytest.mark.asyncio
+async def test_피드_쿼리(session):
+    first_page = await PostRepository.get_posts(page=1, cursor="")
+    await PostRepository.get_posts(page=1, cursor=first_page["pagination"]["next_cursor"])
+    await PostRepository.get_user_posts("10", page=1, cursor="")
+
+    assert_no_seq_scans(session)
+
+
+@pytest.mark.asyncio
+async def test_검색_쿼리(session):
+    first_page = await PostRepository.search_posts("내용", cursor=None)
+    await PostRepository.search_posts("내용", cursor=first_page["pagination"]["next_cursor"])
+
+    assert_no_seq_scans(session)
+
+
+@pytest.mark.asyncio
+async def test_피드_카드_갱신_쿼리(session):
+    await PostRepository.refresh_post_cards(session, post_repository.Post.id == 100)
+    await PostRepository.refresh_user_post_cards(session, 10)
+    await PostRepository.refresh_user_post_cards(session, 1501)
+
+    assert_no_seq_scans(session)
+
+
+@pytest.mark.asyncio
+async def test_좋아요_쿼리(session):
+    await PostRepository.like_post("3", "post-00000100")
+    await PostRepository.unlike_post("3", "post-00000100")
+
+    assert_no_seq_scans(session)
+
+
+@pytest.mark.asyncio
+async def test_댓글_쿼리(session):
+    repository = CommentRepository()
+
+    await repository.get_post_id_from_external_id(session, "post-00000100")
+    await repository.get_comments_by_post_id(session, 100)
+
+    assert_no_seq_scans(session)
+
+
+@pytest.mark.asyncio
+async def test_채팅방_쿼리(session):
+    await RoomRepository.get_room_header(10)
+    await RoomRepository.get_teacher_id_with_student(10)
+    await RoomRepository.get_teacher_and_students(1501)
+
+    assert_no_seq_scans(session)
+
+
+async def get_room_help_list_n_plus_1(session, latest: dict[int, RoomSummary], user_id: int) -> list[RoomHelpResponse]:
+    """일괄 조회로 바꾸기 전 방마다 참여자/닉네임을 따로 조회하던 구현 (최근 메시지는 latest에서 읽음)"""
+    rooms = await session.execute(select(Room).join(Participant).where(and_(Participant.teacher_id == user_id, Room.help_checked == True)))
+    result = []
+    for room in rooms.scalars().all():
+        participants = await session.execute(select(Participant).where(Participant.room_id == room.id))
+        participant = participants.scalar_one_or_none()
+        nickname = None
+        if participant:
+            tags = await session.execute(select(Tag).join(User).where(User.id == participant.student_id))
+            tag = tags.scalar_one_or_none()
+            if tag:
+                nickname = tag.nickname
+        message = latest.get(room.id)
+        result.append(
+            RoomHelpResponse(
+                room_id=room.id,
+                student_id=participant.student_id if participant else None,
+                student_nickname=nickname,
+                help_checked=room.help_checked,
+                recent_message=message.last_message if message else None,
+                recent_update=message.last_activity if message else None,
+            )
+        )
+    return result
+
+
+@pytest.mark.asyncio
+async def test_도움_요청_목록_일괄_조회는_기존_N_1_결과와_같음(session, monkeypatch):
+    """조인 한 번으로 바꾼 도움 요청 목록이 방마다 조회하던 기존 구현과 같은 결과를 내는지 테스트"""
+    # 최근 메시지가 있는 방과 없는 방이 섞이도록 일부 방에만 요약을 둠
+    latest = {
+        room_id: RoomSummary(room_id=room_id, last_message=f"메시지 {room_id}", last_activity=datetime(2024, 12, 5)) for room_id in range(3, 3001, 6)
+    }
+
+    async def fake_get_room_summaries(mongo, room_ids):
+        return {room_id: latest[room_id] for room_id in room_ids if room_id in latest}
+
+    monkeypatch.setattr(RoomRepository, "get_room_summaries", staticmethod(fake_get_room_summaries))
+
+    for teacher_id in (1501, 1750, 2000):
+        batched = await RoomRepository.get_room_help_list(None, teacher_id)
+        expected = await get_room_help_list_n_plus_1(session, latest, teacher_id)
+
+        assert expected
+        assert sorted(batched, key=lambda room: room.room_id) == sorted(expected, key=lambda room: room.room_id)